@@ -7,7 +7,7 @@ __description__ = "Modular Ethereum operator and registry contract event monitor
 # Main exports
 from .cli import main
 from .config import settings
-from .core import Web3Client, RegistryContract, EventProcessor
+from .core import Web3Client, AsyncWeb3Client, RegistryContract, EventProcessor
 from .notifications import NotificationManager, ConsoleNotifier, SlackNotifier
 from .monitor import EventMonitor, ReconnectionHandler
 from .data import EventFetcher, InMemoryEventStore
@@ -16,6 +16,7 @@ __all__ = [
     'main',
     'settings', 
     'Web3Client',
+    'AsyncWeb3Client',
     'RegistryContract',
     'EventProcessor',
     'NotificationManager',
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+from contextlib import aclosing
 from typing import Optional, Dict, Any, List, Union
 from ..core import Web3Client, ContractInterface, EventProcessor
 from ..notifications import NotificationManager
@@ -33,9 +34,10 @@ class HistoryCommand:
     
     def __init__(self, web3_client: Web3Client, contracts: Union[ContractInterface, List[ContractInterface]],
                  event_processor: EventProcessor, notification_manager: NotificationManager,
-                 chunk_size: int = 50000):
+                 chunk_size: int = 50000, use_get_logs: bool = True, async_web3_client=None):
         """Initialize history command"""
-        self.event_fetcher = EventFetcher(web3_client, contracts, chunk_size)
+        self.event_fetcher = EventFetcher(web3_client, contracts, chunk_size, use_get_logs=use_get_logs,
+                                          async_web3_client=async_web3_client)
         self.event_processor = event_processor
         self.notification_manager = notification_manager
         # Ensure contracts is always a list
@@ -55,12 +57,17 @@ class HistoryCommand:
             print(f"📚 Fetching historical events from block {from_block}")
             print(f"📄 Monitoring contracts: {', '.join(contract_names)}{filter_text}")
             
-            # Fetch events
-            events = await self.event_fetcher.get_historical_events_async(
+            # Walk backward from the head and stop once max_events are found
+            events = []
+            async with aclosing(self.event_fetcher.iter_historical_events(
                 from_block=from_block,
-                max_events=max_events,
-                contract_filter=contract_filter
-            )
+                contract_filter=contract_filter,
+                reverse=True,
+                max_events=max_events
+            )) as stream:
+                async for event in stream:
+                    events.append(event)
+            events.reverse()
             
             if events:
                 print(f"\n📚 HISTORICAL EVENTS ({len(events)} found)")
@@ -68,12 +75,12 @@ class HistoryCommand:
                 
                 for event in events:
                     # Format and display each event
-                    console_message = self.event_processor.format_event(event)
+                    console_message = await self.event_processor.format_event(event)
                     print(console_message)
                     
                     # Send notifications for historical events
                     try:
-                        self.notification_manager.send_notification(console_message, event)
+                        await self.notification_manager.send_notification_async(console_message, event)
                         logger.debug(f"Notification sent for historical event: {event['event']}")
                     except Exception as e:
                         logger.warning(f"Failed to send notification for historical event {event['event']}: {e}")
@@ -6,10 +6,10 @@ import sys
 from typing import Optional, List, Dict, Any
 
 from ..config import settings, NETWORK_CONFIGS, REGISTRY_CONTRACT_ABI, TAIYI_REGISTRY_COORDINATOR_ABI, TAIYI_ESCROW_ABI, TAIYI_CORE_ABI, EIGENLAYER_MIDDLEWARE_ABI, EIGENLAYER_ALLOCATION_MANAGER_ABI
-from ..core import Web3Client, ContractInterface, EventProcessor, TaiyiRegistryCoordinatorContract, TaiyiEscrowContract, TaiyiCoreContract, EigenLayerMiddlewareContract, EigenLayerAllocationManagerContract
+from ..core import Web3Client, AsyncWeb3Client, ContractInterface, EventProcessor, TransactionCache, TaiyiRegistryCoordinatorContract, TaiyiEscrowContract, TaiyiCoreContract, EigenLayerMiddlewareContract, EigenLayerAllocationManagerContract
 from ..core.contract_interface import RegistryContract
-from ..notifications import ConsoleNotifier, SlackNotifier, NotificationManager
-from ..data import EventFetcher, InMemoryEventStore, NullEventStore
+from ..notifications import ConsoleNotifier, SlackNotifier, NotificationManager, SQLiteNotificationSpool
+from ..data import EventFetcher, InMemoryEventStore, NullEventStore, SQLiteLogCache
 from ..data.redis_event_store import RedisEventStore
 from ..monitor import EventMonitor, ReconnectionHandler
 from .commands import MonitorCommand, HistoryCommand, TestCommand
@@ -68,8 +68,12 @@ class RegistryMonitorCLI:
         """Initialize CLI application"""
         self.settings = settings
         self.web3_client: Optional[Web3Client] = None
+        self.async_web3_client: Optional[AsyncWeb3Client] = None
         self.contracts: List[ContractInterface] = []
         self.event_processor: Optional[EventProcessor] = None
+        self.transaction_cache: Optional[TransactionCache] = None
+        self.log_cache: Optional[SQLiteLogCache] = None
+        self.notification_spool: Optional[SQLiteNotificationSpool] = None
         self.notification_manager: Optional[NotificationManager] = None
         self.event_monitor: Optional[EventMonitor] = None
         self.contract_registry = ContractRegistry()
@@ -213,19 +217,63 @@ class RegistryMonitorCLI:
             rpc_url = self.settings.rpc_url or network_config['default_rpc']
             self.web3_client = Web3Client(rpc_url, self.settings.network)
             
+            # Initialize async Web3 client for non-blocking RPC lookups
+            if self.settings.use_async_rpc:
+                self.async_web3_client = AsyncWeb3Client(
+                    self.settings.get_rpc_urls(network_config),
+                    self.settings.network,
+                    pool_size=self.settings.rpc_pool_size,
+                    request_timeout=self.settings.rpc_timeout,
+                    hedge_enabled=self.settings.rpc_hedge_enabled,
+                    hedge_percentile=self.settings.rpc_hedge_percentile,
+                    probe_interval=self.settings.rpc_probe_interval,
+                    batch_enabled=self.settings.rpc_batch_enabled,
+                    batch_window=self.settings.rpc_batch_window_ms / 1000,
+                    max_batch_size=self.settings.rpc_batch_size,
+                    rate_limit=self.settings.rpc_rate_limit
+                )
+            
             # Create contract instances
             self.contracts = self.contract_registry.create_contracts(self.web3_client)
             
+            # Initialize the transaction cache shared by calldata decoding and validator mapping
+            self.transaction_cache = TransactionCache(
+                max_entries=self.settings.tx_cache_size,
+                max_bytes=self.settings.tx_cache_max_mb * 1024 * 1024,
+                persist_path=self.settings.tx_cache_path
+            )
+            self.transaction_cache.load()
+            
+            # Initialize the on-disk cache of finalized historical logs
+            if self.settings.log_cache_path:
+                self.log_cache = SQLiteLogCache(self.settings.log_cache_path)
+            
             # Initialize event processor with EigenLayerMiddleware address for filtering and web3_client
             self.event_processor = EventProcessor(
                 network_config, 
                 eigenlayer_middleware_address=self.settings.eigenlayer_middleware_contract_address,
                 web3_client=self.web3_client,
-                enable_calldata_decoding=self.settings.enable_calldata_decoding
+                enable_calldata_decoding=self.settings.enable_calldata_decoding,
+                async_web3_client=self.async_web3_client,
+                transaction_cache=self.transaction_cache
             )
             
+            # Initialize the durable queue notifications are delivered from
+            if self.settings.notification_spool_path:
+                self.notification_spool = SQLiteNotificationSpool(self.settings.notification_spool_path)
+            
             # Initialize notification manager
-            self.notification_manager = NotificationManager()
+            self.notification_manager = NotificationManager(
+                timeout=self.settings.notification_timeout,
+                coalesce_window=self.settings.notification_coalesce_window,
+                digest_top_n=self.settings.notification_digest_top_n,
+                spool=self.notification_spool,
+                max_backoff=self.settings.notification_max_backoff,
+                breaker_error_rate=self.settings.notifier_breaker_error_rate,
+                latency_budget=self.settings.notifier_latency_budget,
+                breaker_cooldown=self.settings.notifier_breaker_cooldown,
+                max_retry_after=self.settings.notification_max_retry_after
+            )
             
             # Add console notifier (always available as fallback)
             console_notifier = ConsoleNotifier(verbose=True)
@@ -235,7 +283,8 @@ class RegistryMonitorCLI:
             if self.settings.slack_bot_token:
                 slack_notifier = SlackNotifier(
                     token=self.settings.slack_bot_token,
-                    channel=self.settings.slack_channel
+                    channel=self.settings.slack_channel,
+                    rate_limit=self.settings.slack_rate_limit
                 )
                 self.notification_manager.add_notifier(slack_notifier)
             
@@ -267,7 +316,19 @@ class RegistryMonitorCLI:
                 event_processor=self.event_processor,
                 notification_manager=self.notification_manager,
                 event_store=event_store,
-                redis_store=redis_store
+                redis_store=redis_store,
+                async_web3_client=self.async_web3_client,
+                use_log_tail=self.settings.use_log_tail,
+                cursor_path=self.settings.tail_cursor_path,
+                ws_url=self.settings.ws_url,
+                confirmation_depth=self.settings.confirmation_depth,
+                confirmed_only=self.settings.confirmed_only,
+                pipeline_workers=self.settings.pipeline_workers,
+                notify_workers=self.settings.notify_workers,
+                queue_size=self.settings.pipeline_queue_size,
+                backpressure=self.settings.backpressure,
+                low_priority_events=self.settings.low_priority_events,
+                event_priorities=self.settings.event_priorities
             )
             
             logger.info("All components initialized successfully")
@@ -276,6 +337,50 @@ class RegistryMonitorCLI:
             logger.error(f"Error initializing components: {e}")
             raise
     
+    def _confirmed_through(self) -> Optional[int]:
+        """Highest block at least the confirmation depth below the head, None if the head is unknown"""
+        buffer = self.event_monitor.confirmation_buffer if self.event_monitor else None
+        head = buffer.head if buffer else None
+        if head is None and self.web3_client:
+            try:
+                head = self.web3_client.get_current_block()
+            except Exception as e:
+                logger.warning(f"Could not get the head block for the transaction cache: {e}")
+                return None
+        return head - self.settings.confirmation_depth if head is not None else None
+    
+    async def _shutdown_components(self):
+        """Release resources held by initialized components"""
+        if self.event_monitor:
+            await self.event_monitor.close()
+        if self.notification_manager:
+            await self.notification_manager.close()
+        if self.transaction_cache:
+            self.transaction_cache.save(confirmed_through=self._confirmed_through())
+        if self.async_web3_client:
+            await self.async_web3_client.close()
+        if self.log_cache:
+            self.log_cache.close()
+        if self.notification_spool:
+            self.notification_spool.close()
+    
+    def _create_event_fetcher(self) -> EventFetcher:
+        """Create an event fetcher for historical backfills"""
+        return EventFetcher(
+            self.web3_client,
+            self.contracts,
+            chunk_size=self.settings.chunk_size,
+            use_get_logs=self.settings.use_get_logs,
+            async_web3_client=self.async_web3_client,
+            max_concurrency=self.settings.backfill_concurrency,
+            rate_limit=self.settings.rpc_rate_limit,
+            adaptive_chunking=self.settings.adaptive_chunking,
+            max_chunk_size=self.settings.max_chunk_size,
+            log_cache=self.log_cache,
+            finality_depth=self.settings.finality_depth,
+            handlers=self.event_processor.handlers
+        )
+    
     async def run_monitor_command(self):
         """Run the monitor command"""
         try:
@@ -314,12 +419,15 @@ class RegistryMonitorCLI:
                 status = "✅" if success else "❌"
                 print(f"{status} {notifier}")
             
+            # Resume deliveries spooled by an earlier run
+            self.notification_manager.start()
+            
             # Show history if requested
             if self.settings.show_history:
                 from_block = int(self.settings.from_block) if self.settings.from_block else 0
                 print(f"\n📚 Fetching historical events from block {from_block}...")
                 
-                event_fetcher = EventFetcher(self.web3_client, self.contracts, chunk_size=self.settings.chunk_size)
+                event_fetcher = self._create_event_fetcher()
                 historical_events = await event_fetcher.get_historical_events_async(
                     from_block=from_block,
                     to_block='latest',
@@ -347,6 +455,8 @@ class RegistryMonitorCLI:
         except Exception as e:
             logger.error(f"Error running monitor: {e}")
             raise
+        finally:
+            await self._shutdown_components()
     
     async def run_history_command(self, from_block: int, to_block: str = 'latest', max_events: int = 100):
         """Run the history command"""
@@ -356,7 +466,7 @@ class RegistryMonitorCLI:
             print(f"\n📚 Fetching historical events from block {from_block} to {to_block}")
             print("="*80)
             
-            event_fetcher = EventFetcher(self.web3_client, self.contracts, chunk_size=self.settings.chunk_size)
+            event_fetcher = self._create_event_fetcher()
             historical_events = await event_fetcher.get_historical_events_async(
                 from_block=from_block,
                 to_block=to_block,
@@ -373,6 +483,8 @@ class RegistryMonitorCLI:
         except Exception as e:
             logger.error(f"Error running history command: {e}")
             raise
+        finally:
+            await self._shutdown_components()
     
     async def run_test_command(self):
         """Run the test command"""
@@ -419,6 +531,8 @@ class RegistryMonitorCLI:
         except Exception as e:
             logger.error(f"Error running test: {e}")
             raise
+        finally:
+            await self._shutdown_components()
 
 
 async def main():
@@ -68,6 +68,54 @@ REGISTRY_CONTRACT_ABI = [
         ],
         "name": "OperatorOptedOut",
         "type": "event"
+    },
+    {
+        "type": "function",
+        "name": "unregister",
+        "inputs": [
+            {"name": "registrationRoot", "type": "bytes32"}
+        ],
+        "outputs": [],
+        "stateMutability": "nonpayable"
+    },
+    {
+        "type": "function",
+        "name": "addCollateral",
+        "inputs": [
+            {"name": "registrationRoot", "type": "bytes32"}
+        ],
+        "outputs": [],
+        "stateMutability": "payable"
+    },
+    {
+        "type": "function",
+        "name": "claimCollateral",
+        "inputs": [
+            {"name": "registrationRoot", "type": "bytes32"}
+        ],
+        "outputs": [],
+        "stateMutability": "nonpayable"
+    },
+    {
+        "type": "function",
+        "name": "optInToSlasher",
+        "inputs": [
+            {"name": "registrationRoot", "type": "bytes32"},
+            {"name": "slasher", "type": "address"},
+            {"name": "committer", "type": "address"}
+        ],
+        "outputs": [],
+        "stateMutability": "nonpayable"
+    },
+    {
+        "type": "function",
+        "name": "optOutOfSlasher",
+        "inputs": [
+            {"name": "registrationRoot", "type": "bytes32"},
+            {"name": "slasher", "type": "address"}
+        ],
+        "outputs": [],
+        "stateMutability": "nonpayable"
     }
 ]
 
@@ -327,16 +375,72 @@ EIGENLAYER_MIDDLEWARE_ABI = [
                         "name": "pubkey",
                         "type": "tuple",
                         "components": [
-                            {"name": "x", "type": "uint256"},
-                            {"name": "y", "type": "uint256"}
+                            {
+                                "name": "x",
+                                "type": "tuple",
+                                "components": [
+                                    {"name": "a", "type": "uint256"},
+                                    {"name": "b", "type": "uint256"}
+                                ]
+                            },
+                            {
+                                "name": "y",
+                                "type": "tuple",
+                                "components": [
+                                    {"name": "a", "type": "uint256"},
+                                    {"name": "b", "type": "uint256"}
+                                ]
+                            }
                         ]
                     },
                     {
                         "name": "signature",
                         "type": "tuple",
                         "components": [
-                            {"name": "x", "type": "uint256[2]"},
-                            {"name": "y", "type": "uint256[2]"}
+                            {
+                                "name": "x",
+                                "type": "tuple",
+                                "components": [
+                                    {
+                                        "name": "c0",
+                                        "type": "tuple",
+                                        "components": [
+                                            {"name": "a", "type": "uint256"},
+                                            {"name": "b", "type": "uint256"}
+                                        ]
+                                    },
+                                    {
+                                        "name": "c1",
+                                        "type": "tuple",
+                                        "components": [
+                                            {"name": "a", "type": "uint256"},
+                                            {"name": "b", "type": "uint256"}
+                                        ]
+                                    }
+                                ]
+                            },
+                            {
+                                "name": "y",
+                                "type": "tuple",
+                                "components": [
+                                    {
+                                        "name": "c0",
+                                        "type": "tuple",
+                                        "components": [
+                                            {"name": "a", "type": "uint256"},
+                                            {"name": "b", "type": "uint256"}
+                                        ]
+                                    },
+                                    {
+                                        "name": "c1",
+                                        "type": "tuple",
+                                        "components": [
+                                            {"name": "a", "type": "uint256"},
+                                            {"name": "b", "type": "uint256"}
+                                        ]
+                                    }
+                                ]
+                            }
                         ]
                     }
                 ]
@@ -344,6 +448,15 @@ EIGENLAYER_MIDDLEWARE_ABI = [
         ],
         "outputs": [{"name": "", "type": "bytes32"}],
         "stateMutability": "payable"
+    },
+    {
+        "type": "function",
+        "name": "unregisterValidators",
+        "inputs": [
+            {"name": "registrationRoot", "type": "bytes32"}
+        ],
+        "outputs": [],
+        "stateMutability": "nonpayable"
     }
 ]
 
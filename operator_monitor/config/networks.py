@@ -5,24 +5,28 @@ NETWORK_CONFIGS = {
         'name': 'Ethereum Mainnet',
         'chain_id': 1,
         'default_rpc': 'https://eth.llamarpc.com',
+        'fallback_rpcs': ['https://ethereum-rpc.publicnode.com', 'https://rpc.ankr.com/eth'],
         'block_explorer': 'https://etherscan.io'
     },
     'holesky': {
         'name': 'Holesky Testnet',
         'chain_id': 17000,
         'default_rpc': 'https://ethereum-holesky.publicnode.com',
+        'fallback_rpcs': ['https://ethereum-holesky-rpc.publicnode.com'],
         'block_explorer': 'https://holesky.etherscan.io'
     },
     'hoodi': {
         'name': 'Hoodi Testnet',
         'chain_id': 560048,
         'default_rpc': 'https://ethereum-hoodi-rpc.publicnode.com',
+        'fallback_rpcs': ['https://rpc.hoodi.ethpandaops.io'],
         'block_explorer': 'https://hoodi.etherscan.io'
     },
     'devnet': {
         'name': 'Local Devnet',
         'chain_id': 1337,
         'default_rpc': 'http://localhost:8545',
+        'fallback_rpcs': [],
         'block_explorer': 'https://localhost:8545'
     }
 } 
\ No newline at end of file
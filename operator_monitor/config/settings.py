@@ -13,6 +13,23 @@ class Settings:
     def __init__(self):
         self.network = os.getenv('NETWORK', 'mainnet').lower()
         self.rpc_url = os.getenv('RPC_URL')
+        
+        # Async RPC client configuration
+        self.use_async_rpc = os.getenv('USE_ASYNC_RPC', 'true').lower() in ('true', '1', 'yes', 'y')
+        self.rpc_pool_size = int(os.getenv('RPC_POOL_SIZE', '20'))
+        self.rpc_timeout = int(os.getenv('RPC_TIMEOUT', '30'))
+        
+        # Multi-endpoint RPC routing configuration
+        self.rpc_urls = [url.strip() for url in os.getenv('RPC_URLS', '').split(',') if url.strip()]
+        self.rpc_hedge_enabled = os.getenv('RPC_HEDGE_ENABLED', 'false').lower() in ('true', '1', 'yes', 'y')
+        self.rpc_hedge_percentile = float(os.getenv('RPC_HEDGE_PERCENTILE', '95'))
+        self.rpc_probe_interval = int(os.getenv('RPC_PROBE_INTERVAL', '30'))
+        self.rpc_rate_limit = float(os.getenv('RPC_RATE_LIMIT', '0'))
+        
+        # JSON-RPC batching configuration
+        self.rpc_batch_enabled = os.getenv('RPC_BATCH_ENABLED', 'true').lower() in ('true', '1', 'yes', 'y')
+        self.rpc_batch_window_ms = int(os.getenv('RPC_BATCH_WINDOW_MS', '10'))
+        self.rpc_batch_size = int(os.getenv('RPC_BATCH_SIZE', '50'))
         self.registry_contract_address = os.getenv('REGISTRY_CONTRACT_ADDRESS')
         
         # TaiyiRegistryCoordinator contract address (optional)
@@ -33,22 +50,73 @@ class Settings:
         # Slack configuration
         self.slack_bot_token = os.getenv('SLACK_BOT_TOKEN')
         self.slack_channel = os.getenv('SLACK_CHANNEL', 'C091L7Q0ZJN')
+        self.notification_timeout = float(os.getenv('NOTIFICATION_TIMEOUT', '10'))
+        self.slack_rate_limit = float(os.getenv('SLACK_RATE_LIMIT', '1'))
+        self.notification_max_retry_after = float(os.getenv('NOTIFICATION_MAX_RETRY_AFTER', '60'))
+        self.notification_coalesce_window = float(os.getenv('NOTIFICATION_COALESCE_WINDOW', '2'))
+        self.notification_digest_top_n = int(os.getenv('NOTIFICATION_DIGEST_TOP_N', '5'))
+        self.notification_spool_path = os.getenv('NOTIFICATION_SPOOL_PATH') or None
+        self.notification_max_backoff = float(os.getenv('NOTIFICATION_MAX_BACKOFF', '300'))
+        self.notifier_breaker_error_rate = float(os.getenv('NOTIFIER_BREAKER_ERROR_RATE', '0.5'))
+        self.notifier_latency_budget = float(os.getenv('NOTIFIER_LATENCY_BUDGET', '0')) or None
+        self.notifier_breaker_cooldown = float(os.getenv('NOTIFIER_BREAKER_COOLDOWN', '30'))
         
         # Monitor behavior configuration
         self.show_history = os.getenv('SHOW_HISTORY', 'false').lower() in ('true', '1', 'yes', 'y')
         self.from_block = os.getenv('FROM_BLOCK', '')
         self.use_reconnection = os.getenv('USE_RECONNECTION', 'true').lower() in ('true', '1', 'yes', 'y')
         self.chunk_size = int(os.getenv('CHUNK_SIZE', '50000'))
+        self.adaptive_chunking = os.getenv('ADAPTIVE_CHUNKING', 'true').lower() in ('true', '1', 'yes', 'y')
+        self.max_chunk_size = int(os.getenv('MAX_CHUNK_SIZE', '500000'))
+        self.log_cache_path = os.getenv('LOG_CACHE_PATH') or None
+        self.finality_depth = int(os.getenv('FINALITY_DEPTH', '64'))
+        self.use_log_tail = os.getenv('USE_LOG_TAIL', 'true').lower() in ('true', '1', 'yes', 'y')
+        self.tail_cursor_path = os.getenv('TAIL_CURSOR_PATH') or None
+        self.ws_url = os.getenv('WS_URL') or None
+        self.confirmation_depth = int(os.getenv('CONFIRMATION_DEPTH', '12'))
+        self.confirmed_only = os.getenv('CONFIRMED_ONLY', 'false').lower() in ('true', '1', 'yes', 'y')
+        self.pipeline_workers = int(os.getenv('PIPELINE_WORKERS', '4'))
+        self.notify_workers = int(os.getenv('NOTIFY_WORKERS', '2'))
+        self.pipeline_queue_size = int(os.getenv('PIPELINE_QUEUE_SIZE', '1000'))
+        self.backpressure = os.getenv('BACKPRESSURE', 'block').lower()
+        self.low_priority_events = [
+            spec.strip() for spec in os.getenv(
+                'LOW_PRIORITY_EVENTS',
+                'TaiyiEscrow.Deposited,TaiyiEscrow.Withdrawn,TaiyiEscrow.PaymentMade,TaiyiEscrow.RequestedWithdraw'
+            ).split(',') if spec.strip()
+        ]
+        self.event_priorities = {
+            spec.split('=', 1)[0].strip(): spec.split('=', 1)[1].strip()
+            for spec in os.getenv('EVENT_PRIORITIES', '').split(',') if '=' in spec
+        } or None
+        self.use_get_logs = os.getenv('USE_GET_LOGS', 'true').lower() in ('true', '1', 'yes', 'y')
+        self.backfill_concurrency = int(os.getenv('BACKFILL_CONCURRENCY', '4'))
         
         # Calldata decoding configuration
         self.enable_calldata_decoding = os.getenv('ENABLE_CALLDATA_DECODING', 'true').lower() in ('true', '1', 'yes', 'y')
         
+        # Transaction cache configuration
+        self.tx_cache_size = int(os.getenv('TX_CACHE_SIZE', '1024'))
+        self.tx_cache_max_mb = int(os.getenv('TX_CACHE_MAX_MB', '64'))
+        self.tx_cache_path = os.getenv('TX_CACHE_PATH') or None
+        
         # Redis configuration for validator storage
         self.redis_url = os.getenv('REDIS_URL', 'redis://localhost:6379')
         self.enable_redis_storage = os.getenv('ENABLE_REDIS_STORAGE', 'false').lower() in ('true', '1', 'yes', 'y')
         self.redis_key_prefix = os.getenv('REDIS_KEY_PREFIX', 'validators_by_operator')
         self.redis_timeout = int(os.getenv('REDIS_TIMEOUT', '5'))
         
+    def get_rpc_urls(self, network_config: dict) -> list:
+        """Ordered RPC endpoints: RPC_URL (or the network default), then RPC_URLS or the network fallbacks"""
+        primary = self.rpc_url or network_config['default_rpc']
+        extra = self.rpc_urls or network_config.get('fallback_rpcs', [])
+        
+        urls = [primary]
+        for url in extra:
+            if url not in urls:
+                urls.append(url)
+        return urls
+    
     def validate(self):
         """Validate required settings"""
         if not self.registry_contract_address or self.registry_contract_address == "0x0000000000000000000000000000000000000000":
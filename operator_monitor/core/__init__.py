@@ -1,7 +1,13 @@
 """Core module exports"""
 
 from .web3_client import Web3Client
+from .async_web3_client import AsyncWeb3Client
 from .contract_interface import RegistryContract, ContractInterface, TaiyiRegistryCoordinatorContract, TaiyiEscrowContract, TaiyiCoreContract, EigenLayerMiddlewareContract, EigenLayerAllocationManagerContract
 from .event_processor import EventProcessor
+from .transaction_cache import TransactionCache
+from .log_decoder import LogDecoder
+from .event_router import EventRouter, EventRoute, EventHandler
+from .monitored_event import MonitoredEvent
+from .function_registry import FunctionDecoderRegistry, FunctionDecoder
 
-__all__ = ['Web3Client', 'RegistryContract', 'EventProcessor', 'ContractInterface', 'TaiyiRegistryCoordinatorContract', 'TaiyiEscrowContract', 'TaiyiCoreContract', 'EigenLayerMiddlewareContract', 'EigenLayerAllocationManagerContract'] 
\ No newline at end of file
+__all__ = ['Web3Client', 'AsyncWeb3Client', 'RegistryContract', 'EventProcessor', 'ContractInterface', 'TaiyiRegistryCoordinatorContract', 'TaiyiEscrowContract', 'TaiyiCoreContract', 'EigenLayerMiddlewareContract', 'EigenLayerAllocationManagerContract', 'TransactionCache', 'LogDecoder', 'EventRouter', 'EventRoute', 'EventHandler', 'MonitoredEvent', 'FunctionDecoderRegistry', 'FunctionDecoder'] 
\ No newline at end of file
@@ -0,0 +1,320 @@
+"""Async Web3 connection management with a pooled HTTP session"""
+
+import asyncio
+import logging
+from typing import Optional, Dict, Any, List, Union
+
+import aiohttp
+from eth_utils import add_0x_prefix, to_checksum_address
+from hexbytes import HexBytes
+from web3 import AsyncWeb3, AsyncHTTPProvider
+
+from ..config import NETWORK_CONFIGS
+from .web3_client import format_transaction, format_receipt
+from .rpc_pool import RpcEndpoint, RpcEndpointPool
+from .rpc_batcher import RpcBatcher
+
+logger = logging.getLogger(__name__)
+
+
+def _to_int(value: Optional[str]) -> Optional[int]:
+    """Convert a JSON-RPC quantity to int"""
+    return int(value, 16) if value is not None else None
+
+
+def _to_hex(value: Optional[str]) -> Optional[str]:
+    """Convert JSON-RPC data to the same hex form HexBytes.hex() produces"""
+    return HexBytes(value).hex() if value is not None else None
+
+
+def _to_address(value: Optional[str]) -> Optional[str]:
+    """Convert a JSON-RPC address to checksum form"""
+    return to_checksum_address(value) if value else None
+
+
+def format_raw_transaction(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a raw eth_getTransactionByHash result to the format_transaction shape"""
+    return {
+        'hash': _to_hex(raw['hash']),
+        'blockNumber': _to_int(raw.get('blockNumber')),
+        'blockHash': _to_hex(raw.get('blockHash')),
+        'transactionIndex': _to_int(raw.get('transactionIndex')),
+        'from': _to_address(raw['from']),
+        'to': _to_address(raw.get('to')),
+        'value': _to_int(raw['value']),
+        'gas': _to_int(raw['gas']),
+        'gasPrice': _to_int(raw.get('gasPrice')),
+        'input': _to_hex(raw['input']),
+        'nonce': _to_int(raw['nonce']),
+        'type': _to_int(raw.get('type')),
+        'chainId': _to_int(raw.get('chainId'))
+    }
+
+
+def format_raw_receipt(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a raw eth_getTransactionReceipt result to the format_receipt shape"""
+    return {
+        'transactionHash': _to_hex(raw['transactionHash']),
+        'blockNumber': _to_int(raw['blockNumber']),
+        'blockHash': _to_hex(raw['blockHash']),
+        'transactionIndex': _to_int(raw['transactionIndex']),
+        'from': _to_address(raw['from']),
+        'to': _to_address(raw.get('to')),
+        'gasUsed': _to_int(raw['gasUsed']),
+        'cumulativeGasUsed': _to_int(raw['cumulativeGasUsed']),
+        'status': _to_int(raw.get('status')),
+        'logs': [
+            {
+                'address': _to_address(log['address']),
+                'topics': [_to_hex(topic) for topic in log['topics']],
+                'data': _to_hex(log['data'])
+            }
+            for log in raw['logs']
+        ]
+    }
+
+
+def format_raw_block(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a raw eth_getBlockByNumber result to a block header dictionary"""
+    return {
+        'number': _to_int(raw['number']),
+        'hash': _to_hex(raw['hash']),
+        'parentHash': _to_hex(raw['parentHash']),
+        'timestamp': _to_int(raw['timestamp'])
+    }
+
+
+class AsyncWeb3Client:
+    """Non-blocking counterpart of Web3Client backed by AsyncWeb3"""
+    
+    def __init__(self, rpc_urls: Union[str, List[str]], network: str = 'mainnet', pool_size: int = 20,
+                 request_timeout: int = 30, hedge_enabled: bool = False, hedge_percentile: float = 95,
+                 probe_interval: int = 30, batch_enabled: bool = True, batch_window: float = 0.01,
+                 max_batch_size: int = 50, rate_limit: float = 0):
+        """
+        Initialize async Web3 client
+        
+        The HTTP session is opened lazily on the first awaited call so the client
+        can be constructed outside of a running event loop.
+        
+        Args:
+            rpc_urls: RPC URL or ordered list of RPC URLs of Ethereum nodes
+            network: The network name (mainnet, holesky, etc.)
+            pool_size: Maximum number of pooled connections per RPC node
+            request_timeout: Total timeout in seconds for a single RPC request
+            hedge_enabled: Whether to send hedged duplicates to a second endpoint
+            hedge_percentile: Latency percentile used as the hedge delay
+            probe_interval: Seconds between background endpoint probes
+            batch_enabled: Whether to coalesce transaction, receipt and block lookups into JSON-RPC batches
+            batch_window: Seconds to collect lookups before sending a batch
+            max_batch_size: Maximum number of lookups per batch
+            rate_limit: Maximum requests per second per endpoint (0 for unlimited)
+        """
+        self.network = network.lower()
+        self.network_config = NETWORK_CONFIGS.get(self.network, NETWORK_CONFIGS['mainnet'])
+        self.rpc_urls = [rpc_urls] if isinstance(rpc_urls, str) else list(rpc_urls)
+        self.rpc_url = self.rpc_urls[0]
+        self.pool_size = pool_size
+        self.request_timeout = request_timeout
+        
+        # One provider per endpoint; all of them share the pooled session. Provider-level
+        # retries are disabled because the endpoint pool handles failover itself.
+        self.providers = [
+            AsyncHTTPProvider(
+                url,
+                request_kwargs={'timeout': aiohttp.ClientTimeout(total=request_timeout)},
+                exception_retry_configuration=None
+            )
+            for url in self.rpc_urls
+        ]
+        self.pool = RpcEndpointPool(
+            [RpcEndpoint(url, AsyncWeb3(provider), rate_limit=rate_limit) for url, provider in zip(self.rpc_urls, self.providers)],
+            hedge_enabled=hedge_enabled,
+            hedge_percentile=hedge_percentile,
+            probe_interval=probe_interval
+        )
+        self.web3 = self.pool.endpoints[0].web3
+        self.batcher = RpcBatcher(self._send_batch, batch_window, max_batch_size) if batch_enabled else None
+        
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_lock = asyncio.Lock()
+    
+    async def _ensure_session(self):
+        """Open the shared connection pool and hand it to the provider"""
+        if self._session is not None and not self._session.closed:
+            return
+        
+        async with self._session_lock:
+            if self._session is not None and not self._session.closed:
+                return
+            
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size * len(self.rpc_urls),
+                limit_per_host=self.pool_size
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout)
+            )
+            for provider in self.providers:
+                await provider.cache_async_session(self._session)
+            self.pool.start_probing()
+            logger.debug(f"Opened RPC connection pool (size {self.pool_size}) for {len(self.rpc_urls)} endpoint(s)")
+    
+    async def _send_batch(self, requests: List[tuple]) -> List[Dict[str, Any]]:
+        """Send (method, params) pairs as one JSON-RPC batch to the best endpoint"""
+        await self._ensure_session()
+        return await self.pool.call(lambda w3: w3.provider.make_batch_request(requests))
+    
+    async def connect(self):
+        """Open the connection pool and validate the connection and network"""
+        await self._ensure_session()
+        
+        if not await self.is_connected():
+            raise ConnectionError("Failed to connect to Ethereum node")
+        
+        await self._verify_network()
+        logger.info(f"Async RPC client connected to: {', '.join(self.rpc_urls)}")
+    
+    async def _verify_network(self):
+        """Verify we're connected to the correct network"""
+        try:
+            chain_id = await self.pool.call(lambda w3: w3.eth.chain_id)
+            expected_chain_id = self.network_config['chain_id']
+            if chain_id != expected_chain_id:
+                logger.warning(
+                    f"Chain ID mismatch: expected {expected_chain_id} for {self.network}, got {chain_id}"
+                )
+        except Exception as e:
+            logger.warning(f"Could not verify chain ID: {e}")
+    
+    async def close(self):
+        """Stop background probing and close the pooled HTTP session"""
+        await self.pool.stop_probing()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            logger.debug("Closed RPC connection pool")
+        self._session = None
+    
+    async def is_connected(self) -> bool:
+        """Check if Web3 connection is active"""
+        await self._ensure_session()
+        try:
+            await self.pool.call(lambda w3: w3.eth.block_number)
+            return True
+        except Exception:
+            return False
+    
+    async def get_current_block(self) -> int:
+        """Get current block number"""
+        await self._ensure_session()
+        return await self.pool.call(lambda w3: w3.eth.block_number)
+    
+    async def get_transaction_by_hash(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Get transaction details by transaction hash
+        
+        Args:
+            tx_hash: Transaction hash as hex string
+        
+        Returns:
+            Transaction data dictionary or None if not found
+        """
+        try:
+            if self.batcher:
+                raw = await self.batcher.request('eth_getTransactionByHash', [add_0x_prefix(tx_hash)])
+                return format_raw_transaction(raw) if raw else None
+            
+            await self._ensure_session()
+            tx = await self.pool.call(lambda w3: w3.eth.get_transaction(tx_hash))
+            return format_transaction(tx)
+        except Exception as e:
+            logger.error(f"Error fetching transaction {tx_hash}: {e}")
+            return None
+    
+    async def get_transaction_receipt(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Get transaction receipt by transaction hash
+        
+        Args:
+            tx_hash: Transaction hash as hex string
+        
+        Returns:
+            Transaction receipt dictionary or None if not found
+        """
+        try:
+            if self.batcher:
+                raw = await self.batcher.request('eth_getTransactionReceipt', [add_0x_prefix(tx_hash)])
+                return format_raw_receipt(raw) if raw else None
+            
+            await self._ensure_session()
+            receipt = await self.pool.call(lambda w3: w3.eth.get_transaction_receipt(tx_hash))
+            return format_receipt(receipt)
+        except Exception as e:
+            logger.error(f"Error fetching transaction receipt {tx_hash}: {e}")
+            return None
+    
+    async def get_block(self, block_number: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a block header by block number
+        
+        Args:
+            block_number: Block number
+        
+        Returns:
+            Block dictionary with number, hash, parentHash and timestamp, or None if not found
+        """
+        try:
+            if self.batcher:
+                raw = await self.batcher.request('eth_getBlockByNumber', [hex(block_number), False])
+                return format_raw_block(raw) if raw else None
+            
+            await self._ensure_session()
+            block = await self.pool.call(lambda w3: w3.eth.get_block(block_number))
+            return {
+                'number': block.number,
+                'hash': block.hash.hex(),
+                'parentHash': block.parentHash.hex(),
+                'timestamp': block.timestamp
+            }
+        except Exception as e:
+            logger.error(f"Error fetching block {block_number}: {e}")
+            return None
+    
+    async def get_logs(self, filter_params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Run eth_getLogs on the best endpoint
+        
+        Errors are raised so callers can decide how to retry or split the range.
+        
+        Args:
+            filter_params: eth_getLogs filter parameters
+        
+        Returns:
+            List of log entries
+        """
+        await self._ensure_session()
+        return await self.pool.call(lambda w3: w3.eth.get_logs(filter_params))
+    
+    async def health_check(self) -> dict:
+        """Perform connection health check"""
+        try:
+            current_block = await self.get_current_block()
+            chain_id = await self.pool.call(lambda w3: w3.eth.chain_id)
+            
+            return {
+                'connected': True,
+                'current_block': current_block,
+                'chain_id': chain_id,
+                'network': self.network,
+                'rpc_url': self.rpc_url,
+                'endpoints': self.pool.get_stats()['endpoints']
+            }
+        except Exception as e:
+            return {
+                'connected': False,
+                'error': str(e),
+                'network': self.network,
+                'rpc_url': self.rpc_url,
+                'endpoints': self.pool.get_stats()['endpoints']
+            }
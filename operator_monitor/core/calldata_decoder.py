@@ -1,12 +1,23 @@
 """Transaction calldata decoding utilities"""
 
 import logging
-from typing import Dict, Any, Optional, List, Tuple
+from collections.abc import Mapping, Sequence as SequenceABC
+from typing import Dict, Any, Optional, List, Tuple, Iterator, Union, Iterable, Sequence
 from web3 import Web3
 from eth_utils import to_checksum_address
 
+from ..config import EIGENLAYER_MIDDLEWARE_ABI
+from .function_registry import FunctionDecoderRegistry, calldata_bytes
+
 logger = logging.getLogger(__name__)
 
+# registerValidators calldata: selector, array offset, array length, then one static
+# registration per 12 words (pubkey x.a, x.b, y.a, y.b; signature x.c0, x.c1, y.c0, y.c1 as a, b)
+WORD_SIZE = 32
+REGISTRATION_WORDS = 12
+REGISTRATION_SIZE = REGISTRATION_WORDS * WORD_SIZE
+HEADER_SIZE = 4 + 2 * WORD_SIZE
+
 
 class BLSUtils:
     """BLS12-381 utilities for G1 point compression"""
@@ -17,6 +28,9 @@ class BLSUtils:
         0x64774b84f38512bf6730d2a0f6b0f6241eabfffeb153ffffb9feffffffffaaab
     ]
     
+    # (p - 1) / 2 split into the same (high, low) limbs
+    _HALF_MODULUS = divmod(((BASE_FIELD_MODULUS[0] << 256 | BASE_FIELD_MODULUS[1]) - 1) >> 1, 1 << 256)
+    
     @staticmethod
     def _greater_than(a_high: int, a_low: int, b_high: int, b_low: int) -> bool:
         """
@@ -88,152 +102,212 @@ class BLSUtils:
             r_a = r_a | (1 << 125)
         
         return r_a, r_b
+    
+    @staticmethod
+    def compress_g1_points(points: Iterable[Sequence[int]]) -> List[Tuple[int, int]]:
+        """
+        Compresses a batch of G1 points, equivalent to compress_g1_point per point
+        
+        For a reduced y (y < p), y is greater than its negation p - y exactly when
+        y > (p - 1) / 2, so the sign bit comes from one limb comparison against a
+        precomputed constant instead of a negation and bit-wise compare per point.
+        
+        Args:
+            points: (x_a, x_b, y_a, y_b) limbs of each point, e.g. the first four
+                words of each registerValidators registration
+            
+        Returns:
+            List of (compressed_x_a, compressed_x_b) in input order
+        """
+        modulus_a, modulus_b = BLSUtils.BASE_FIELD_MODULUS
+        half_a, half_b = BLSUtils._HALF_MODULUS
+        flag = 1 << 127
+        sign = (1 << 127) | (1 << 125)
+        
+        compressed = []
+        for x_a, x_b, y_a, y_b, *_ in points:
+            if y_a < half_a or (y_a == half_a and y_b <= half_b):
+                compressed.append((x_a | flag, x_b))
+            elif y_a < modulus_a or (y_a == modulus_a and y_b < modulus_b):
+                compressed.append((x_a | sign, x_b))
+            else:
+                # Unreduced y: keep the exact behaviour of the limb-wise reference
+                compressed.append(BLSUtils.compress_g1_point(x_a, x_b, y_a, y_b))
+        return compressed
+
+
+def _word(data: bytes, offset: int) -> int:
+    """uint256 word of data at a byte offset"""
+    return int.from_bytes(data[offset:offset + WORD_SIZE], 'big')
+
+
+class RegistrationView(Mapping):
+    """
+    One registerValidators registration read in place from the calldata buffer
+    
+    Fields are only computed when accessed, so consumers that need just the
+    compressed pubkey never build the coordinate dicts. Reads like the dict the
+    ABI path produces: 'index', 'pubkey', 'signature', 'pubkey_hex', 'signature_hex'.
+    """
+    
+    __slots__ = ('_data', '_start', 'index', '_registrations')
+    
+    _FIELDS = ('index', 'pubkey', 'signature', 'pubkey_hex', 'signature_hex')
+    
+    def __init__(self, data: bytes, start: int, index: int, registrations: Optional['RegistrationList'] = None):
+        self._data = data
+        self._start = start
+        self.index = index
+        self._registrations = registrations
+    
+    def _words(self, first: int, count: int) -> List[int]:
+        start = self._start + first * WORD_SIZE
+        return [_word(self._data, offset) for offset in range(start, start + count * WORD_SIZE, WORD_SIZE)]
+    
+    @property
+    def pubkey_hex(self) -> str:
+        """Compressed pubkey as hex (without leading zeros after 0x)"""
+        # Views of a list share its batch so reading keys one at a time still compresses once
+        if self._registrations is not None:
+            return self._registrations.pubkey_hexes()[self.index]
+        compressed_x_a, compressed_x_b = BLSUtils.compress_g1_points([self._words(0, 4)])[0]
+        return f"0x{compressed_x_a:x}{compressed_x_b:064x}"
+    
+    @property
+    def signature_hex(self) -> str:
+        """The eight signature words as one hex string"""
+        return '0x' + self._data[self._start + 4 * WORD_SIZE:self._start + REGISTRATION_SIZE].hex()
+    
+    @property
+    def pubkey(self) -> Dict[str, Any]:
+        """Affine pubkey coordinates as decimal strings"""
+        x_a, x_b, y_a, y_b = (str(word) for word in self._words(0, 4))
+        return {'x': {'a': x_a, 'b': x_b}, 'y': {'a': y_a, 'b': y_b}}
+    
+    @property
+    def signature(self) -> Dict[str, Any]:
+        """Affine signature coordinates as decimal strings"""
+        sig = [str(word) for word in self._words(4, 8)]
+        return {
+            'x': {'c0': {'a': sig[0], 'b': sig[1]}, 'c1': {'a': sig[2], 'b': sig[3]}},
+            'y': {'c0': {'a': sig[4], 'b': sig[5]}, 'c1': {'a': sig[6], 'b': sig[7]}}
+        }
+    
+    def __getitem__(self, name: str) -> Any:
+        if name not in self._FIELDS:
+            raise KeyError(name)
+        return getattr(self, name)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._FIELDS)
+    
+    def __len__(self) -> int:
+        return len(self._FIELDS)
+
+
+class RegistrationList(SequenceABC):
+    """Registrations of canonical registerValidators calldata, viewed lazily over the buffer"""
+    
+    __slots__ = ('_data', '_count', '_pubkey_hexes')
+    
+    def __init__(self, data: bytes, count: int):
+        """
+        Args:
+            data: Full calldata bytes, already validated to hold count registrations
+            count: Number of registrations
+        """
+        self._data = data
+        self._count = count
+        self._pubkey_hexes: Optional[List[str]] = None
+    
+    def pubkey_hexes(self) -> List[str]:
+        """Compressed pubkeys of all registrations as hex, compressed as one batch on first use"""
+        if self._pubkey_hexes is None:
+            points = ([_word(self._data, start + i * WORD_SIZE) for i in range(4)]
+                      for start in range(HEADER_SIZE, HEADER_SIZE + self._count * REGISTRATION_SIZE, REGISTRATION_SIZE))
+            self._pubkey_hexes = [f"0x{x_a:x}{x_b:064x}" for x_a, x_b in BLSUtils.compress_g1_points(points)]
+        return self._pubkey_hexes
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        return RegistrationView(self._data, HEADER_SIZE + index * REGISTRATION_SIZE, index, self)
+    
+    def __len__(self) -> int:
+        return self._count
 
 
 class CalldataDecoder:
     """Decodes transaction calldata for blockchain function calls"""
     
-    def __init__(self, web3: Web3):
+    def __init__(self, web3: Web3, transaction_cache=None):
         """
         Initialize calldata decoder
         
         Args:
             web3: Web3 instance for ABI decoding
+            transaction_cache: Optional TransactionCache shared with other consumers
         """
         self.web3 = web3
+        self.transaction_cache = transaction_cache
         
         # EigenLayerMiddleware registerValidators function ABI with correct BLS structure
-        self.register_validators_abi = {
-            "type": "function",
-            "name": "registerValidators", 
-            "inputs": [
-                {
-                    "name": "registrations",
-                    "type": "tuple[]",
-                    "components": [
-                        {
-                            "name": "pubkey",
-                            "type": "tuple",
-                            "components": [
-                                {
-                                    "name": "x",
-                                    "type": "tuple",
-                                    "components": [
-                                        {"name": "a", "type": "uint256"},
-                                        {"name": "b", "type": "uint256"}
-                                    ]
-                                },
-                                {
-                                    "name": "y",
-                                    "type": "tuple",
-                                    "components": [
-                                        {"name": "a", "type": "uint256"},
-                                        {"name": "b", "type": "uint256"}
-                                    ]
-                                }
-                            ]
-                        },
-                        {
-                            "name": "signature",
-                            "type": "tuple", 
-                            "components": [
-                                {
-                                    "name": "x",
-                                    "type": "tuple",
-                                    "components": [
-                                        {
-                                            "name": "c0",
-                                            "type": "tuple",
-                                            "components": [
-                                                {"name": "a", "type": "uint256"},
-                                                {"name": "b", "type": "uint256"}
-                                            ]
-                                        },
-                                        {
-                                            "name": "c1",
-                                            "type": "tuple",
-                                            "components": [
-                                                {"name": "a", "type": "uint256"},
-                                                {"name": "b", "type": "uint256"}
-                                            ]
-                                        }
-                                    ]
-                                },
-                                {
-                                    "name": "y",
-                                    "type": "tuple",
-                                    "components": [
-                                        {
-                                            "name": "c0",
-                                            "type": "tuple",
-                                            "components": [
-                                                {"name": "a", "type": "uint256"},
-                                                {"name": "b", "type": "uint256"}
-                                            ]
-                                        },
-                                        {
-                                            "name": "c1",
-                                            "type": "tuple",
-                                            "components": [
-                                                {"name": "a", "type": "uint256"},
-                                                {"name": "b", "type": "uint256"}
-                                            ]
-                                        }
-                                    ]
-                                }
-                            ]
-                        }
-                    ]
-                }
-            ],
-            "outputs": [{"name": "", "type": "bytes32"}],
-            "stateMutability": "payable"
-        }
+        self.register_validators_abi = next(
+            entry for entry in EIGENLAYER_MIDDLEWARE_ABI if entry.get('name') == 'registerValidators'
+        )
         
         # Create contract interface for decoding
         try:
             self.contract_interface = self.web3.eth.contract(abi=[self.register_validators_abi])
-            # Correct function selector based on complex BLS structure: 0x5bf6539f
-            function_signature = "registerValidators((((uint256,uint256),(uint256,uint256)),(((uint256,uint256),(uint256,uint256)),((uint256,uint256),(uint256,uint256))))[])"
-            self.function_selector = self.web3.keccak(text=function_signature)[0:4].hex()
             
+            # Selector table over every monitored contract ABI; registerValidators uses the fixed-stride decoder
+            self.registry = FunctionDecoderRegistry()
+            self.register_validators_decoder = self.registry.register(
+                'EigenLayerMiddleware', self.register_validators_abi, self._decode_register_validators
+            )
+            # Correct function selector based on complex BLS structure: 0x5bf6539f
+            self.function_selector = self.register_validators_decoder.selector.hex()
             
             logger.info(f"CalldataDecoder initialized successfully with selector: {self.function_selector}")
         except Exception as e:
             logger.error(f"Error initializing CalldataDecoder: {e}")
             raise
     
-    def is_register_validators_call(self, calldata: str) -> bool:
+    def is_register_validators_call(self, calldata: Union[str, bytes]) -> bool:
         """
         Check if transaction calldata is a registerValidators function call
         
         Args:
-            calldata: Transaction input data as hex string
+            calldata: Transaction input data as bytes or hex string
             
         Returns:
             bool: True if calldata matches registerValidators function signature
         """
         try:
-            if not calldata or len(calldata) < 10:  # Must have at least function selector (4 bytes = 8 hex chars + 0x)
+            if not calldata:
                 return False
-                
-            # Extract function selector (first 4 bytes), handling 0x prefix
-            if calldata.startswith('0x'):
-                selector = calldata[2:10]  # Skip 0x prefix, take next 8 chars (4 bytes)
+            
+            # Compare the 4-byte selector as bytes; only the selector of hex input is converted
+            if isinstance(calldata, (bytes, bytearray)):
+                selector = bytes(calldata[:4])
             else:
-                selector = calldata[:8]
-            return selector == self.function_selector
+                selector = calldata_bytes(calldata[:10] if calldata.startswith('0x') else calldata[:8])
+            return selector == self.register_validators_decoder.selector
             
         except Exception as e:
             logger.debug(f"Error checking function selector: {e}")
             return False
     
-    def decode_register_validators_calldata(self, calldata: str) -> Optional[Dict[str, Any]]:
+    def decode_register_validators_calldata(self, calldata: Union[str, bytes]) -> Optional[Dict[str, Any]]:
         """
-        Decode registerValidators function calldata using contract ABI
+        Decode registerValidators function calldata
         
         Args:
-            calldata: Transaction input data as hex string
+            calldata: Transaction input data as hex string or bytes
             
         Returns:
             Dict containing decoded parameters or None if decoding fails
@@ -243,90 +317,27 @@ class CalldataDecoder:
                 logger.debug("Calldata is not a registerValidators function call")
                 return None
             
-            # Use contract ABI to decode the function input
-            func_obj, func_params = self.contract_interface.decode_function_input(calldata)
+            # Decode through the registry so the selector's latency counters are updated
+            return self.register_validators_decoder.decode(calldata_bytes(calldata))
             
-            # Extract the registrations array from decoded parameters
-            registrations_array = func_params.get('registrations', [])
+        except Exception as e:
+            logger.error(f"Error decoding registerValidators calldata: {e}")
+            return None
+    
+    def _decode_register_validators(self, data: bytes) -> Optional[Dict[str, Any]]:
+        """Decode registerValidators calldata bytes whose selector was already matched"""
+        try:
+            count = self._registration_count(data)
+            if count is not None:
+                parsed_registrations = RegistrationList(data, count)
+            else:
+                logger.debug("registerValidators calldata layout not recognized, decoding with ABI")
+                parsed_registrations = list(self._iter_register_validators_abi(data))
             
-            if not registrations_array:
+            if not parsed_registrations:
                 logger.debug("No registrations found in decoded parameters")
                 return None
             
-            # Sanity check: reject unreasonably large array lengths
-            if len(registrations_array) > 1000:  # Reasonable upper bound for validator registrations
-                logger.warning(f"Array length {len(registrations_array)} exceeds reasonable limit")
-                return None
-            
-            parsed_registrations = []
-            
-            for i, registration in enumerate(registrations_array):
-                try:
-                    # Extract pubkey and signature from the decoded registration
-                    # ABI decoder returns structured dict with 'pubkey' and 'signature' keys
-                    pubkey_data = registration['pubkey']
-                    signature_data = registration['signature']
-                    
-                    # Parse G1Point pubkey - already structured as {'x': {'a': val, 'b': val}, 'y': {'a': val, 'b': val}}
-                    pubkey = {
-                        'x': {
-                            'a': str(pubkey_data['x']['a']),
-                            'b': str(pubkey_data['x']['b'])
-                        },
-                        'y': {
-                            'a': str(pubkey_data['y']['a']),
-                            'b': str(pubkey_data['y']['b'])
-                        }
-                    }
-                    
-                    # Parse G2Point signature - already structured 
-                    signature = {
-                        'x': {
-                            'c0': {
-                                'a': str(signature_data['x']['c0']['a']),
-                                'b': str(signature_data['x']['c0']['b'])
-                            },
-                            'c1': {
-                                'a': str(signature_data['x']['c1']['a']),
-                                'b': str(signature_data['x']['c1']['b'])
-                            }
-                        },
-                        'y': {
-                            'c0': {
-                                'a': str(signature_data['y']['c0']['a']),
-                                'b': str(signature_data['y']['c0']['b'])
-                            },
-                            'c1': {
-                                'a': str(signature_data['y']['c1']['a']),
-                                'b': str(signature_data['y']['c1']['b'])
-                            }
-                        }
-                    }
-                    
-                    # Create compressed pubkey using BLS compression
-                    compressed_x_a, compressed_x_b = BLSUtils.compress_g1_point(
-                        pubkey_data['x']['a'], pubkey_data['x']['b'],
-                        pubkey_data['y']['a'], pubkey_data['y']['b']
-                    )
-                    # Format as hex without leading zeros (except for 0x prefix)
-                    pubkey_hex = f"0x{compressed_x_a:x}{compressed_x_b:064x}"
-                    
-                    # Create full signature hex representation
-                    signature_hex = f"0x{signature_data['x']['c0']['a']:064x}{signature_data['x']['c0']['b']:064x}{signature_data['x']['c1']['a']:064x}{signature_data['x']['c1']['b']:064x}{signature_data['y']['c0']['a']:064x}{signature_data['y']['c0']['b']:064x}{signature_data['y']['c1']['a']:064x}{signature_data['y']['c1']['b']:064x}"
-                    
-                    parsed_reg = {
-                        'index': i,
-                        'pubkey': pubkey,
-                        'signature': signature,
-                        'pubkey_hex': pubkey_hex,
-                        'signature_hex': signature_hex
-                    }
-                    parsed_registrations.append(parsed_reg)
-                    
-                except Exception as e:
-                    logger.warning(f"Error parsing registration {i}: {e}")
-                    continue
-            
             result = {
                 'function': 'registerValidators',
                 'validator_count': len(parsed_registrations),
@@ -340,6 +351,149 @@ class CalldataDecoder:
             logger.error(f"Error decoding registerValidators calldata: {e}")
             return None
     
+    def iter_register_validators(self, calldata: Union[str, bytes]) -> Iterator[Mapping]:
+        """
+        Stream the registrations of registerValidators calldata one at a time
+        
+        The registrations array is read in place as a fixed 12-word stride, so batches of
+        any size are decoded without building the intermediate ABI structures. Calldata
+        that does not have the exact expected layout is decoded with the contract ABI.
+        
+        Args:
+            calldata: registerValidators transaction input data as bytes or hex string
+            
+        Yields:
+            Registrations in calldata order: lazy RegistrationViews, or parsed dicts
+            when decoded with the ABI
+        """
+        data = calldata_bytes(calldata)
+        count = self._registration_count(data)
+        if count is None:
+            logger.debug("registerValidators calldata layout not recognized, decoding with ABI")
+            yield from self._iter_register_validators_abi(data)
+            return
+        
+        yield from RegistrationList(data, count)
+    
+    @staticmethod
+    def _registration_count(data: bytes) -> Optional[int]:
+        """
+        Validate the fixed-stride layout of registerValidators calldata
+        
+        Returns:
+            Number of registrations, or None if the layout is not the canonical encoding
+        """
+        if len(data) < HEADER_SIZE:
+            return None
+        
+        offset = int.from_bytes(data[4:4 + WORD_SIZE], 'big')
+        count = int.from_bytes(data[4 + WORD_SIZE:HEADER_SIZE], 'big')
+        if offset != WORD_SIZE or len(data) != HEADER_SIZE + count * REGISTRATION_SIZE:
+            return None
+        return count
+    
+    @staticmethod
+    def _build_registration(index: int, words: List[int], signature_hex: str,
+                            compressed: Tuple[int, int]) -> Dict[str, Any]:
+        """
+        Build a parsed registration from its 12 uint256 words
+        
+        Args:
+            index: Position of the registration in the array
+            words: pubkey x.a, x.b, y.a, y.b followed by the eight signature words
+            signature_hex: The eight signature words as hex without 0x prefix
+            compressed: Compressed pubkey limbs from BLSUtils.compress_g1_points
+        """
+        x_a, x_b, y_a, y_b = words[:4]
+        sig = [str(word) for word in words[4:]]
+        compressed_x_a, compressed_x_b = compressed
+        
+        return {
+            'index': index,
+            'pubkey': {
+                'x': {'a': str(x_a), 'b': str(x_b)},
+                'y': {'a': str(y_a), 'b': str(y_b)}
+            },
+            'signature': {
+                'x': {'c0': {'a': sig[0], 'b': sig[1]}, 'c1': {'a': sig[2], 'b': sig[3]}},
+                'y': {'c0': {'a': sig[4], 'b': sig[5]}, 'c1': {'a': sig[6], 'b': sig[7]}}
+            },
+            # Format as hex without leading zeros (except for 0x prefix)
+            'pubkey_hex': f"0x{compressed_x_a:x}{compressed_x_b:064x}",
+            'signature_hex': f"0x{signature_hex}"
+        }
+    
+    def _iter_register_validators_abi(self, data: bytes) -> Iterator[Dict[str, Any]]:
+        """Decode registerValidators calldata with the contract ABI (fallback for non-canonical encodings)"""
+        # Use contract ABI to decode the function input
+        func_obj, func_params = self.contract_interface.decode_function_input(data)
+        
+        # Extract the registrations array from decoded parameters
+        registrations_array = func_params.get('registrations', [])
+        
+        parsed = []
+        for i, registration in enumerate(registrations_array):
+            try:
+                pubkey_data = registration['pubkey']
+                signature_data = registration['signature']
+                words = [
+                    pubkey_data['x']['a'], pubkey_data['x']['b'], pubkey_data['y']['a'], pubkey_data['y']['b'],
+                    signature_data['x']['c0']['a'], signature_data['x']['c0']['b'],
+                    signature_data['x']['c1']['a'], signature_data['x']['c1']['b'],
+                    signature_data['y']['c0']['a'], signature_data['y']['c0']['b'],
+                    signature_data['y']['c1']['a'], signature_data['y']['c1']['b']
+                ]
+                parsed.append((i, words))
+            except Exception as e:
+                logger.warning(f"Error parsing registration {i}: {e}")
+                continue
+        
+        # One batch for the whole array, as on the fixed-stride path
+        compressed = BLSUtils.compress_g1_points(words for _, words in parsed)
+        for (i, words), pubkey in zip(parsed, compressed):
+            yield self._build_registration(i, words, ''.join(f"{word:064x}" for word in words[4:]), pubkey)
+    
+    def decode_function_call(self, calldata: Union[str, bytes]) -> Optional[Dict[str, Any]]:
+        """
+        Decode calldata of any function in the monitored contract ABIs
+        
+        Args:
+            calldata: Transaction input data as bytes or hex string
+            
+        Returns:
+            Decoded call ('function', 'contract_name', 'args'; registerValidators keeps its
+            registrations shape), or None if the function is not monitored or decoding fails
+        """
+        try:
+            return self.registry.decode(calldata)
+        except Exception as e:
+            logger.error(f"Error decoding function calldata: {e}")
+            return None
+    
+    def get_decoder_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-selector decode counts and latency"""
+        return self.registry.get_stats()
+    
+    def decode_transaction(self, transaction: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Decode registerValidators calldata of a transaction, reusing cached results
+        
+        Args:
+            transaction: Transaction data dict
+            
+        Returns:
+            Dict containing decoded parameters or None if decoding fails
+        """
+        calldata = transaction.get('input', '0x')
+        tx_hash = transaction.get('hash')
+        
+        if self.transaction_cache is None or not tx_hash:
+            return self.decode_register_validators_calldata(calldata)
+        
+        return self.transaction_cache.get_or_decode(
+            tx_hash, lambda: self.decode_register_validators_calldata(calldata)
+        )
+    
     def format_bls_pubkey(self, pubkey: Dict[str, Any], truncate: bool = True) -> str:
         """
         Format BLS public key for display using compressed form
@@ -400,7 +554,7 @@ class CalldataDecoder:
                     pubkey_display = reg['pubkey_hex']
                 else:
                     # Show truncated pubkey for console readability
-                    pubkey_display = self.format_bls_pubkey(reg['pubkey'], truncate=True)
+                    pubkey_display = f"{reg['pubkey_hex'][:10]}...{reg['pubkey_hex'][-8:]}"
                 formatted += f"     - Validator #{i+1}: {pubkey_display}\n"
             
             if decoded['validator_count'] > max_display:
@@ -432,9 +586,8 @@ class CalldataDecoder:
                 logger.debug(f"Transaction not sent to EigenLayerMiddleware: {to_address} vs {middleware_address}")
                 return None
             
-            # Decode the calldata
-            calldata = transaction.get('input', '0x')
-            decoded = self.decode_register_validators_calldata(calldata)
+            # Decode the calldata (shared with other consumers through the cache)
+            decoded = self.decode_transaction(transaction)
             
             if decoded:
                 return self.format_decoded_registrations(decoded, full_pubkeys=True)
@@ -1,11 +1,17 @@
 """Event processing logic"""
 
+import asyncio
+import inspect
 import logging
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+from hexbytes import HexBytes
 from web3 import Web3
 
-from .calldata_decoder import CalldataDecoder
+from .calldata_decoder import CalldataDecoder, RegistrationList
+from .event_router import EventHandler, Formatter, Predicate, LogPredicate
+from .monitored_event import MonitoredEvent
+from .transaction_cache import TransactionCache
 
 logger = logging.getLogger(__name__)
 
@@ -13,7 +19,8 @@ logger = logging.getLogger(__name__)
 class EventProcessor:
     """Processes and formats Registry events"""
     
-    def __init__(self, network_config: dict, eigenlayer_middleware_address: str = None, web3_client=None, enable_calldata_decoding: bool = True):
+    def __init__(self, network_config: dict, eigenlayer_middleware_address: str = None, web3_client=None, enable_calldata_decoding: bool = True,
+                 async_web3_client=None, transaction_cache: TransactionCache = None):
         """
         Initialize event processor
         
@@ -22,14 +29,23 @@ class EventProcessor:
             eigenlayer_middleware_address: EigenLayerMiddleware contract address for filtering
             web3_client: Web3Client instance for transaction fetching and calldata decoding
             enable_calldata_decoding: Whether to enable transaction calldata decoding
+            async_web3_client: Optional AsyncWeb3Client used for non-blocking transaction fetching
+            transaction_cache: Shared transaction cache (a private one is created if omitted)
         """
         self.network_config = network_config
         self.eigenlayer_middleware_address = eigenlayer_middleware_address.lower() if eigenlayer_middleware_address else None
+        # ABI word of the middleware address: 12 zero bytes followed by the 20 address bytes
+        self._middleware_word = bytes(12) + bytes(HexBytes(eigenlayer_middleware_address)) if eigenlayer_middleware_address else None
         self.web3_client = web3_client
+        self.async_web3_client = async_web3_client
         self.enable_calldata_decoding = enable_calldata_decoding
+        self.transaction_cache = transaction_cache if transaction_cache is not None else TransactionCache()
         
         # Initialize calldata decoder if web3_client is available and decoding is enabled
-        self.calldata_decoder = CalldataDecoder(web3_client.web3) if (web3_client and enable_calldata_decoding) else None
+        self.calldata_decoder = (
+            CalldataDecoder(web3_client.web3, transaction_cache=self.transaction_cache)
+            if (web3_client and enable_calldata_decoding) else None
+        )
         
         # SlashingType enum mapping
         self.slashing_types = {
@@ -51,8 +67,73 @@ class EventProcessor:
             1: "EIGENLAYER",
             2: "SYMBIOTIC"
         }
+        
+        # Predicate and formatter per (contract_name, event_name), shared with event routers
+        self.handlers: Dict[Tuple[str, str], EventHandler] = {}
+        self._register_default_handlers()
+    
+    def _register_default_handlers(self):
+        """Register the predicates and formatters of the built-in contract types"""
+        formatters = {
+            ('Registry', 'OperatorRegistered'): self._format_registry_operator_registered,
+            ('Registry', 'OperatorSlashed'): self._format_registry_operator_slashed,
+            ('Registry', 'OperatorUnregistered'): self._format_registry_operator_unregistered,
+            ('Registry', 'CollateralClaimed'): self._format_registry_collateral_claimed,
+            ('Registry', 'CollateralAdded'): self._format_registry_collateral_added,
+            ('Registry', 'OperatorOptedIn'): self._format_registry_operator_opted_in,
+            ('Registry', 'OperatorOptedOut'): self._format_registry_operator_opted_out,
+            ('TaiyiRegistryCoordinator', 'OperatorRegistered'): self._format_coordinator_operator_membership,
+            ('TaiyiRegistryCoordinator', 'OperatorDeregistered'): self._format_coordinator_operator_membership,
+            ('TaiyiRegistryCoordinator', 'OperatorStatusChanged'): self._format_coordinator_operator_status_changed,
+            ('TaiyiRegistryCoordinator', 'LinglongSubsetCreated'): self._format_coordinator_subset_created,
+            ('TaiyiRegistryCoordinator', 'OperatorAddedToSubset'): self._format_coordinator_subset_membership,
+            ('TaiyiRegistryCoordinator', 'OperatorRemovedFromSubset'): self._format_coordinator_subset_membership,
+            ('TaiyiRegistryCoordinator', 'SocketRegistryUpdated'): self._format_coordinator_registry_updated,
+            ('TaiyiRegistryCoordinator', 'PubkeyRegistryUpdated'): self._format_coordinator_registry_updated,
+            ('TaiyiRegistryCoordinator', 'OperatorSocketUpdate'): self._format_coordinator_socket_update,
+            ('TaiyiRegistryCoordinator', 'RestakingMiddlewareUpdated'): self._format_coordinator_middleware_updated,
+            ('TaiyiEscrow', 'Deposited'): self._format_escrow_deposited,
+            ('TaiyiEscrow', 'Withdrawn'): self._format_escrow_withdrawn,
+            ('TaiyiEscrow', 'PaymentMade'): self._format_escrow_payment_made,
+            ('TaiyiEscrow', 'RequestedWithdraw'): self._format_escrow_requested_withdraw,
+            ('EigenLayerAllocationManager', 'OperatorAddedToOperatorSet'): self._format_allocation_manager_operator_set,
+            ('EigenLayerAllocationManager', 'OperatorRemovedFromOperatorSet'): self._format_allocation_manager_operator_set
+        }
+        for (contract_name, event_name), formatter in formatters.items():
+            self.register_handler(contract_name, event_name, formatter=formatter)
+        
+        # For EigenLayer AllocationManager events, only process if AVS matches EigenLayerMiddleware
+        for event_name in ['OperatorAddedToOperatorSet', 'OperatorRemovedFromOperatorSet']:
+            self.register_handler('EigenLayerAllocationManager', event_name, predicate=self._is_middleware_operator_set,
+                                  log_predicate=self._is_middleware_operator_set_log)
+    
+    def register_handler(self, contract_name: str, event_name: str, formatter: Formatter = None,
+                         predicate: Predicate = None, log_predicate: LogPredicate = None):
+        """
+        Register how an event of a contract type is filtered and formatted
+        
+        Handlers are shared with every EventRouter built from self.handlers, so register
+        new contract types before the routers are built.
+        
+        Args:
+            contract_name: Contract type name, e.g. 'Registry'
+            event_name: Event name
+            formatter: Function or coroutine (args, event) returning the contract-specific message body
+            predicate: Function (event) returning False for events that should be skipped
+            log_predicate: Function (raw log) returning False for logs that should be skipped
+                before they are decoded; must agree with predicate
+        """
+        handler = self.handlers.get((contract_name, event_name))
+        if handler is None:
+            handler = self.handlers[(contract_name, event_name)] = EventHandler()
+        if formatter is not None:
+            handler.formatter = formatter
+        if predicate is not None:
+            handler.predicate = predicate
+        if log_predicate is not None:
+            handler.log_predicate = log_predicate
     
-    def should_process_event(self, event: Dict[str, Any]) -> bool:
+    def should_process_event(self, event: MonitoredEvent) -> bool:
         """
         Check if an event should be processed based on filtering criteria
         
@@ -62,35 +143,50 @@ class EventProcessor:
         Returns:
             bool: True if event should be processed, False otherwise
         """
-        contract_name = event.get('contract_name', 'Unknown')
+        handler = self.handlers.get((event.contract_name or 'Unknown', event.event))
+        if handler is None or handler.predicate is None:
+            return True
+        return handler.predicate(event)
+    
+    def _is_middleware_operator_set(self, event: Dict[str, Any]) -> bool:
+        """Whether an AllocationManager operator set event belongs to the EigenLayerMiddleware AVS"""
+        if not self.eigenlayer_middleware_address:
+            logger.warning("AllocationManager event detected but no EigenLayerMiddleware address configured for filtering")
+            return False
         
-        # For EigenLayer AllocationManager events, only process if AVS matches EigenLayerMiddleware
-        if contract_name == "EigenLayerAllocationManager":
-            if not self.eigenlayer_middleware_address:
-                logger.warning("AllocationManager event detected but no EigenLayerMiddleware address configured for filtering")
+        operator_set = event['args'].get('operatorSet')
+        if operator_set:
+            avs_address = operator_set.get('avs', '').lower()
+            if avs_address != self.eigenlayer_middleware_address:
+                logger.debug(f"Ignoring AllocationManager event for AVS {avs_address} (not EigenLayerMiddleware)")
                 return False
-                
-            event_name = event['event']
-            args = event['args']
-            
-            if event_name in ['OperatorAddedToOperatorSet', 'OperatorRemovedFromOperatorSet']:
-                operator_set = args.get('operatorSet')
-                if operator_set:
-                    avs_address = operator_set.get('avs', '').lower()
-                    if avs_address != self.eigenlayer_middleware_address:
-                        logger.debug(f"Ignoring AllocationManager event for AVS {avs_address} (not EigenLayerMiddleware)")
-                        return False
         
         return True
     
-    def format_event(self, event: Dict[str, Any]) -> str:
+    def _is_middleware_operator_set_log(self, log: Dict[str, Any]) -> bool:
+        """
+        Raw-log form of _is_middleware_operator_set
+        
+        operatorSet is a static (address avs, uint32 id) tuple and the only non-indexed
+        argument, so avs is always the first 32-byte word of the log data.
+        """
+        if self._middleware_word is None:
+            # Let the decoded predicate report the missing configuration
+            return True
+        
+        data = log['data']
+        if isinstance(data, str):
+            data = HexBytes(data)
+        return data[:32] == self._middleware_word
+    
+    async def format_event(self, event: MonitoredEvent) -> str:
         """Format an event for display"""
-        event_name = event['event']
-        args = event['args']
-        block_number = event['blockNumber']
-        tx_hash = event['transactionHash'].hex()
+        event_name = event.event
+        args = event.args
+        block_number = event.block_number
+        tx_hash = event.transaction_hash_hex
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        contract_name = event.get('contract_name', 'Unknown')
+        contract_name = event.contract_name or 'Unknown'
         
         # Get the correct block explorer URL for the network
         block_explorer = self.network_config['block_explorer']
@@ -99,20 +195,18 @@ class EventProcessor:
         formatted += f"🔥 EVENT DETECTED: {event_name}\n"
         formatted += f"⏰ Timestamp: {timestamp}\n"
         formatted += f"📦 Block: {block_number}\n"
+        if event.confirmation_status:
+            formatted += f"⏳ Status: {event.confirmation_status}\n"
         formatted += f"🔗 Transaction: {tx_hash}\n"
         formatted += f"🌐 Block Explorer: {block_explorer}/tx/{tx_hash}\n"
-        formatted += f"📄 Contract: {contract_name} ({event['address']})\n"
+        formatted += f"📄 Contract: {contract_name} ({event.address})\n"
         formatted += f"=={'='*76}==\n"
         
         # Contract-specific formatting
-        if contract_name == "Registry":
-            formatted += self._format_registry_event(event_name, args, event)
-        elif contract_name == "TaiyiRegistryCoordinator":
-            formatted += self._format_taiyi_registry_coordinator_event(event_name, args)
-        elif contract_name == "TaiyiEscrow":
-            formatted += self._format_taiyi_escrow_event(event_name, args)
-        elif contract_name == "EigenLayerAllocationManager":
-            formatted += self._format_eigenlayer_allocation_manager_event(event_name, args)
+        handler = self.handlers.get((contract_name, event_name))
+        if handler is not None and handler.formatter is not None:
+            body = handler.formatter(args, event)
+            formatted += await body if inspect.isawaitable(body) else body
         else:
             # Generic formatting for unknown contract types
             formatted += self._format_generic_event(args)
@@ -120,144 +214,139 @@ class EventProcessor:
         formatted += f"{'='*80}\n"
         return formatted
     
-    def _format_registry_event(self, event_name: str, args: Dict[str, Any], event: Dict[str, Any] = None) -> str:
-        """Format Registry contract events"""
-        formatted = ""
+    async def _format_registry_operator_registered(self, args: Dict[str, Any], event: Dict[str, Any]) -> str:
+        """Format Registry OperatorRegistered events"""
+        formatted = f"📝 Registration Root: {args['registrationRoot'].hex()}\n"
+        formatted += f"💰 Collateral: {Web3.from_wei(args['collateralWei'], 'ether')} ETH\n"
+        formatted += f"👤 Owner: {args['owner']}\n"
+        
+        # Add transaction analysis for OperatorRegistered events
+        if self.eigenlayer_middleware_address:
+            tx_analysis = await self._analyze_transaction_calldata(event)
+            if tx_analysis:
+                formatted += f"\n{tx_analysis}"
         
-        if event_name == "OperatorRegistered":
-            formatted += f"📝 Registration Root: {args['registrationRoot'].hex()}\n"
-            formatted += f"💰 Collateral: {Web3.from_wei(args['collateralWei'], 'ether')} ETH\n"
-            formatted += f"👤 Owner: {args['owner']}\n"
-            
-            # Add transaction analysis for OperatorRegistered events
-            if event and self.eigenlayer_middleware_address:
-                tx_analysis = self._analyze_transaction_calldata(event)
-                if tx_analysis:
-                    formatted += f"\n{tx_analysis}"
-            
-        elif event_name == "OperatorSlashed":
-            slashing_type = self.slashing_types.get(args['slashingType'], "Unknown")
-            formatted += f"⚡ Slashing Type: {slashing_type}\n"
-            formatted += f"📝 Registration Root: {args['registrationRoot'].hex()}\n"
-            formatted += f"👤 Owner: {args['owner']}\n"
-            formatted += f"🔍 Challenger: {args['challenger']}\n"
-            formatted += f"⚔️  Slasher: {args['slasher']}\n"
-            formatted += f"💸 Slashed Amount: {Web3.from_wei(args['slashAmountWei'], 'ether')} ETH\n"
-            
-        elif event_name == "OperatorUnregistered":
-            formatted += f"📝 Registration Root: {args['registrationRoot'].hex()}\n"
-            
-        elif event_name == "CollateralClaimed":
-            formatted += f"📝 Registration Root: {args['registrationRoot'].hex()}\n"
-            formatted += f"💰 Claimed Amount: {Web3.from_wei(args['collateralWei'], 'ether')} ETH\n"
-            
-        elif event_name == "CollateralAdded":
-            formatted += f"📝 Registration Root: {args['registrationRoot'].hex()}\n"
-            formatted += f"💰 Added Amount: {Web3.from_wei(args['collateralWei'], 'ether')} ETH\n"
-            
-        elif event_name == "OperatorOptedIn":
-            formatted += f"📝 Registration Root: {args['registrationRoot'].hex()}\n"
-            formatted += f"⚔️  Slasher: {args['slasher']}\n"
-            formatted += f"🔑 Committer: {args['committer']}\n"
-            
-        elif event_name == "OperatorOptedOut":
-            formatted += f"📝 Registration Root: {args['registrationRoot'].hex()}\n"
-            formatted += f"⚔️  Slasher: {args['slasher']}\n"
-            
         return formatted
     
-    def _format_taiyi_registry_coordinator_event(self, event_name: str, args: Dict[str, Any]) -> str:
-        """Format TaiyiRegistryCoordinator contract events"""
-        formatted = ""
-        
-        if event_name == "OperatorRegistered":
-            formatted += f"👤 Operator: {args['operator']}\n"
-            formatted += f"🆔 Operator ID: {args['operatorId'].hex()}\n"
-            formatted += f"📋 Linglong Subset IDs: {list(args['linglongSubsetIds'])}\n"
-            
-        elif event_name == "OperatorDeregistered":
-            formatted += f"👤 Operator: {args['operator']}\n"
-            formatted += f"🆔 Operator ID: {args['operatorId'].hex()}\n"
-            formatted += f"📋 Linglong Subset IDs: {list(args['linglongSubsetIds'])}\n"
-            
-        elif event_name == "OperatorStatusChanged":
-            prev_status = self.operator_statuses.get(args['previousStatus'], f"Unknown({args['previousStatus']})")
-            new_status = self.operator_statuses.get(args['newStatus'], f"Unknown({args['newStatus']})")
-            formatted += f"👤 Operator: {args['operator']}\n"
-            formatted += f"📊 Previous Status: {prev_status}\n"
-            formatted += f"📊 New Status: {new_status}\n"
-            
-        elif event_name == "LinglongSubsetCreated":
-            formatted += f"🆔 Linglong Subset ID: {args['linglongSubsetId']}\n"
-            formatted += f"💰 Minimum Stake: {Web3.from_wei(args['minStake'], 'ether')} ETH\n"
-            
-        elif event_name == "OperatorAddedToSubset":
-            formatted += f"👤 Operator: {args['operator']}\n"
-            formatted += f"🆔 Linglong Subset ID: {args['linglongSubsetId']}\n"
-            
-        elif event_name == "OperatorRemovedFromSubset":
-            formatted += f"👤 Operator: {args['operator']}\n"
-            formatted += f"🆔 Linglong Subset ID: {args['linglongSubsetId']}\n"
-            
-        elif event_name == "SocketRegistryUpdated":
-            formatted += f"🔄 Old Registry: {args['oldRegistry']}\n"
-            formatted += f"🔄 New Registry: {args['newRegistry']}\n"
-            
-        elif event_name == "PubkeyRegistryUpdated":
-            formatted += f"🔄 Old Registry: {args['oldRegistry']}\n"
-            formatted += f"🔄 New Registry: {args['newRegistry']}\n"
-            
-        elif event_name == "OperatorSocketUpdate":
-            formatted += f"🆔 Operator ID: {args['operatorId'].hex()}\n"
-            formatted += f"🔌 Socket: {args['socket']}\n"
-            
-        elif event_name == "RestakingMiddlewareUpdated":
-            protocol = self.restaking_protocols.get(args['restakingProtocol'], f"Unknown({args['restakingProtocol']})")
-            formatted += f"🔗 Restaking Protocol: {protocol}\n"
-            formatted += f"🔄 New Middleware: {args['newMiddleware']}\n"
-            
+    def _format_registry_operator_slashed(self, args: Dict[str, Any], event: Dict[str, Any]) -> str:
+        """Format Registry OperatorSlashed events"""
+        slashing_type = self.slashing_types.get(args['slashingType'], "Unknown")
+        formatted = f"⚡ Slashing Type: {slashing_type}\n"
+        formatted += f"📝 Registration Root: {args['registrationRoot'].hex()}\n"
+        formatted += f"👤 Owner: {args['owner']}\n"
+        formatted += f"🔍 Challenger: {args['challenger']}\n"
+        formatted += f"⚔️  Slasher: {args['slasher']}\n"
+        formatted += f"💸 Slashed Amount: {Web3.from_wei(args['slashAmountWei'], 'ether')} ETH\n"
         return formatted
     
-    def _format_taiyi_escrow_event(self, event_name: str, args: Dict[str, Any]) -> str:
-        """Format TaiyiEscrow contract events"""
-        formatted = ""
-        
-        if event_name == "Deposited":
-            formatted += f"👤 User: {args['user']}\n"
-            formatted += f"💰 Amount: {Web3.from_wei(args['amount'], 'ether')} ETH\n"
-            
-        elif event_name == "Withdrawn":
-            formatted += f"👤 User: {args['user']}\n"
-            formatted += f"💸 Amount: {Web3.from_wei(args['amount'], 'ether')} ETH\n"
-            
-        elif event_name == "PaymentMade":
-            execution_status = "✅ After Execution" if args['isAfterExec'] else "⏳ Pre-execution"
-            formatted += f"👤 From: {args['from']}\n"
-            formatted += f"💰 Amount: {Web3.from_wei(args['amount'], 'ether')} ETH\n"
-            formatted += f"📋 Status: {execution_status}\n"
-            
-        elif event_name == "RequestedWithdraw":
-            formatted += f"👤 User: {args['user']}\n"
-            formatted += f"💰 Requested Amount: {Web3.from_wei(args['amount'], 'ether')} ETH\n"
-        
+    def _format_registry_operator_unregistered(self, args: Dict[str, Any], event: Dict[str, Any]) -> str:
+        """Format Registry OperatorUnregistered events"""
+        return f"📝 Registration Root: {args['registrationRoot'].hex()}\n"
+    
+    def _format_registry_collateral_claimed(self, args: Dict[str, Any], event: Dict[str, Any]) -> str:
+        """Format Registry CollateralClaimed events"""
+        formatted = f"📝 Registration Root: {args['registrationRoot'].hex()}\n"
+        formatted += f"💰 Claimed Amount: {Web3.from_wei(args['collateralWei'], 'ether')} ETH\n"
         return formatted
     
-    def _format_eigenlayer_allocation_manager_event(self, event_name: str, args: Dict[str, Any]) -> str:
-        """Format EigenLayer AllocationManager contract events"""
-        formatted = ""
-        
-        if event_name == "OperatorAddedToOperatorSet":
-            operator_set = args['operatorSet']
-            formatted += f"👤 Operator: {args['operator']}\n"
-            formatted += f"🏢 AVS Address: {operator_set['avs']}\n"
-            formatted += f"🆔 Operator Set ID: {operator_set['id']}\n"
-            
-        elif event_name == "OperatorRemovedFromOperatorSet":
-            operator_set = args['operatorSet']
-            formatted += f"👤 Operator: {args['operator']}\n"
-            formatted += f"🏢 AVS Address: {operator_set['avs']}\n"
-            formatted += f"🆔 Operator Set ID: {operator_set['id']}\n"
-            
+    def _format_registry_collateral_added(self, args: Dict[str, Any], event: Dict[str, Any]) -> str:
+        """Format Registry CollateralAdded events"""
+        formatted = f"📝 Registration Root: {args['registrationRoot'].hex()}\n"
+        formatted += f"💰 Added Amount: {Web3.from_wei(args['collateralWei'], 'ether')} ETH\n"
+        return formatted
+    
+    def _format_registry_operator_opted_in(self, args: Dict[str, Any], event: Dict[str, Any]) -> str:
+        """Format Registry OperatorOptedIn events"""
+        formatted = f"📝 Registration Root: {args['registrationRoot'].hex()}\n"
+        formatted += f"⚔️  Slasher: {args['slasher']}\n"
+        formatted += f"🔑 Committer: {args['committer']}\n"
+        return formatted
+    
+    def _format_registry_operator_opted_out(self, args: Dict[str, Any], event: Dict[str, Any]) -> str:
+        """Format Registry OperatorOptedOut events"""
+        formatted = f"📝 Registration Root: {args['registrationRoot'].hex()}\n"
+        formatted += f"⚔️  Slasher: {args['slasher']}\n"
+        return formatted
+    
+    def _format_coordinator_operator_membership(self, args: Dict[str, Any], event: Dict[str, Any]) -> str:
+        """Format TaiyiRegistryCoordinator OperatorRegistered and OperatorDeregistered events"""
+        formatted = f"👤 Operator: {args['operator']}\n"
+        formatted += f"🆔 Operator ID: {args['operatorId'].hex()}\n"
+        formatted += f"📋 Linglong Subset IDs: {list(args['linglongSubsetIds'])}\n"
+        return formatted
+    
+    def _format_coordinator_operator_status_changed(self, args: Dict[str, Any], event: Dict[str, Any]) -> str:
+        """Format TaiyiRegistryCoordinator OperatorStatusChanged events"""
+        prev_status = self.operator_statuses.get(args['previousStatus'], f"Unknown({args['previousStatus']})")
+        new_status = self.operator_statuses.get(args['newStatus'], f"Unknown({args['newStatus']})")
+        formatted = f"👤 Operator: {args['operator']}\n"
+        formatted += f"📊 Previous Status: {prev_status}\n"
+        formatted += f"📊 New Status: {new_status}\n"
+        return formatted
+    
+    def _format_coordinator_subset_created(self, args: Dict[str, Any], event: Dict[str, Any]) -> str:
+        """Format TaiyiRegistryCoordinator LinglongSubsetCreated events"""
+        formatted = f"🆔 Linglong Subset ID: {args['linglongSubsetId']}\n"
+        formatted += f"💰 Minimum Stake: {Web3.from_wei(args['minStake'], 'ether')} ETH\n"
+        return formatted
+    
+    def _format_coordinator_subset_membership(self, args: Dict[str, Any], event: Dict[str, Any]) -> str:
+        """Format TaiyiRegistryCoordinator OperatorAddedToSubset and OperatorRemovedFromSubset events"""
+        formatted = f"👤 Operator: {args['operator']}\n"
+        formatted += f"🆔 Linglong Subset ID: {args['linglongSubsetId']}\n"
+        return formatted
+    
+    def _format_coordinator_registry_updated(self, args: Dict[str, Any], event: Dict[str, Any]) -> str:
+        """Format TaiyiRegistryCoordinator SocketRegistryUpdated and PubkeyRegistryUpdated events"""
+        formatted = f"🔄 Old Registry: {args['oldRegistry']}\n"
+        formatted += f"🔄 New Registry: {args['newRegistry']}\n"
+        return formatted
+    
+    def _format_coordinator_socket_update(self, args: Dict[str, Any], event: Dict[str, Any]) -> str:
+        """Format TaiyiRegistryCoordinator OperatorSocketUpdate events"""
+        formatted = f"🆔 Operator ID: {args['operatorId'].hex()}\n"
+        formatted += f"🔌 Socket: {args['socket']}\n"
+        return formatted
+    
+    def _format_coordinator_middleware_updated(self, args: Dict[str, Any], event: Dict[str, Any]) -> str:
+        """Format TaiyiRegistryCoordinator RestakingMiddlewareUpdated events"""
+        protocol = self.restaking_protocols.get(args['restakingProtocol'], f"Unknown({args['restakingProtocol']})")
+        formatted = f"🔗 Restaking Protocol: {protocol}\n"
+        formatted += f"🔄 New Middleware: {args['newMiddleware']}\n"
+        return formatted
+    
+    def _format_escrow_deposited(self, args: Dict[str, Any], event: Dict[str, Any]) -> str:
+        """Format TaiyiEscrow Deposited events"""
+        formatted = f"👤 User: {args['user']}\n"
+        formatted += f"💰 Amount: {Web3.from_wei(args['amount'], 'ether')} ETH\n"
+        return formatted
+    
+    def _format_escrow_withdrawn(self, args: Dict[str, Any], event: Dict[str, Any]) -> str:
+        """Format TaiyiEscrow Withdrawn events"""
+        formatted = f"👤 User: {args['user']}\n"
+        formatted += f"💸 Amount: {Web3.from_wei(args['amount'], 'ether')} ETH\n"
+        return formatted
+    
+    def _format_escrow_payment_made(self, args: Dict[str, Any], event: Dict[str, Any]) -> str:
+        """Format TaiyiEscrow PaymentMade events"""
+        execution_status = "✅ After Execution" if args['isAfterExec'] else "⏳ Pre-execution"
+        formatted = f"👤 From: {args['from']}\n"
+        formatted += f"💰 Amount: {Web3.from_wei(args['amount'], 'ether')} ETH\n"
+        formatted += f"📋 Status: {execution_status}\n"
+        return formatted
+    
+    def _format_escrow_requested_withdraw(self, args: Dict[str, Any], event: Dict[str, Any]) -> str:
+        """Format TaiyiEscrow RequestedWithdraw events"""
+        formatted = f"👤 User: {args['user']}\n"
+        formatted += f"💰 Requested Amount: {Web3.from_wei(args['amount'], 'ether')} ETH\n"
+        return formatted
+    
+    def _format_allocation_manager_operator_set(self, args: Dict[str, Any], event: Dict[str, Any]) -> str:
+        """Format EigenLayer AllocationManager OperatorAddedToOperatorSet and OperatorRemovedFromOperatorSet events"""
+        operator_set = args['operatorSet']
+        formatted = f"👤 Operator: {args['operator']}\n"
+        formatted += f"🏢 AVS Address: {operator_set['avs']}\n"
+        formatted += f"🆔 Operator Set ID: {operator_set['id']}\n"
         return formatted
     
     def _format_generic_event(self, args: Dict[str, Any]) -> str:
@@ -370,7 +459,27 @@ class EventProcessor:
             
         return message
     
-    def _analyze_transaction_calldata(self, event: Dict[str, Any]) -> Optional[str]:
+    async def _fetch_transaction(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a transaction through the shared cache without blocking the event loop
+        
+        Args:
+            tx_hash: Transaction hash as hex string
+            
+        Returns:
+            Transaction data dictionary or None if not found
+        """
+        return await self.transaction_cache.get_or_fetch(tx_hash, self._fetch_transaction_uncached)
+    
+    async def _fetch_transaction_uncached(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        """Fetch a transaction from the RPC node"""
+        if self.async_web3_client:
+            return await self.async_web3_client.get_transaction_by_hash(tx_hash)
+        
+        # Fall back to running the blocking client in a worker thread
+        return await asyncio.to_thread(self.web3_client.get_transaction_by_hash, tx_hash)
+    
+    async def _analyze_transaction_calldata(self, event: MonitoredEvent) -> Optional[str]:
         """
         Analyze transaction calldata for Registry events
         
@@ -385,17 +494,10 @@ class EventProcessor:
             return None
         
         try:
-            tx_hash = event.get('transactionHash')
-            if not tx_hash:
-                logger.debug("No transaction hash in event")
-                return None
-            
-            # Convert bytes to hex string if needed
-            if hasattr(tx_hash, 'hex'):
-                tx_hash = tx_hash.hex()
+            tx_hash = event.transaction_hash_hex
             
             # Fetch transaction details
-            transaction = self.web3_client.get_transaction_by_hash(tx_hash)
+            transaction = await self._fetch_transaction(tx_hash)
             if not transaction:
                 logger.debug(f"Could not fetch transaction {tx_hash}")
                 return None
@@ -411,7 +513,7 @@ class EventProcessor:
             logger.error(f"Error analyzing transaction calldata: {e}")
             return None
     
-    def get_operator_validator_mapping(self, event: Dict[str, Any]) -> Optional[tuple]:
+    async def get_operator_validator_mapping(self, event: MonitoredEvent) -> Optional[tuple]:
         """
         Extract operator address and validator public keys from Registry OperatorRegistered event
         
@@ -426,22 +528,14 @@ class EventProcessor:
             return None
         
         # Only process Registry OperatorRegistered events
-        if (event.get('contract_name') != 'Registry' or 
-            event.get('event') != 'OperatorRegistered'):
+        if event.contract_name != 'Registry' or event.event != 'OperatorRegistered':
             return None
         
         try:
-            tx_hash = event.get('transactionHash')
-            if not tx_hash:
-                logger.debug("No transaction hash in event")
-                return None
-            
-            # Convert bytes to hex string if needed
-            if hasattr(tx_hash, 'hex'):
-                tx_hash = tx_hash.hex()
+            tx_hash = event.transaction_hash_hex
             
             # Fetch transaction details
-            transaction = self.web3_client.get_transaction_by_hash(tx_hash)
+            transaction = await self._fetch_transaction(tx_hash)
             if not transaction:
                 logger.debug(f"Could not fetch transaction {tx_hash}")
                 return None
@@ -459,20 +553,23 @@ class EventProcessor:
                 logger.debug(f"Transaction not sent to EigenLayerMiddleware: {to_address}")
                 return None
             
-            # Decode calldata to extract validator public keys
-            calldata = transaction.get('input', '0x')
-            decoded = self.calldata_decoder.decode_register_validators_calldata(calldata)
+            # Decode calldata to extract validator public keys (shared with format_event through the cache)
+            decoded = self.calldata_decoder.decode_transaction(transaction)
             
             if not decoded or not decoded.get('registrations'):
                 logger.debug("No registerValidators calldata found or no registrations")
                 return None
             
-            # Extract validator public keys
-            validator_pubkeys = []
-            for registration in decoded['registrations']:
-                pubkey_hex = registration.get('pubkey_hex')
-                if pubkey_hex:
-                    validator_pubkeys.append(pubkey_hex)
+            # Extract validator public keys, compressed as one batch for lazily decoded calldata
+            registrations = decoded['registrations']
+            if isinstance(registrations, RegistrationList):
+                validator_pubkeys = list(registrations.pubkey_hexes())
+            else:
+                validator_pubkeys = []
+                for registration in registrations:
+                    pubkey_hex = registration.get('pubkey_hex')
+                    if pubkey_hex:
+                        validator_pubkeys.append(pubkey_hex)
             
             if not validator_pubkeys:
                 logger.debug("No validator public keys found in calldata")
@@ -0,0 +1,113 @@
+"""Compiled routing of logs and events to their handlers"""
+
+import logging
+from typing import List, Dict, Any, Optional, Callable, Tuple, Union, Awaitable
+
+from eth_utils import event_abi_to_log_topic
+from hexbytes import HexBytes
+
+from .contract_interface import ContractInterface
+
+logger = logging.getLogger(__name__)
+
+# Formatters may be plain functions or coroutines returning the contract-specific message body
+Formatter = Callable[[Dict[str, Any], Dict[str, Any]], Union[str, Awaitable[str]]]
+Predicate = Callable[[Dict[str, Any]], bool]
+# Raw-log predicates see the undecoded log (address, topics, data) and run before ABI decoding
+LogPredicate = Callable[[Dict[str, Any]], bool]
+
+
+def address_key(address: Union[str, bytes]) -> bytes:
+    """20-byte key of an address given as (checksum) hex string or bytes"""
+    return bytes(HexBytes(address))
+
+
+class EventHandler:
+    """Filter predicates and formatter registered for one event of a contract type"""
+    
+    __slots__ = ('predicate', 'formatter', 'log_predicate')
+    
+    def __init__(self, predicate: Optional[Predicate] = None, formatter: Optional[Formatter] = None,
+                 log_predicate: Optional[LogPredicate] = None):
+        self.predicate = predicate
+        self.formatter = formatter
+        self.log_predicate = log_predicate
+
+
+class EventRoute:
+    """Handler record for one (address, topic0) pair"""
+    
+    __slots__ = ('contract', 'event_name', 'topic0', 'decoder', 'handler')
+    
+    def __init__(self, contract: ContractInterface, event_name: str, topic0: bytes, decoder: Any,
+                 handler: Optional[EventHandler] = None):
+        self.contract = contract
+        self.event_name = event_name
+        self.topic0 = topic0
+        # web3 ContractEvent used to decode matching logs
+        self.decoder = decoder
+        self.handler = handler
+    
+    @property
+    def predicate(self) -> Optional[Predicate]:
+        """Filter predicate of the registered handler, if any"""
+        return self.handler.predicate if self.handler else None
+    
+    @property
+    def formatter(self) -> Optional[Formatter]:
+        """Formatter of the registered handler, if any"""
+        return self.handler.formatter if self.handler else None
+    
+    @property
+    def log_predicate(self) -> Optional[LogPredicate]:
+        """Raw-log predicate of the registered handler, if any"""
+        return self.handler.log_predicate if self.handler else None
+
+
+class EventRouter:
+    """Maps (address, topic0) of raw logs and (address, event) of decoded events to their route"""
+    
+    def __init__(self, contracts: List[ContractInterface],
+                 handlers: Optional[Dict[Tuple[str, str], EventHandler]] = None):
+        """
+        Compile routes for the given contracts
+        
+        Args:
+            contracts: Contracts whose monitored event types are routed
+            handlers: Handlers keyed by (contract_name, event_name), e.g. EventProcessor.handlers
+        """
+        self.contracts = contracts
+        self.handlers = handlers if handlers is not None else {}
+        self.routes: Dict[Tuple[bytes, bytes], EventRoute] = {}
+        self._routes_by_event: Dict[Tuple[bytes, str], EventRoute] = {}
+        
+        for contract in contracts:
+            self.add_contract(contract)
+        
+        logger.debug(f"Event router compiled {len(self.routes)} routes for {len(contracts)} contracts")
+    
+    def add_contract(self, contract: ContractInterface):
+        """Compile the routes of one contract"""
+        address = address_key(contract.contract_address)
+        for event_name in contract.get_event_types():
+            if not hasattr(contract.contract.events, event_name):
+                logger.warning(f"Event type '{event_name}' not found in {contract.contract_name} contract")
+                continue
+            
+            decoder = getattr(contract.contract.events, event_name)()
+            topic0 = bytes(event_abi_to_log_topic(decoder.abi))
+            route = EventRoute(contract, event_name, topic0, decoder,
+                               self.handlers.get((contract.contract_name, event_name)))
+            self.routes[(address, topic0)] = route
+            self._routes_by_event[(address, event_name)] = route
+    
+    def route_log(self, log: Dict[str, Any]) -> Optional[EventRoute]:
+        """Route a raw log by its address and first topic"""
+        topics = log.get('topics')
+        if not topics:
+            return None
+        return self.routes.get((address_key(log['address']), bytes(HexBytes(topics[0]))))
+    
+    def route_event(self, event: Dict[str, Any]) -> Optional[EventRoute]:
+        """Route an already decoded event by its address and event name"""
+        return self._routes_by_event.get((address_key(event['address']), event['event']))
@@ -0,0 +1,179 @@
+"""Selector-indexed decoding of monitored contract function calls"""
+
+import logging
+import time
+from typing import Dict, Any, Optional, List, Callable, Union
+
+from eth_abi import decode as abi_decode
+from eth_utils.abi import function_abi_to_4byte_selector, get_abi_input_types
+
+from ..config import REGISTRY_CONTRACT_ABI, TAIYI_REGISTRY_COORDINATOR_ABI, TAIYI_ESCROW_ABI, TAIYI_CORE_ABI, EIGENLAYER_MIDDLEWARE_ABI, EIGENLAYER_ALLOCATION_MANAGER_ABI
+
+logger = logging.getLogger(__name__)
+
+# Contract ABIs whose functions are decoded by default, keyed by contract type name
+DEFAULT_CONTRACT_ABIS = {
+    'Registry': REGISTRY_CONTRACT_ABI,
+    'TaiyiRegistryCoordinator': TAIYI_REGISTRY_COORDINATOR_ABI,
+    'TaiyiEscrow': TAIYI_ESCROW_ABI,
+    'TaiyiCore': TAIYI_CORE_ABI,
+    'EigenLayerMiddleware': EIGENLAYER_MIDDLEWARE_ABI,
+    'EigenLayerAllocationManager': EIGENLAYER_ALLOCATION_MANAGER_ABI
+}
+
+# Custom decoders receive the full calldata bytes (selector included)
+CustomDecoder = Callable[[bytes], Optional[Dict[str, Any]]]
+
+
+def calldata_bytes(calldata: Union[str, bytes]) -> bytes:
+    """Transaction input as bytes, accepting bytes or hex with or without 0x"""
+    if isinstance(calldata, (bytes, bytearray)):
+        return bytes(calldata)
+    return bytes.fromhex(calldata[2:] if calldata.startswith('0x') else calldata)
+
+
+def _named(inputs: List[Dict[str, Any]], values: tuple) -> Dict[str, Any]:
+    """Attach ABI parameter names to decoded values, recursing into tuples"""
+    return {param['name']: _named_value(param, value) for param, value in zip(inputs, values)}
+
+
+def _named_value(param: Dict[str, Any], value: Any) -> Any:
+    if not param['type'].startswith('tuple'):
+        return value
+    if param['type'] == 'tuple':
+        return _named(param['components'], value)
+    # tuple[] or tuple[k]
+    element = dict(param, type='tuple')
+    return [_named_value(element, item) for item in value]
+
+
+class FunctionDecoder:
+    """Compiled decoder and latency counters for one function selector"""
+    
+    __slots__ = ('contract_name', 'name', 'selector', 'inputs', 'types', 'custom', 'calls', 'errors',
+                 'total_seconds', 'max_seconds')
+    
+    def __init__(self, contract_name: str, abi: Dict[str, Any], custom: Optional[CustomDecoder] = None):
+        """
+        Args:
+            contract_name: Contract type the function belongs to
+            abi: Function ABI entry
+            custom: Optional decoder replacing the generic ABI decode
+        """
+        self.contract_name = contract_name
+        self.name = abi['name']
+        self.selector = function_abi_to_4byte_selector(abi)
+        self.inputs = abi.get('inputs', [])
+        self.types = get_abi_input_types(abi)
+        self.custom = custom
+        self.calls = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+    
+    def decode(self, data: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Decode calldata whose selector matches this function
+        
+        Args:
+            data: Full calldata bytes
+        
+        Returns:
+            Decoded call, or None if the calldata could not be decoded
+        """
+        started = time.perf_counter()
+        result = None
+        try:
+            if self.custom is not None:
+                result = self.custom(data)
+            else:
+                result = {
+                    'function': self.name,
+                    'contract_name': self.contract_name,
+                    'args': _named(self.inputs, abi_decode(self.types, data[4:]))
+                }
+            return result
+        except Exception as e:
+            logger.debug(f"Error decoding {self.contract_name}.{self.name} calldata: {e}")
+            return None
+        finally:
+            if result is None:
+                self.errors += 1
+            elapsed = time.perf_counter() - started
+            self.calls += 1
+            self.total_seconds += elapsed
+            self.max_seconds = max(self.max_seconds, elapsed)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Decode count, errors and latency of this selector"""
+        return {
+            'function': f"{self.contract_name}.{self.name}",
+            'calls': self.calls,
+            'errors': self.errors,
+            'avg_ms': round(self.total_seconds / self.calls * 1000, 3) if self.calls else 0.0,
+            'max_ms': round(self.max_seconds * 1000, 3)
+        }
+
+
+class FunctionDecoderRegistry:
+    """bytes4 selector → compiled decoder table over the monitored contract ABIs"""
+    
+    def __init__(self, contract_abis: Optional[Dict[str, List[Dict[str, Any]]]] = None):
+        """
+        Build the selector table
+        
+        Args:
+            contract_abis: ABIs keyed by contract type name, defaults to every ABI in config.contract_abi
+        """
+        self.decoders: Dict[bytes, FunctionDecoder] = {}
+        for contract_name, abi in (contract_abis or DEFAULT_CONTRACT_ABIS).items():
+            for entry in abi:
+                if entry.get('type') == 'function':
+                    self.register(contract_name, entry)
+        
+        logger.debug(f"Function decoder registry built with {len(self.decoders)} selectors")
+    
+    def register(self, contract_name: str, abi: Dict[str, Any], custom: Optional[CustomDecoder] = None) -> FunctionDecoder:
+        """
+        Register (or replace) the decoder of a function
+        
+        Args:
+            contract_name: Contract type the function belongs to
+            abi: Function ABI entry
+            custom: Optional decoder replacing the generic ABI decode
+        
+        Returns:
+            The registered decoder
+        """
+        decoder = FunctionDecoder(contract_name, abi, custom)
+        existing = self.decoders.get(decoder.selector)
+        if existing is not None and (existing.contract_name, existing.name) != (contract_name, decoder.name):
+            logger.warning(f"Selector 0x{decoder.selector.hex()} of {contract_name}.{decoder.name} "
+                           f"replaces {existing.contract_name}.{existing.name}")
+        self.decoders[decoder.selector] = decoder
+        return decoder
+    
+    def lookup(self, data: bytes) -> Optional[FunctionDecoder]:
+        """Decoder for the selector of raw calldata, or None if the function is not monitored"""
+        return self.decoders.get(data[:4]) if len(data) >= 4 else None
+    
+    def decode(self, calldata: Union[str, bytes]) -> Optional[Dict[str, Any]]:
+        """
+        Decode calldata of any monitored function
+        
+        Args:
+            calldata: Transaction input as bytes or hex string
+        
+        Returns:
+            Decoded call, or None if the function is not monitored or decoding failed
+        """
+        data = calldata_bytes(calldata)
+        decoder = self.lookup(data)
+        if decoder is None:
+            return None
+        return decoder.decode(data)
+    
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-selector decode statistics for selectors that were used"""
+        return {f"0x{selector.hex()}": decoder.get_stats()
+                for selector, decoder in self.decoders.items() if decoder.calls}
@@ -0,0 +1,139 @@
+"""Local demultiplexing and decoding of raw logs across monitored contracts"""
+
+import logging
+from typing import List, Dict, Any, Optional
+
+from eth_utils import to_checksum_address
+from hexbytes import HexBytes
+from web3.datastructures import AttributeDict
+
+from .contract_interface import ContractInterface
+from .event_router import EventRouter
+from .monitored_event import MonitoredEvent
+
+logger = logging.getLogger(__name__)
+
+
+def _quantity(value) -> int:
+    """Convert a JSON-RPC quantity (hex string or int) to int"""
+    return int(value, 16) if isinstance(value, str) else value
+
+
+def normalize_log(raw: Dict[str, Any]) -> AttributeDict:
+    """
+    Convert a raw JSON-RPC log (e.g. from an eth_subscription notification) to the
+    shape web3's eth.get_logs returns, so it can be decoded the same way
+    
+    Args:
+        raw: Log object with hex-encoded fields
+    
+    Returns:
+        Log with int quantities and HexBytes data
+    """
+    return AttributeDict({
+        'address': to_checksum_address(raw['address']),
+        'topics': [HexBytes(topic) for topic in raw['topics']],
+        'data': HexBytes(raw['data']),
+        'blockNumber': _quantity(raw['blockNumber']),
+        'transactionIndex': _quantity(raw['transactionIndex']),
+        'logIndex': _quantity(raw['logIndex']),
+        'blockHash': HexBytes(raw['blockHash']),
+        'transactionHash': HexBytes(raw['transactionHash']),
+        'removed': raw.get('removed', False)
+    })
+
+
+class LogDecoder:
+    """Decodes raw logs through a compiled (address, topic0) routing table"""
+    
+    def __init__(self, contracts: List[ContractInterface], router: Optional[EventRouter] = None):
+        """
+        Build the decoding table for the given contracts
+        
+        Args:
+            contracts: Contracts whose monitored event types should be decoded
+            router: Router compiled for exactly these contracts, built if not given
+        """
+        self.contracts = contracts
+        self.router = router or EventRouter(contracts)
+        self.decoded = 0
+        self.prefiltered = 0
+        
+        topics = []
+        for route in self.router.routes.values():
+            if route.topic0 not in topics:
+                topics.append(route.topic0)
+        
+        self.addresses = [contract.contract_address for contract in contracts]
+        self.topics = [HexBytes(topic).to_0x_hex() for topic in topics]
+        # (address, topic0) streams covered by the decoder, in the log cache's key format
+        self.streams = [(route.contract.contract_address.lower(), HexBytes(route.topic0).to_0x_hex())
+                        for route in self.router.routes.values()]
+        
+        logger.debug(f"Log decoder built for {len(self.addresses)} contracts and {len(self.topics)} event topics")
+    
+    def build_filter_params(self, from_block: int, to_block: int) -> Dict[str, Any]:
+        """
+        Build eth_getLogs parameters covering every monitored address and event topic
+        
+        Args:
+            from_block: Starting block number
+            to_block: Ending block number
+        
+        Returns:
+            Filter parameters dictionary
+        """
+        return {
+            'fromBlock': from_block,
+            'toBlock': to_block,
+            'address': self.addresses,
+            'topics': [self.topics]
+        }
+    
+    def build_subscription_params(self) -> Dict[str, Any]:
+        """Build eth_subscribe logs parameters covering every monitored address and event topic"""
+        return {
+            'address': self.addresses,
+            'topics': [self.topics]
+        }
+    
+    def decode_log(self, log: Dict[str, Any]) -> Optional[MonitoredEvent]:
+        """
+        Decode a raw log into an event record annotated with its contract
+        
+        Args:
+            log: Raw log as returned by eth_getLogs
+        
+        Returns:
+            Event record, or None if the log does not belong to a monitored event
+        """
+        route = self.router.route_log(log)
+        if route is None:
+            return None
+        
+        # Skip the ABI decode entirely for logs the handler would filter out anyway
+        log_predicate = route.log_predicate
+        if log_predicate is not None and not log_predicate(log):
+            self.prefiltered += 1
+            return None
+        
+        self.decoded += 1
+        try:
+            return MonitoredEvent.from_event(route.decoder.process_log(log), route.contract.contract_name,
+                                             route.contract.contract_address)
+        except Exception as e:
+            logger.warning(f"Error decoding {route.contract.contract_name}.{route.event_name} log: {e}")
+            return None
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Logs decoded versus logs discarded by raw-log predicates before decoding"""
+        return {'decoded': self.decoded, 'prefiltered': self.prefiltered}
+    
+    def decode_logs(self, logs: List[Dict[str, Any]]) -> List[MonitoredEvent]:
+        """Decode a list of raw logs, dropping logs that are not monitored"""
+        events = []
+        for log in logs:
+            event = self.decode_log(log)
+            if event is not None:
+                events.append(event)
+        return events
@@ -0,0 +1,130 @@
+"""Normalized record of a decoded contract event"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Optional
+
+from hexbytes import HexBytes
+
+
+def _to_bytes(value) -> bytes:
+    """Canonical bytes for a hash given as HexBytes, bytes or hex string"""
+    if type(value) is bytes:
+        return value
+    return bytes(HexBytes(value))
+
+
+@dataclass(slots=True, eq=False)
+class MonitoredEvent(Mapping):
+    """
+    Decoded event created once at ingestion and passed through every stage
+    
+    Hashes are kept as plain bytes and quantities as ints; hex strings are only
+    built on first use and then cached. The record also reads like the web3 event
+    dictionary it replaces (event['blockNumber'], event.get('contract_name')), so
+    code written against dict events keeps working.
+    """
+    
+    event: str
+    args: Dict[str, Any]
+    address: str
+    block_number: int
+    block_hash: bytes
+    transaction_hash: bytes
+    transaction_index: int
+    log_index: int
+    contract_name: Optional[str] = None
+    contract_address: Optional[str] = None
+    confirmation_status: Optional[str] = None
+    _block_hash_hex: Optional[str] = field(default=None, repr=False)
+    _transaction_hash_hex: Optional[str] = field(default=None, repr=False)
+    
+    @classmethod
+    def from_event(cls, event: Dict[str, Any], contract_name: Optional[str] = None,
+                   contract_address: Optional[str] = None) -> 'MonitoredEvent':
+        """
+        Build a record from a web3 event (AttributeDict or dict)
+        
+        Args:
+            event: Decoded event as returned by web3 process_log or get_new_entries
+            contract_name: Name of the contract type that emitted the event
+            contract_address: Address of the monitored contract
+        
+        Returns:
+            Normalized event record
+        """
+        return cls(
+            event=event['event'],
+            args=event['args'],
+            address=event['address'],
+            block_number=event['blockNumber'],
+            block_hash=_to_bytes(event['blockHash']),
+            transaction_hash=_to_bytes(event['transactionHash']),
+            transaction_index=event['transactionIndex'],
+            log_index=event['logIndex'],
+            contract_name=contract_name if contract_name is not None else event.get('contract_name'),
+            contract_address=contract_address if contract_address is not None else event.get('contract_address')
+        )
+    
+    @property
+    def block_hash_hex(self) -> str:
+        """Block hash as hex without 0x prefix, cached"""
+        if self._block_hash_hex is None:
+            self._block_hash_hex = self.block_hash.hex()
+        return self._block_hash_hex
+    
+    @property
+    def transaction_hash_hex(self) -> str:
+        """Transaction hash as hex without 0x prefix, cached"""
+        if self._transaction_hash_hex is None:
+            self._transaction_hash_hex = self.transaction_hash.hex()
+        return self._transaction_hash_hex
+    
+    @property
+    def key(self) -> tuple:
+        """Identity of the log within its block: (blockHash, transactionHash, logIndex)"""
+        return (self.block_hash, self.transaction_hash, self.log_index)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dictionary in web3 event shape, e.g. for serialization"""
+        return {name: self[name] for name in self}
+    
+    def __getitem__(self, name: str) -> Any:
+        attribute = _FIELDS.get(name)
+        if attribute is None:
+            raise KeyError(name)
+        value = getattr(self, attribute)
+        if value is None and name in _OPTIONAL_FIELDS:
+            raise KeyError(name)
+        return value
+    
+    def __setitem__(self, name: str, value: Any):
+        attribute = _FIELDS.get(name)
+        if attribute is None:
+            raise KeyError(name)
+        setattr(self, attribute, value)
+    
+    def __iter__(self) -> Iterator[str]:
+        return (name for name in _FIELDS if name not in _OPTIONAL_FIELDS or getattr(self, _FIELDS[name]) is not None)
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+# Dictionary keys of the web3 event shape and the record attributes they map to
+_FIELDS = {
+    'event': 'event',
+    'args': 'args',
+    'address': 'address',
+    'blockNumber': 'block_number',
+    'blockHash': 'block_hash',
+    'transactionHash': 'transaction_hash',
+    'transactionIndex': 'transaction_index',
+    'logIndex': 'log_index',
+    'contract_name': 'contract_name',
+    'contract_address': 'contract_address',
+    'confirmation_status': 'confirmation_status'
+}
+
+# Keys that read as missing while unset, as they would on a dict that was never annotated
+_OPTIONAL_FIELDS = frozenset({'contract_name', 'contract_address', 'confirmation_status'})
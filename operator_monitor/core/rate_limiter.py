@@ -0,0 +1,68 @@
+"""Token bucket rate limiting for asyncio callers"""
+
+import asyncio
+import time
+from typing import Optional
+
+
+class AsyncRateLimiter:
+    """Token bucket limiter; callers await acquire() before each request"""
+    
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Initialize rate limiter
+        
+        Args:
+            rate: Sustained requests per second (0 or less disables limiting)
+            burst: Maximum tokens accumulated while idle (defaults to max(1, rate))
+        """
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self._resume_at = 0.0
+        self.waits = 0
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether the limiter restricts anything"""
+        return self.rate > 0
+    
+    def _refill(self):
+        """Add the tokens earned since the last update"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def defer(self, seconds: float):
+        """Hold every caller for the given seconds, e.g. after a server sent Retry-After"""
+        self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+    
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        if not self.enabled and self._resume_at <= time.monotonic():
+            return
+        
+        # The lock serializes waiters so tokens are handed out in FIFO order
+        async with self._lock:
+            delay = self._resume_at - time.monotonic()
+            if delay > 0:
+                self.waits += 1
+                await asyncio.sleep(delay)
+            if not self.enabled:
+                return
+            
+            self._refill()
+            if self._tokens < 1:
+                self.waits += 1
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
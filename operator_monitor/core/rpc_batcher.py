@@ -0,0 +1,107 @@
+"""JSON-RPC request batching"""
+
+import asyncio
+import logging
+from typing import List, Tuple, Any, Optional, Callable, Awaitable, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class RpcBatchError(Exception):
+    """Raised for a JSON-RPC error returned inside a batch response"""
+
+
+class RpcBatcher:
+    """Coalesces JSON-RPC calls made within a short window into one batch request"""
+    
+    def __init__(self, send_batch: Callable[[List[Tuple[str, Any]]], Awaitable[List[Dict[str, Any]]]],
+                 window: float = 0.01, max_batch_size: int = 50):
+        """
+        Initialize request batcher
+        
+        Args:
+            send_batch: Coroutine that sends (method, params) pairs as one JSON-RPC
+                batch array and returns the responses in request order
+            window: Seconds to wait for more requests before sending a batch
+            max_batch_size: Send immediately once this many requests are queued
+        """
+        self.send_batch = send_batch
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._pending: List[Tuple[str, Any, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._inflight = set()
+        self.batches_sent = 0
+        self.requests_sent = 0
+    
+    async def request(self, method: str, params: Any) -> Any:
+        """
+        Queue a JSON-RPC call and wait for its result
+        
+        Args:
+            method: JSON-RPC method name
+            params: JSON-RPC params list
+        
+        Returns:
+            The raw (unformatted) JSON-RPC result
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((method, params, future))
+        
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._flush)
+        
+        return await future
+    
+    def _flush(self):
+        """Send everything queued so far as one batch"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        
+        if not self._pending:
+            return
+        
+        batch, self._pending = self._pending, []
+        task = asyncio.ensure_future(self._send(batch))
+        # Keep a reference so the task is not garbage collected mid-flight
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+    
+    async def _send(self, batch: List[Tuple[str, Any, asyncio.Future]]):
+        """Send one batch and resolve the future of every request in it"""
+        try:
+            responses = await self.send_batch([(method, params) for method, params, _ in batch])
+            if not isinstance(responses, list) or len(responses) != len(batch):
+                raise RpcBatchError(f"Malformed batch response for {len(batch)} requests: {responses}")
+        except BaseException as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            logger.warning(f"JSON-RPC batch of {len(batch)} requests failed: {e}")
+            return
+        
+        self.batches_sent += 1
+        self.requests_sent += len(batch)
+        logger.debug(f"Sent JSON-RPC batch of {len(batch)} requests")
+        
+        for (method, _, future), response in zip(batch, responses):
+            if future.done():
+                continue
+            if response.get('error'):
+                future.set_exception(RpcBatchError(f"{method} failed: {response['error']}"))
+            else:
+                future.set_result(response.get('result'))
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get batching statistics"""
+        return {
+            'batches_sent': self.batches_sent,
+            'requests_sent': self.requests_sent,
+            'average_batch_size': round(self.requests_sent / self.batches_sent, 2) if self.batches_sent else 0
+        }
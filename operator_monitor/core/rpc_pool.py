@@ -0,0 +1,262 @@
+"""Latency-aware routing across multiple RPC endpoints"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import List, Optional, Dict, Any, Callable, Awaitable, TypeVar
+
+import aiohttp
+
+from .rate_limiter import AsyncRateLimiter
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Errors that indicate the endpoint itself is misbehaving rather than the request
+TRANSPORT_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, ConnectionError, OSError)
+
+
+class RpcEndpoint:
+    """Rolling latency and error statistics for a single RPC endpoint"""
+    
+    def __init__(self, url: str, web3, alpha: float = 0.2, sample_size: int = 200, rate_limit: float = 0):
+        """
+        Initialize endpoint statistics
+        
+        Args:
+            url: RPC URL of the endpoint
+            web3: AsyncWeb3 instance bound to this endpoint
+            alpha: Smoothing factor for the EWMA latency and error rate
+            sample_size: Number of recent latency samples kept for percentiles
+            rate_limit: Maximum requests per second sent to this endpoint (0 for unlimited)
+        """
+        self.url = url
+        self.web3 = web3
+        self.rate_limiter = AsyncRateLimiter(rate_limit)
+        self.alpha = alpha
+        self.ewma_latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.latencies = deque(maxlen=sample_size)
+        self.consecutive_failures = 0
+        self.healthy = True
+        self.total_requests = 0
+        self.total_errors = 0
+    
+    def record_success(self, latency: float):
+        """Record a successful request and its latency in seconds"""
+        self.total_requests += 1
+        self.consecutive_failures = 0
+        self.latencies.append(latency)
+        if self.ewma_latency is None:
+            self.ewma_latency = latency
+        else:
+            self.ewma_latency = self.alpha * latency + (1 - self.alpha) * self.ewma_latency
+        self.error_rate = (1 - self.alpha) * self.error_rate
+    
+    def record_failure(self):
+        """Record a failed request"""
+        self.total_requests += 1
+        self.total_errors += 1
+        self.consecutive_failures += 1
+        self.error_rate = self.alpha + (1 - self.alpha) * self.error_rate
+    
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        """Return the given latency percentile over recent samples"""
+        if not self.latencies:
+            return None
+        
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * percentile / 100))
+        return ordered[index]
+    
+    @property
+    def score(self) -> float:
+        """Routing score, lower is better; unmeasured endpoints sort last"""
+        if self.ewma_latency is None:
+            return float('inf')
+        return self.ewma_latency * (1 + self.error_rate)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get endpoint statistics"""
+        return {
+            'url': self.url,
+            'healthy': self.healthy,
+            'ewma_latency_ms': round(self.ewma_latency * 1000, 2) if self.ewma_latency is not None else None,
+            'error_rate': round(self.error_rate, 4),
+            'total_requests': self.total_requests,
+            'total_errors': self.total_errors,
+            'rate_limited_waits': self.rate_limiter.waits
+        }
+
+
+class RpcEndpointPool:
+    """Routes RPC calls to the fastest healthy endpoint with optional hedging"""
+    
+    def __init__(self, endpoints: List[RpcEndpoint], hedge_enabled: bool = False, hedge_percentile: float = 95,
+                 default_hedge_delay: float = 0.5, min_hedge_samples: int = 20, failure_threshold: int = 3,
+                 max_error_rate: float = 0.5, probe_interval: int = 30):
+        """
+        Initialize endpoint pool
+        
+        Args:
+            endpoints: Endpoints in order of preference
+            hedge_enabled: Whether to send a duplicate request to a second endpoint
+            hedge_percentile: Latency percentile of the primary endpoint used as the hedge delay
+            default_hedge_delay: Hedge delay in seconds until enough samples are collected
+            min_hedge_samples: Samples required before the percentile delay is used
+            failure_threshold: Consecutive failures before an endpoint is dropped
+            max_error_rate: Error rate above which an endpoint is dropped
+            probe_interval: Seconds between background probes of the endpoints
+        """
+        if not endpoints:
+            raise ValueError("At least one RPC endpoint is required")
+        
+        self.endpoints = endpoints
+        self.hedge_enabled = hedge_enabled
+        self.hedge_percentile = hedge_percentile
+        self.default_hedge_delay = default_hedge_delay
+        self.min_hedge_samples = min_hedge_samples
+        self.failure_threshold = failure_threshold
+        self.max_error_rate = max_error_rate
+        self.probe_interval = probe_interval
+        self.hedged_requests = 0
+        self.hedge_wins = 0
+        self._probe_task: Optional[asyncio.Task] = None
+    
+    def ranked_endpoints(self) -> List[RpcEndpoint]:
+        """Return healthy endpoints ordered by score, or every endpoint if none are healthy"""
+        order = {id(endpoint): i for i, endpoint in enumerate(self.endpoints)}
+        healthy = [e for e in self.endpoints if e.healthy]
+        candidates = healthy or self.endpoints
+        return sorted(candidates, key=lambda e: (e.score, order[id(e)]))
+    
+    def _hedge_delay(self, endpoint: RpcEndpoint) -> float:
+        """Delay before a hedged duplicate is sent"""
+        if len(endpoint.latencies) < self.min_hedge_samples:
+            return self.default_hedge_delay
+        return endpoint.latency_percentile(self.hedge_percentile)
+    
+    async def _timed_call(self, endpoint: RpcEndpoint, fn: Callable[[Any], Awaitable[T]]) -> T:
+        """Run a call against one endpoint and record its outcome"""
+        await endpoint.rate_limiter.acquire()
+        start = time.monotonic()
+        try:
+            result = await fn(endpoint.web3)
+        except TRANSPORT_ERRORS:
+            endpoint.record_failure()
+            self._update_health(endpoint)
+            raise
+        endpoint.record_success(time.monotonic() - start)
+        return result
+    
+    def _update_health(self, endpoint: RpcEndpoint):
+        """Drop an endpoint that keeps failing"""
+        if endpoint.healthy and (endpoint.consecutive_failures >= self.failure_threshold or
+                                 endpoint.error_rate > self.max_error_rate):
+            endpoint.healthy = False
+            logger.warning(f"RPC endpoint {endpoint.url} marked unhealthy "
+                           f"(error rate {endpoint.error_rate:.2f}, {endpoint.consecutive_failures} consecutive failures)")
+    
+    async def call(self, fn: Callable[[Any], Awaitable[T]]) -> T:
+        """
+        Execute an RPC call on the best endpoint, failing over on transport errors
+        
+        Args:
+            fn: Coroutine function receiving the endpoint's AsyncWeb3 instance
+        
+        Returns:
+            The result of the first successful call
+        """
+        candidates = self.ranked_endpoints()
+        last_error: Optional[BaseException] = None
+        
+        while candidates:
+            primary = candidates.pop(0)
+            try:
+                if self.hedge_enabled and candidates:
+                    return await self._hedged_call(primary, candidates, fn)
+                return await self._timed_call(primary, fn)
+            except TRANSPORT_ERRORS as e:
+                last_error = e
+                logger.debug(f"RPC call to {primary.url} failed, trying next endpoint: {e}")
+        
+        raise last_error
+    
+    async def _hedged_call(self, primary: RpcEndpoint, candidates: List[RpcEndpoint],
+                           fn: Callable[[Any], Awaitable[T]]) -> T:
+        """
+        Send to the primary and, if it is slow, race a duplicate on the next candidate
+        
+        The hedge endpoint is removed from candidates when it was used and failed.
+        """
+        primary_task = asyncio.ensure_future(self._timed_call(primary, fn))
+        done, _ = await asyncio.wait({primary_task}, timeout=self._hedge_delay(primary))
+        if done:
+            return primary_task.result()
+        
+        secondary = candidates[0]
+        self.hedged_requests += 1
+        hedge_task = asyncio.ensure_future(self._timed_call(secondary, fn))
+        pending = {primary_task, hedge_task}
+        error: Optional[BaseException] = None
+        
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    task_error = task.exception()
+                    if task_error is None:
+                        if task is hedge_task:
+                            self.hedge_wins += 1
+                        return task.result()
+                    if not isinstance(task_error, TRANSPORT_ERRORS):
+                        # A JSON-RPC level error is an authoritative answer
+                        raise task_error
+                    error = task_error
+            candidates.remove(secondary)
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    async def _probe_endpoint(self, endpoint: RpcEndpoint):
+        """Probe one endpoint with a cheap request"""
+        try:
+            await self._timed_call(endpoint, lambda w3: w3.eth.block_number)
+            if not endpoint.healthy:
+                endpoint.healthy = True
+                endpoint.error_rate = 0.0
+                logger.info(f"RPC endpoint {endpoint.url} recovered")
+        except Exception as e:
+            logger.debug(f"Probe of RPC endpoint {endpoint.url} failed: {e}")
+    
+    async def _probe_loop(self):
+        """Periodically re-probe endpoints to refresh latency and recover dropped ones"""
+        while True:
+            await asyncio.gather(*(self._probe_endpoint(e) for e in self.endpoints), return_exceptions=True)
+            await asyncio.sleep(self.probe_interval)
+    
+    def start_probing(self):
+        """Start background probing if there is more than one endpoint"""
+        if len(self.endpoints) > 1 and (self._probe_task is None or self._probe_task.done()):
+            self._probe_task = asyncio.ensure_future(self._probe_loop())
+    
+    async def stop_probing(self):
+        """Stop background probing"""
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            try:
+                await self._probe_task
+            except asyncio.CancelledError:
+                pass
+            self._probe_task = None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics"""
+        return {
+            'endpoints': [e.get_stats() for e in self.endpoints],
+            'hedged_requests': self.hedged_requests,
+            'hedge_wins': self.hedge_wins
+        }
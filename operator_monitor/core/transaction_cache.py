@@ -0,0 +1,237 @@
+"""Bounded LRU cache for fetched transactions and their decoded calldata"""
+
+import asyncio
+import json
+import logging
+import os
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from typing import Dict, Any, Optional, Callable, Awaitable
+
+logger = logging.getLogger(__name__)
+
+# Sentinel distinguishing "not decoded yet" from a decode that returned None
+_MISSING = object()
+
+# Fixed per-entry overhead used in the size estimate
+_ENTRY_OVERHEAD_BYTES = 512
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize lazy decoded views (e.g. RegistrationList) as plain lists and dicts"""
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, Sequence):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class TransactionCache:
+    """Size-aware LRU cache keyed by transaction hash"""
+    
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024, persist_path: Optional[str] = None):
+        """
+        Initialize transaction cache
+        
+        Args:
+            max_entries: Maximum number of transactions kept
+            max_bytes: Approximate upper bound on memory used by cached entries
+            persist_path: Optional JSON file used to persist confirmed entries across restarts
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.persist_path = persist_path
+        self._entries: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.decode_hits = 0
+        self.decode_misses = 0
+        self.evictions = 0
+    
+    @staticmethod
+    def _key(tx_hash) -> str:
+        """Normalize a transaction hash (str or bytes) into a cache key"""
+        if hasattr(tx_hash, 'hex') and not isinstance(tx_hash, str):
+            tx_hash = tx_hash.hex()
+        tx_hash = tx_hash.lower()
+        return tx_hash[2:] if tx_hash.startswith('0x') else tx_hash
+    
+    @staticmethod
+    def _estimate_size(entry: Dict[str, Any]) -> int:
+        """Estimate entry size from the calldata length, which dominates both the raw and decoded forms"""
+        calldata_len = len(entry['transaction'].get('input') or '')
+        decoded = entry.get('decoded', _MISSING)
+        decoded_len = 2 * calldata_len if decoded not in (_MISSING, None) else 0
+        return _ENTRY_OVERHEAD_BYTES + calldata_len + decoded_len
+    
+    def _store(self, key: str, entry: Dict[str, Any]):
+        """Insert or replace an entry and evict until within bounds"""
+        if key in self._entries:
+            self.current_bytes -= self._entries.pop(key)['size']
+        
+        entry['size'] = self._estimate_size(entry)
+        self._entries[key] = entry
+        self.current_bytes += entry['size']
+        
+        while self._entries and (len(self._entries) > self.max_entries or self.current_bytes > self.max_bytes):
+            _, evicted = self._entries.popitem(last=False)
+            self.current_bytes -= evicted['size']
+            self.evictions += 1
+    
+    def get_transaction(self, tx_hash) -> Optional[Dict[str, Any]]:
+        """Return a cached transaction or None, updating hit/miss counters"""
+        entry = self._entries.get(self._key(tx_hash))
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(self._key(tx_hash))
+        self.hits += 1
+        return entry['transaction']
+    
+    def put_transaction(self, tx_hash, transaction: Dict[str, Any]):
+        """Cache a fetched transaction"""
+        key = self._key(tx_hash)
+        existing = self._entries.get(key)
+        entry = {'transaction': transaction}
+        if existing is not None and 'decoded' in existing:
+            entry['decoded'] = existing['decoded']
+        self._store(key, entry)
+    
+    def mark_confirmed(self, tx_hash):
+        """Mark a cached transaction as part of a block that reached the confirmation depth"""
+        entry = self._entries.get(self._key(tx_hash))
+        if entry is not None:
+            entry['confirmed'] = True
+    
+    async def get_or_fetch(self, tx_hash, fetch: Callable[[str], Awaitable[Optional[Dict[str, Any]]]]) -> Optional[Dict[str, Any]]:
+        """
+        Return a cached transaction, fetching it at most once even for concurrent callers
+        
+        Args:
+            tx_hash: Transaction hash
+            fetch: Coroutine function fetching the transaction by hash
+        
+        Returns:
+            Transaction dictionary or None if it could not be fetched
+        """
+        key = self._key(tx_hash)
+        transaction = self.get_transaction(key)
+        if transaction is not None:
+            return transaction
+        
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            transaction = await fetch(tx_hash)
+            if transaction is not None:
+                self.put_transaction(key, transaction)
+            future.set_result(transaction)
+            return transaction
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited future does not log a warning
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+    
+    def get_or_decode(self, tx_hash, decode: Callable[[], Any]) -> Any:
+        """
+        Return the cached decode result for a transaction, decoding it at most once
+        
+        Args:
+            tx_hash: Transaction hash
+            decode: Callable producing the decoded result (may return None)
+        
+        Returns:
+            The decoded result
+        """
+        key = self._key(tx_hash)
+        entry = self._entries.get(key)
+        if entry is not None and entry.get('decoded', _MISSING) is not _MISSING:
+            self._entries.move_to_end(key)
+            self.decode_hits += 1
+            return entry['decoded']
+        
+        self.decode_misses += 1
+        decoded = decode()
+        if entry is not None:
+            entry['decoded'] = decoded
+            self._store(key, entry)
+        return decoded
+    
+    def load(self) -> int:
+        """Load persisted entries, returns the number loaded"""
+        if not self.persist_path or not os.path.exists(self.persist_path):
+            return 0
+        
+        try:
+            with open(self.persist_path, 'r') as f:
+                data = json.load(f)
+            for key, entry in data.items():
+                # Only confirmed entries are ever saved
+                entry['confirmed'] = True
+                self._store(key, entry)
+            logger.info(f"Loaded {len(data)} cached transactions from {self.persist_path}")
+            return len(data)
+        except Exception as e:
+            logger.warning(f"Could not load transaction cache from {self.persist_path}: {e}")
+            return 0
+    
+    def save(self, confirmed_through: Optional[int] = None) -> int:
+        """
+        Persist entries from confirmed blocks
+        
+        Args:
+            confirmed_through: Highest block considered final, e.g. head minus the confirmation
+                depth; None persists only entries marked with mark_confirmed
+        
+        Returns:
+            Number of entries saved
+        """
+        if not self.persist_path:
+            return 0
+        
+        try:
+            data = {}
+            for key, entry in self._entries.items():
+                # Transactions in blocks that can still be reorged out may change or vanish
+                block_number = entry['transaction'].get('blockNumber')
+                final = confirmed_through is not None and block_number is not None and block_number <= confirmed_through
+                if not (entry.get('confirmed') or final):
+                    continue
+                persisted = {'transaction': entry['transaction']}
+                if entry.get('decoded', _MISSING) is not _MISSING:
+                    persisted['decoded'] = entry['decoded']
+                data[key] = persisted
+            
+            tmp_path = f"{self.persist_path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f, default=_json_default)
+            os.replace(tmp_path, self.persist_path)
+            logger.info(f"Saved {len(data)} cached transactions to {self.persist_path}")
+            return len(data)
+        except Exception as e:
+            logger.warning(f"Could not save transaction cache to {self.persist_path}: {e}")
+            return 0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'approx_bytes': self.current_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            'decode_hits': self.decode_hits,
+            'decode_misses': self.decode_misses,
+            'evictions': self.evictions
+        }
@@ -9,6 +9,49 @@ from ..config import NETWORK_CONFIGS
 logger = logging.getLogger(__name__)
 
 
+def format_transaction(tx) -> Dict[str, Any]:
+    """Convert a web3 transaction into a JSON-serializable dictionary"""
+    # Convert HexBytes to hex strings for JSON serialization
+    return {
+        'hash': tx.hash.hex(),
+        'blockNumber': tx.blockNumber,
+        'blockHash': tx.blockHash.hex() if tx.blockHash else None,
+        'transactionIndex': tx.transactionIndex,
+        'from': tx['from'],
+        'to': tx.to,
+        'value': tx.value,
+        'gas': tx.gas,
+        'gasPrice': tx.gasPrice,
+        'input': tx.input.hex(),
+        'nonce': tx.nonce,
+        'type': tx.get('type'),
+        'chainId': tx.get('chainId')
+    }
+
+
+def format_receipt(receipt) -> Dict[str, Any]:
+    """Convert a web3 transaction receipt into a JSON-serializable dictionary"""
+    return {
+        'transactionHash': receipt.transactionHash.hex(),
+        'blockNumber': receipt.blockNumber,
+        'blockHash': receipt.blockHash.hex(),
+        'transactionIndex': receipt.transactionIndex,
+        'from': receipt['from'],
+        'to': receipt.to,
+        'gasUsed': receipt.gasUsed,
+        'cumulativeGasUsed': receipt.cumulativeGasUsed,
+        'status': receipt.status,
+        'logs': [
+            {
+                'address': log.address,
+                'topics': [topic.hex() for topic in log.topics],
+                'data': log.data.hex()
+            }
+            for log in receipt.logs
+        ]
+    }
+
+
 class Web3Client:
     """Manages Web3 connection and network validation"""
     
@@ -71,22 +114,7 @@ class Web3Client:
         """
         try:
             tx = self.web3.eth.get_transaction(tx_hash)
-            # Convert HexBytes to hex strings for JSON serialization
-            return {
-                'hash': tx.hash.hex(),
-                'blockNumber': tx.blockNumber,
-                'blockHash': tx.blockHash.hex() if tx.blockHash else None,
-                'transactionIndex': tx.transactionIndex,
-                'from': tx['from'],
-                'to': tx.to,
-                'value': tx.value,
-                'gas': tx.gas,
-                'gasPrice': tx.gasPrice,
-                'input': tx.input.hex(),
-                'nonce': tx.nonce,
-                'type': tx.get('type'),
-                'chainId': tx.get('chainId')
-            }
+            return format_transaction(tx)
         except Exception as e:
             logger.error(f"Error fetching transaction {tx_hash}: {e}")
             return None
@@ -103,25 +131,7 @@ class Web3Client:
         """
         try:
             receipt = self.web3.eth.get_transaction_receipt(tx_hash)
-            return {
-                'transactionHash': receipt.transactionHash.hex(),
-                'blockNumber': receipt.blockNumber,
-                'blockHash': receipt.blockHash.hex(),
-                'transactionIndex': receipt.transactionIndex,
-                'from': receipt['from'],
-                'to': receipt.to,
-                'gasUsed': receipt.gasUsed,
-                'cumulativeGasUsed': receipt.cumulativeGasUsed,
-                'status': receipt.status,
-                'logs': [
-                    {
-                        'address': log.address,
-                        'topics': [topic.hex() for topic in log.topics],
-                        'data': log.data.hex()
-                    }
-                    for log in receipt.logs
-                ]
-            }
+            return format_receipt(receipt)
         except Exception as e:
             logger.error(f"Error fetching transaction receipt {tx_hash}: {e}")
             return None
@@ -2,5 +2,6 @@
 
 from .event_fetcher import EventFetcher
 from .event_store import EventStoreInterface, InMemoryEventStore, NullEventStore
+from .log_cache import SQLiteLogCache
 
-__all__ = ['EventFetcher', 'EventStoreInterface', 'InMemoryEventStore', 'NullEventStore'] 
\ No newline at end of file
+__all__ = ['EventFetcher', 'EventStoreInterface', 'InMemoryEventStore', 'NullEventStore', 'SQLiteLogCache'] 
\ No newline at end of file
@@ -0,0 +1,117 @@
+"""Adaptive block range sizing for log range queries"""
+
+import asyncio
+import logging
+import threading
+from typing import Dict, Any, Tuple, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Provider error codes and messages that mean the range was too large rather than the request being bad
+RANGE_ERROR_MARKERS = (
+    '-32005',                       # EIP-1474 limit exceeded (Infura)
+    'query returned more than',     # Infura, geth
+    'response size exceeded',       # Alchemy
+    'log ranges over',              # Alchemy
+    'block range is too wide',      # Alchemy, Chainstack
+    'block range too large',        # Nethermind
+    'exceed maximum block range',   # Ankr, BSC
+    'query timeout exceeded'        # geth, Erigon
+)
+
+
+def is_range_error(error: BaseException) -> bool:
+    """Whether an eth_getLogs error indicates the block range should be split"""
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError)):
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in RANGE_ERROR_MARKERS)
+
+
+class AdaptiveRangeController:
+    """Learns a good eth_getLogs block range per contract set and chain era"""
+    
+    def __init__(self, initial_size: int, min_size: int = 1, max_size: Optional[int] = None,
+                 era_size: int = 1_000_000, target_logs: int = 2000, growth_factor: int = 2):
+        """
+        Initialize range controller
+        
+        Args:
+            initial_size: Block range used for an era that has not been seen yet
+            min_size: Smallest block range ever requested
+            max_size: Largest block range ever requested (defaults to 10x initial_size)
+            era_size: Number of blocks sharing one learned range size
+            target_logs: Logs per response the controller aims to stay under
+            growth_factor: Multiplier applied to the range after a sparse response
+        """
+        self.initial_size = initial_size
+        self.min_size = min_size
+        self.max_size = max_size or initial_size * 10
+        self.era_size = era_size
+        self.target_logs = target_logs
+        self.growth_factor = growth_factor
+        self._sizes: Dict[Tuple[Hashable, int], int] = {}
+        # Smallest range known to have been rejected, growth stays below it
+        self._ceilings: Dict[Tuple[Hashable, int], int] = {}
+        self.splits = 0
+        self.grows = 0
+        # Chunks of an async backfill report their outcomes from worker threads
+        self._lock = threading.Lock()
+    
+    def _slot(self, key: Hashable, block: int) -> Tuple[Hashable, int]:
+        """Storage slot for a contract set and the era containing a block"""
+        return (key, block // self.era_size)
+    
+    def size_for(self, key: Hashable, block: int) -> int:
+        """
+        Block range to request next
+        
+        Args:
+            key: Identifier of the queried contract set
+            block: First block of the next request
+        
+        Returns:
+            Number of blocks to request
+        """
+        with self._lock:
+            return self._sizes.get(self._slot(key, block), self.initial_size)
+    
+    def record_success(self, key: Hashable, from_block: int, to_block: int, log_count: int):
+        """Grow the range after a sparse response, shrink it after a dense one"""
+        with self._lock:
+            slot = self._slot(key, from_block)
+            current = self._sizes.get(slot, self.initial_size)
+            size = to_block - from_block + 1
+            
+            if log_count > self.target_logs:
+                # Close to provider limits; back off before the provider starts rejecting
+                self._sizes[slot] = max(self.min_size, min(current, size // 2))
+            elif log_count <= self.target_logs // 4 and size >= current:
+                # Only grow when the full learned range was used, not a truncated tail
+                grown = min(self.max_size, current * self.growth_factor)
+                ceiling = self._ceilings.get(slot)
+                if ceiling is not None and grown >= ceiling:
+                    # Bisect towards the rejected size instead of jumping back over it
+                    grown = current + (ceiling - current) // 2
+                if grown > current:
+                    self.grows += 1
+                self._sizes[slot] = grown
+    
+    def record_range_error(self, key: Hashable, from_block: int, to_block: int):
+        """Halve the range after the provider rejected or timed out on it"""
+        with self._lock:
+            slot = self._slot(key, from_block)
+            current = self._sizes.get(slot, self.initial_size)
+            size = to_block - from_block + 1
+            self._ceilings[slot] = min(self._ceilings.get(slot, size), size)
+            self._sizes[slot] = max(self.min_size, min(current, size // 2))
+            self.splits += 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get range sizing statistics"""
+        with self._lock:
+            return {
+                'splits': self.splits,
+                'grows': self.grows,
+                'learned_sizes': {f"{key}@{era * self.era_size}": size for (key, era), size in self._sizes.items()}
+            }
@@ -2,32 +2,241 @@
 
 import logging
 import asyncio
-from typing import List, Dict, Any, Union
+import threading
+import time
+from collections import deque
+from contextlib import aclosing
+from typing import List, Dict, Any, Union, Tuple, Optional, AsyncIterator, Deque
 from ..core.contract_interface import ContractInterface
+from ..core.event_router import EventRouter, EventHandler
+from ..core.log_decoder import LogDecoder
+from ..core.monitored_event import MonitoredEvent
+from ..core.rate_limiter import AsyncRateLimiter
 from ..core.web3_client import Web3Client
+from .adaptive_range import AdaptiveRangeController, is_range_error
+from .log_cache import SQLiteLogCache
 
 logger = logging.getLogger(__name__)
 
 
+def event_sort_key(event: Dict[str, Any]) -> Tuple[int, int, int]:
+    """Canonical chain ordering of an event: (blockNumber, transactionIndex, logIndex)"""
+    return (event['blockNumber'], event['transactionIndex'], event.get('logIndex', 0))
+
+
+class BackfillProgress:
+    """Tracks progress and throughput of a historical backfill"""
+    
+    def __init__(self, total_blocks: int, log_interval: float = 10.0):
+        """
+        Initialize progress tracking
+        
+        Args:
+            total_blocks: Number of blocks in the backfill range
+            log_interval: Minimum seconds between progress log lines
+        """
+        self.total_blocks = total_blocks
+        self.log_interval = log_interval
+        self.blocks_done = 0
+        self.chunks_done = 0
+        self.logs_found = 0
+        self.started_at = time.monotonic()
+        self._last_logged = self.started_at
+    
+    def record_chunk(self, blocks: int, logs: int):
+        """Record a completed chunk and periodically log progress"""
+        self.blocks_done += blocks
+        self.chunks_done += 1
+        self.logs_found += logs
+        
+        now = time.monotonic()
+        if now - self._last_logged >= self.log_interval:
+            self._last_logged = now
+            stats = self.get_stats()
+            logger.info(
+                f"Backfill progress: {stats['percent_complete']}% "
+                f"({self.blocks_done}/{self.total_blocks} blocks, {self.chunks_done} chunks), "
+                f"{stats['blocks_per_second']} blocks/s, {stats['logs_per_second']} logs/s"
+            )
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get progress and throughput statistics"""
+        elapsed = max(time.monotonic() - self.started_at, 1e-9)
+        return {
+            'total_blocks': self.total_blocks,
+            'blocks_done': self.blocks_done,
+            'chunks_done': self.chunks_done,
+            'logs_found': self.logs_found,
+            'percent_complete': round(100 * self.blocks_done / self.total_blocks, 1) if self.total_blocks else 100.0,
+            'elapsed_seconds': round(elapsed, 2),
+            'blocks_per_second': round(self.blocks_done / elapsed, 1),
+            'logs_per_second': round(self.logs_found / elapsed, 1)
+        }
+
+
 class EventFetcher:
     """Handles fetching historical events with chunking and retry logic"""
     
     def __init__(self, web3_client: Web3Client, contracts: Union[ContractInterface, List[ContractInterface]], 
-                 chunk_size: int = 50000, max_retries: int = 3):
+                 chunk_size: int = 50000, max_retries: int = 3, use_get_logs: bool = True,
+                 async_web3_client=None, max_concurrency: int = 4, rate_limit: float = 0,
+                 adaptive_chunking: bool = True, max_chunk_size: Optional[int] = None,
+                 log_cache: Optional[SQLiteLogCache] = None, finality_depth: int = 64,
+                 handlers: Optional[Dict[Tuple[str, str], EventHandler]] = None):
         """
         Initialize event fetcher
         
         Args:
             web3_client: Web3Client instance
             contracts: Single contract or list of contracts to monitor
-            chunk_size: Number of blocks per chunk
+            chunk_size: Number of blocks per chunk (the starting size when chunking is adaptive)
             max_retries: Maximum retry attempts per chunk
+            use_get_logs: Fetch each chunk with a single eth_getLogs across all contracts and
+                event topics instead of one filter per contract and event type
+            async_web3_client: Optional AsyncWeb3Client used for non-blocking eth_getLogs calls
+            max_concurrency: Maximum number of chunks fetched concurrently by the async backfill
+            rate_limit: Maximum chunk requests per second sent through the sync client (0 for
+                unlimited); the async client rate limits each of its endpoints itself
+            adaptive_chunking: Split eth_getLogs ranges the provider rejects as too large and
+                grow ranges after sparse responses, remembering a size per contract set and era
+            max_chunk_size: Largest range adaptive chunking grows to (defaults to 10x chunk_size)
+            log_cache: Optional on-disk cache serving finalized block ranges fetched before
+            finality_depth: Blocks behind the head after which logs are cached as immutable
+            handlers: Optional EventProcessor.handlers whose raw-log predicates discard
+                unwanted logs before they are decoded
         """
         self.web3_client = web3_client
         # Ensure contracts is always a list
         self.contracts = contracts if isinstance(contracts, list) else [contracts]
         self.chunk_size = chunk_size
         self.max_retries = max_retries
+        self.use_get_logs = use_get_logs
+        self._log_decoders: Dict[Tuple[int, ...], LogDecoder] = {}
+        self.handlers = handlers
+        self.async_web3_client = async_web3_client
+        self.max_concurrency = max(1, max_concurrency)
+        self.rate_limiter = AsyncRateLimiter(rate_limit)
+        self.last_backfill_stats: Optional[Dict[str, Any]] = None
+        # Adaptive sizing needs the single eth_getLogs path to see provider range errors
+        self.range_controller = (
+            AdaptiveRangeController(chunk_size, max_size=max_chunk_size)
+            if adaptive_chunking and use_get_logs else None
+        )
+        self.failed_ranges: List[Tuple[int, int]] = []
+        # Async backfills fetch chunks on worker threads that share the decoders and failed ranges
+        self._lock = threading.Lock()
+        # The cache stores raw eth_getLogs results, so it only applies to that path
+        self.log_cache = log_cache if use_get_logs else None
+        self.finality_depth = finality_depth
+        self._finalized_block: Optional[int] = None
+    
+    def _get_log_decoder(self, contracts: List[ContractInterface]) -> LogDecoder:
+        """Return the (cached) log decoder for a set of contracts"""
+        key = tuple(id(contract) for contract in contracts)
+        with self._lock:
+            if key not in self._log_decoders:
+                self._log_decoders[key] = LogDecoder(contracts, EventRouter(contracts, self.handlers))
+            return self._log_decoders[key]
+    
+    def get_decoder_stats(self) -> Dict[str, int]:
+        """Logs decoded versus logs discarded by raw-log predicates, across all decoders"""
+        stats = {'decoded': 0, 'prefiltered': 0}
+        with self._lock:
+            decoders = list(self._log_decoders.values())
+        for decoder in decoders:
+            for key, value in decoder.get_stats().items():
+                stats[key] += value
+        return stats
+    
+    def _select_contracts(self, contract_filter: Optional[str]) -> List[ContractInterface]:
+        """Contracts matching the optional contract name filter"""
+        if not contract_filter:
+            return self.contracts
+        
+        contracts = [c for c in self.contracts if c.contract_name.lower() == contract_filter.lower()]
+        if not contracts:
+            logger.warning(f"No contracts found matching filter: {contract_filter}")
+        return contracts
+    
+    @staticmethod
+    def _range_key(contracts: List[ContractInterface]) -> Tuple[str, ...]:
+        """Key under which the adaptive range size of a contract set is remembered"""
+        return tuple(contract.contract_name for contract in contracts)
+    
+    def _chunk_size_for(self, contracts: List[ContractInterface], block: int) -> int:
+        """Number of blocks to request starting at block"""
+        if self.range_controller is None:
+            return self.chunk_size
+        return self.range_controller.size_for(self._range_key(contracts), block)
+    
+    def _record_range_success(self, contracts: List[ContractInterface], from_block: int, to_block: int,
+                              log_count: int):
+        """Feed a successful eth_getLogs response into the adaptive range controller"""
+        if self.range_controller is not None:
+            self.range_controller.record_success(self._range_key(contracts), from_block, to_block, log_count)
+    
+    def _split_range(self, contracts: List[ContractInterface], from_block: int, to_block: int,
+                     error: Exception) -> Optional[int]:
+        """
+        Decide whether a failed eth_getLogs range should be halved
+        
+        Returns:
+            Last block of the first half, or None if the range should not be split
+        """
+        if self.range_controller is None or to_block <= from_block or not is_range_error(error):
+            return None
+        
+        self.range_controller.record_range_error(self._range_key(contracts), from_block, to_block)
+        logger.info(f"Splitting blocks {from_block}-{to_block} after range error: {error}")
+        return (from_block + to_block) // 2
+    
+    def _record_failed_range(self, from_block: int, to_block: int, query: str = 'eth_getLogs'):
+        """Remember a range whose events could not be fetched"""
+        with self._lock:
+            if (from_block, to_block) not in self.failed_ranges:
+                self.failed_ranges.append((from_block, to_block))
+        logger.error(f"Max retries exceeded for {query} (blocks {from_block}-{to_block}), events in this range are missing")
+    
+    def _report_failed_ranges(self):
+        """Log the ranges missing from the last fetch"""
+        if self.failed_ranges:
+            ranges = ', '.join(f"{start}-{end}" for start, end in sorted(self.failed_ranges))
+            logger.error(f"Historical fetch incomplete, {len(self.failed_ranges)} block range(s) could not be fetched: {ranges}")
+    
+    def _plan_chunk(self, log_decoder: LogDecoder, from_block: int, to_block: int) -> List[Tuple[int, int, str]]:
+        """
+        Split a chunk into parts served from the log cache and parts fetched over RPC
+        
+        Returns:
+            List of (start, end, source) where source is 'cache' (served locally),
+            'fill' (finalized gap fetched and then cached) or 'live' (above the
+            finality depth, fetched and never cached)
+        """
+        if self.log_cache is None or self._finalized_block is None:
+            return [(from_block, to_block, 'live')]
+        
+        plan = []
+        cacheable_end = min(to_block, self._finalized_block)
+        if from_block <= cacheable_end:
+            cursor = from_block
+            for gap_start, gap_end in self.log_cache.find_gaps(log_decoder.streams, from_block, cacheable_end):
+                if gap_start > cursor:
+                    plan.append((cursor, gap_start - 1, 'cache'))
+                plan.append((gap_start, gap_end, 'fill'))
+                cursor = gap_end + 1
+            if cursor <= cacheable_end:
+                plan.append((cursor, cacheable_end, 'cache'))
+        if to_block > cacheable_end:
+            plan.append((max(from_block, cacheable_end + 1), to_block, 'live'))
+        return plan
+    
+    def _cache_logs(self, log_decoder: LogDecoder, from_block: int, to_block: int, logs: List[Dict[str, Any]]):
+        """Cache a fetched finalized range unless part of it could not be fetched"""
+        with self._lock:
+            failed = list(self.failed_ranges)
+        if any(start <= to_block and end >= from_block for start, end in failed):
+            return
+        self.log_cache.store(log_decoder.streams, from_block, to_block, logs)
     
     def get_historical_events(self, from_block: int = 0, to_block: str = 'latest', 
                             max_events: int = 100, contract_filter: str = None) -> List[Dict[str, Any]]:
@@ -52,27 +261,29 @@ class EventFetcher:
             else:
                 end_block = int(to_block)
             
+            if self.log_cache is not None:
+                head = end_block if to_block == 'latest' else self.web3_client.get_current_block()
+                self._finalized_block = head - self.finality_depth
+            
             # Calculate the total range
             total_range = end_block - from_block
             
             logger.info(f"Total block range: {total_range} blocks, using chunks of {self.chunk_size}")
             
             all_events = []
+            self.failed_ranges = []
             
             # Filter contracts if specified
-            contracts_to_process = self.contracts
-            if contract_filter:
-                contracts_to_process = [c for c in self.contracts if c.contract_name.lower() == contract_filter.lower()]
-                if not contracts_to_process:
-                    logger.warning(f"No contracts found matching filter: {contract_filter}")
-                    return []
+            contracts_to_process = self._select_contracts(contract_filter)
+            if not contracts_to_process:
+                return []
             
             # Process in chunks to avoid RPC limits
             current_block = from_block
             chunk_count = 0
             
             while current_block <= end_block:
-                chunk_end = min(current_block + self.chunk_size - 1, end_block)
+                chunk_end = min(current_block + self._chunk_size_for(contracts_to_process, current_block) - 1, end_block)
                 chunk_count += 1
                 
                 logger.info(f"Processing chunk {chunk_count}: blocks {current_block} to {chunk_end}")
@@ -84,14 +295,15 @@ class EventFetcher:
                 
                 current_block = chunk_end + 1
             
+            # Sort events into chain order
+            all_events.sort(key=event_sort_key)
+            
             # Limit results
             if len(all_events) > max_events:
                 all_events = all_events[-max_events:]  # Get most recent events
             
-            # Sort events by block number and transaction index
-            all_events.sort(key=lambda x: (x['blockNumber'], x['transactionIndex']))
-            
             logger.info(f"Found {len(all_events)} historical events across {chunk_count} chunks")
+            self._report_failed_ranges()
             return all_events
             
         except Exception as e:
@@ -101,6 +313,70 @@ class EventFetcher:
     def _fetch_chunk_with_retry(self, contracts: List[ContractInterface], from_block: int, 
                                to_block: int) -> List[Dict[str, Any]]:
         """Fetch events for a chunk with retry logic"""
+        if self.use_get_logs:
+            return self._fetch_chunk_get_logs(contracts, from_block, to_block)
+        
+        return self._fetch_chunk_per_event(contracts, from_block, to_block)
+    
+    def _fetch_chunk_get_logs(self, contracts: List[ContractInterface], from_block: int, 
+                              to_block: int) -> List[Dict[str, Any]]:
+        """Fetch a chunk with eth_getLogs (or the log cache) and demultiplex the logs locally"""
+        log_decoder = self._get_log_decoder(contracts)
+        logs = []
+        
+        for start, end, source in self._plan_chunk(log_decoder, from_block, to_block):
+            if source == 'cache':
+                logs.extend(self.log_cache.get_logs(log_decoder.streams, start, end))
+                continue
+            
+            fetched = self._get_logs(contracts, log_decoder, start, end)
+            if source == 'fill':
+                self._cache_logs(log_decoder, start, end, fetched)
+            logs.extend(fetched)
+        
+        return log_decoder.decode_logs(logs)
+    
+    def _get_logs(self, contracts: List[ContractInterface], log_decoder: LogDecoder, from_block: int,
+                  to_block: int) -> List[Dict[str, Any]]:
+        """
+        Fetch raw logs for a range with one eth_getLogs call
+        
+        With adaptive chunking, a range the provider rejects as too large or times out
+        on is halved and both halves are fetched. A range that keeps failing is added
+        to failed_ranges instead of being dropped silently.
+        """
+        filter_params = log_decoder.build_filter_params(from_block, to_block)
+        
+        for attempt in range(self.max_retries):
+            try:
+                logs = self.web3_client.web3.eth.get_logs(filter_params)
+                self._record_range_success(contracts, from_block, to_block, len(logs))
+                return logs
+                
+            except Exception as e:
+                middle = self._split_range(contracts, from_block, to_block, e)
+                if middle is not None:
+                    return (self._get_logs(contracts, log_decoder, from_block, middle) +
+                            self._get_logs(contracts, log_decoder, middle + 1, to_block))
+                
+                logger.warning(
+                    f"Attempt {attempt + 1}/{self.max_retries} failed for eth_getLogs "
+                    f"(blocks {from_block}-{to_block}): {e}"
+                )
+                
+                if attempt < self.max_retries - 1:
+                    # Wait before retrying (exponential backoff)
+                    wait_time = 2 ** attempt
+                    logger.info(f"Retrying in {wait_time} seconds...")
+                    time.sleep(wait_time)
+                else:
+                    self._record_failed_range(from_block, to_block)
+        
+        return []
+    
+    def _fetch_chunk_per_event(self, contracts: List[ContractInterface], from_block: int, 
+                               to_block: int) -> List[Dict[str, Any]]:
+        """Fetch a chunk with one filter per contract and event type"""
         chunk_events = []
         
         for contract in contracts:
@@ -114,11 +390,8 @@ class EventFetcher:
                         )
                         # Add contract info to events
                         for event in events:
-                            # Convert AttributeDict to regular dict to allow modification
-                            event_dict = dict(event)
-                            event_dict['contract_name'] = contract.contract_name
-                            event_dict['contract_address'] = contract.contract_address
-                            chunk_events.append(event_dict)
+                            chunk_events.append(MonitoredEvent.from_event(event, contract.contract_name,
+                                                                          contract.contract_address))
                         break  # Success, exit retry loop
                         
                     except Exception as e:
@@ -131,22 +404,213 @@ class EventFetcher:
                             # Wait before retrying (exponential backoff)
                             wait_time = 2 ** attempt
                             logger.info(f"Retrying in {wait_time} seconds...")
-                            import time
                             time.sleep(wait_time)
                         else:
-                            logger.error(f"Max retries exceeded for {contract.contract_name}.{event_name}")
+                            self._record_failed_range(from_block, to_block, f"{contract.contract_name}.{event_name}")
         
         return chunk_events
     
+    async def iter_historical_events(self, from_block: int = 0, to_block: str = 'latest',
+                                     contract_filter: str = None, reverse: bool = False,
+                                     max_events: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream historical events chunk by chunk without collecting the whole range
+        
+        Up to max_concurrency chunks are fetched ahead of the consumer; only those
+        chunks are held in memory. Forward mode yields events oldest first in
+        (blockNumber, transactionIndex, logIndex) order. Reverse mode walks backward
+        from to_block and yields newest first, so asking for the last few events
+        only scans as many chunks as needed to find them.
+        
+        Args:
+            from_block: Starting block number
+            to_block: Ending block number ('latest' for current block)
+            contract_filter: Optional contract name filter
+            reverse: Walk backward from to_block instead of forward from from_block
+            max_events: Stop after yielding this many events (None for no limit)
+        
+        Yields:
+            Event dictionaries
+        """
+        contracts_to_process = self._select_contracts(contract_filter)
+        if not contracts_to_process:
+            return
+        
+        end_block = await self._resolve_end_block(to_block)
+        if self.log_cache is not None:
+            head = end_block if to_block == 'latest' else await self._resolve_end_block('latest')
+            self._finalized_block = head - self.finality_depth
+        progress = BackfillProgress(max(0, end_block - from_block + 1))
+        self.failed_ranges = []
+        
+        logger.info(
+            f"Streaming historical events {'backward' if reverse else 'forward'} over blocks {from_block}-{end_block}, "
+            f"starting with chunks of {self.chunk_size}, up to {self.max_concurrency} in flight"
+        )
+        
+        pending: Deque[Tuple[int, int, asyncio.Task]] = deque()
+        next_block = end_block if reverse else from_block
+        yielded = 0
+        
+        def schedule_next() -> bool:
+            """Start fetching the next chunk, returns False once the range is exhausted"""
+            nonlocal next_block
+            if reverse:
+                if next_block < from_block:
+                    return False
+                chunk_end = next_block
+                chunk_start = max(from_block, chunk_end - self._chunk_size_for(contracts_to_process, chunk_end) + 1)
+                next_block = chunk_start - 1
+            else:
+                if next_block > end_block:
+                    return False
+                chunk_start = next_block
+                chunk_end = min(chunk_start + self._chunk_size_for(contracts_to_process, chunk_start) - 1, end_block)
+                next_block = chunk_end + 1
+            
+            task = asyncio.ensure_future(self._fetch_chunk_async(contracts_to_process, chunk_start, chunk_end))
+            pending.append((chunk_start, chunk_end, task))
+            return True
+        
+        try:
+            while len(pending) < self.max_concurrency and schedule_next():
+                pass
+            
+            while pending:
+                chunk_start, chunk_end, task = pending.popleft()
+                chunk_events = await task
+                progress.record_chunk(chunk_end - chunk_start + 1, len(chunk_events))
+                
+                # Keep the window full while the consumer works through this chunk
+                while len(pending) < self.max_concurrency and schedule_next():
+                    pass
+                
+                chunk_events.sort(key=event_sort_key, reverse=reverse)
+                for event in chunk_events:
+                    yielded += 1
+                    yield event
+                    if max_events is not None and yielded >= max_events:
+                        return
+        finally:
+            for _, _, task in pending:
+                task.cancel()
+            
+            self.last_backfill_stats = progress.get_stats()
+            self.last_backfill_stats['events_yielded'] = yielded
+            self.last_backfill_stats['failed_ranges'] = list(self.failed_ranges)
+            self.last_backfill_stats['decoder'] = self.get_decoder_stats()
+            if self.range_controller is not None:
+                self.last_backfill_stats['adaptive_ranges'] = self.range_controller.get_stats()
+            if self.log_cache is not None:
+                self.last_backfill_stats['log_cache'] = self.log_cache.get_stats()
+            logger.info(
+                f"Yielded {yielded} historical events after scanning {progress.blocks_done} blocks in "
+                f"{progress.chunks_done} chunks ({self.last_backfill_stats['blocks_per_second']} blocks/s, "
+                f"{self.last_backfill_stats['logs_per_second']} logs/s)"
+            )
+            self._report_failed_ranges()
+    
     async def get_historical_events_async(self, from_block: int = 0, to_block: str = 'latest', 
                                         max_events: int = 100, contract_filter: str = None) -> List[Dict[str, Any]]:
-        """Async version of get_historical_events for better performance"""
-        import concurrent.futures
-        
-        loop = asyncio.get_event_loop()
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            return await loop.run_in_executor(
-                executor, 
-                self.get_historical_events, 
-                from_block, to_block, max_events, contract_filter
-            ) 
\ No newline at end of file
+        """
+        Get the most recent historical events without blocking the event loop
+        
+        Scans backward from to_block and stops once max_events events were found,
+        so the cost is proportional to the answer rather than the block range.
+        
+        Args:
+            from_block: Starting block number
+            to_block: Ending block number ('latest' for current block)
+            max_events: Maximum number of events to retrieve
+            contract_filter: Optional contract name filter
+        
+        Returns:
+            List of event dictionaries in chain order
+        """
+        logger.info(f"Fetching historical events from block {from_block} to {to_block}")
+        
+        try:
+            events = []
+            async with aclosing(self.iter_historical_events(from_block, to_block, contract_filter,
+                                                            reverse=True, max_events=max_events)) as stream:
+                async for event in stream:
+                    events.append(event)
+            
+            events.reverse()
+            return events
+            
+        except Exception as e:
+            logger.error(f"Error fetching historical events: {e}")
+            return []
+    
+    async def _resolve_end_block(self, to_block: Union[int, str]) -> int:
+        """Resolve 'latest' to the current block number without blocking the event loop"""
+        if to_block != 'latest':
+            return int(to_block)
+        if self.async_web3_client:
+            return await self.async_web3_client.get_current_block()
+        return await asyncio.to_thread(self.web3_client.get_current_block)
+    
+    async def _fetch_chunk_async(self, contracts: List[ContractInterface], from_block: int,
+                                 to_block: int) -> List[Dict[str, Any]]:
+        """Fetch one chunk without blocking the event loop"""
+        if self.async_web3_client and self.use_get_logs:
+            return await self._fetch_chunk_get_logs_async(contracts, from_block, to_block)
+        
+        # The sync client blocks, so run it in a worker thread behind the rate limiter
+        await self.rate_limiter.acquire()
+        return await asyncio.to_thread(self._fetch_chunk_with_retry, contracts, from_block, to_block)
+    
+    async def _fetch_chunk_get_logs_async(self, contracts: List[ContractInterface], from_block: int,
+                                          to_block: int) -> List[Dict[str, Any]]:
+        """Fetch a chunk through the async client (or the log cache) and demultiplex the logs locally"""
+        log_decoder = self._get_log_decoder(contracts)
+        logs = []
+        
+        for start, end, source in self._plan_chunk(log_decoder, from_block, to_block):
+            if source == 'cache':
+                logs.extend(self.log_cache.get_logs(log_decoder.streams, start, end))
+                continue
+            
+            fetched = await self._get_logs_async(contracts, log_decoder, start, end)
+            if source == 'fill':
+                self._cache_logs(log_decoder, start, end, fetched)
+            logs.extend(fetched)
+        
+        return log_decoder.decode_logs(logs)
+    
+    async def _get_logs_async(self, contracts: List[ContractInterface], log_decoder: LogDecoder,
+                              from_block: int, to_block: int) -> List[Dict[str, Any]]:
+        """Fetch raw logs for a range through the async client, splitting and retrying like _get_logs"""
+        filter_params = log_decoder.build_filter_params(from_block, to_block)
+        
+        for attempt in range(self.max_retries):
+            try:
+                logs = await self.async_web3_client.get_logs(filter_params)
+                self._record_range_success(contracts, from_block, to_block, len(logs))
+                return logs
+            
+            except Exception as e:
+                middle = self._split_range(contracts, from_block, to_block, e)
+                if middle is not None:
+                    # Fetch both halves concurrently; they are re-sorted with everything else
+                    left, right = await asyncio.gather(
+                        self._get_logs_async(contracts, log_decoder, from_block, middle),
+                        self._get_logs_async(contracts, log_decoder, middle + 1, to_block)
+                    )
+                    return left + right
+                
+                logger.warning(
+                    f"Attempt {attempt + 1}/{self.max_retries} failed for eth_getLogs "
+                    f"(blocks {from_block}-{to_block}): {e}"
+                )
+                
+                if attempt < self.max_retries - 1:
+                    # Wait before retrying (exponential backoff)
+                    wait_time = 2 ** attempt
+                    logger.info(f"Retrying in {wait_time} seconds...")
+                    await asyncio.sleep(wait_time)
+                else:
+                    self._record_failed_range(from_block, to_block)
+        
+        return []
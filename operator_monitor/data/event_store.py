@@ -1,9 +1,14 @@
 """Optional event persistence interface"""
 
 import logging
-from typing import List, Dict, Any, Optional
+from collections import deque
+from typing import List, Optional, Deque
 from abc import ABC, abstractmethod
 
+from hexbytes import HexBytes
+
+from ..core.monitored_event import MonitoredEvent
+
 logger = logging.getLogger(__name__)
 
 
@@ -11,18 +16,18 @@ class EventStoreInterface(ABC):
     """Abstract interface for event storage"""
     
     @abstractmethod
-    def store_event(self, event: Dict[str, Any]) -> bool:
+    def store_event(self, event: MonitoredEvent) -> bool:
         """Store a single event"""
         pass
     
     @abstractmethod
-    def store_events(self, events: List[Dict[str, Any]]) -> int:
+    def store_events(self, events: List[MonitoredEvent]) -> int:
         """Store multiple events, returns count of successful stores"""
         pass
     
     @abstractmethod
     def get_events(self, from_block: int = 0, to_block: Optional[int] = None, 
-                  event_type: Optional[str] = None) -> List[Dict[str, Any]]:
+                  event_type: Optional[str] = None) -> List[MonitoredEvent]:
         """Retrieve stored events with optional filtering"""
         pass
     
@@ -30,6 +35,11 @@ class EventStoreInterface(ABC):
     def get_latest_block(self) -> Optional[int]:
         """Get the latest block number we have events for"""
         pass
+    
+    @abstractmethod
+    def remove_block_events(self, block_hash) -> int:
+        """Remove events of a block that was orphaned by a reorg, returns count removed"""
+        pass
 
 
 class InMemoryEventStore(EventStoreInterface):
@@ -42,25 +52,21 @@ class InMemoryEventStore(EventStoreInterface):
         Args:
             max_events: Maximum number of events to keep in memory
         """
-        self.events: List[Dict[str, Any]] = []
+        # Oldest events fall off the left end once max_events is reached
+        self.events: Deque[MonitoredEvent] = deque(maxlen=max_events)
         self.max_events = max_events
         logger.info(f"In-memory event store initialized (max {max_events} events)")
     
-    def store_event(self, event: Dict[str, Any]) -> bool:
+    def store_event(self, event: MonitoredEvent) -> bool:
         """Store a single event in memory"""
         try:
             self.events.append(event)
-            
-            # Keep only the most recent events
-            if len(self.events) > self.max_events:
-                self.events = self.events[-self.max_events:]
-            
             return True
         except Exception as e:
             logger.error(f"Error storing event in memory: {e}")
             return False
     
-    def store_events(self, events: List[Dict[str, Any]]) -> int:
+    def store_events(self, events: List[MonitoredEvent]) -> int:
         """Store multiple events in memory"""
         success_count = 0
         for event in events:
@@ -71,19 +77,19 @@ class InMemoryEventStore(EventStoreInterface):
         return success_count
     
     def get_events(self, from_block: int = 0, to_block: Optional[int] = None, 
-                  event_type: Optional[str] = None) -> List[Dict[str, Any]]:
+                  event_type: Optional[str] = None) -> List[MonitoredEvent]:
         """Retrieve events from memory with filtering"""
         filtered_events = []
         
         for event in self.events:
             # Block range filter
-            if event['blockNumber'] < from_block:
+            if event.block_number < from_block:
                 continue
-            if to_block is not None and event['blockNumber'] > to_block:
+            if to_block is not None and event.block_number > to_block:
                 continue
             
             # Event type filter
-            if event_type is not None and event['event'] != event_type:
+            if event_type is not None and event.event != event_type:
                 continue
             
             filtered_events.append(event)
@@ -95,7 +101,18 @@ class InMemoryEventStore(EventStoreInterface):
         if not self.events:
             return None
         
-        return max(event['blockNumber'] for event in self.events)
+        return max(event.block_number for event in self.events)
+    
+    def remove_block_events(self, block_hash) -> int:
+        """Remove events of an orphaned block from memory"""
+        block_hash = bytes(HexBytes(block_hash))
+        remaining = [event for event in self.events if event.block_hash != block_hash]
+        removed = len(self.events) - len(remaining)
+        self.events = deque(remaining, maxlen=self.max_events)
+        
+        if removed:
+            logger.info(f"Removed {removed} events of orphaned block {block_hash.hex()} from memory")
+        return removed
     
     def clear(self):
         """Clear all stored events"""
@@ -106,15 +123,18 @@ class InMemoryEventStore(EventStoreInterface):
 class NullEventStore(EventStoreInterface):
     """No-op event store for when persistence is disabled"""
     
-    def store_event(self, event: Dict[str, Any]) -> bool:
+    def store_event(self, event: MonitoredEvent) -> bool:
         return True
     
-    def store_events(self, events: List[Dict[str, Any]]) -> int:
+    def store_events(self, events: List[MonitoredEvent]) -> int:
         return len(events)
     
     def get_events(self, from_block: int = 0, to_block: Optional[int] = None, 
-                  event_type: Optional[str] = None) -> List[Dict[str, Any]]:
+                  event_type: Optional[str] = None) -> List[MonitoredEvent]:
         return []
     
     def get_latest_block(self) -> Optional[int]:
-        return None 
\ No newline at end of file
+        return None
+    
+    def remove_block_events(self, block_hash) -> int:
+        return 0 
\ No newline at end of file
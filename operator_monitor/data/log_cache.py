@@ -0,0 +1,224 @@
+"""SQLite-backed cache of finalized raw logs with a block range coverage index"""
+
+import json
+import logging
+import sqlite3
+import threading
+from typing import List, Dict, Any, Tuple, Iterable
+
+from eth_utils import to_checksum_address
+from hexbytes import HexBytes
+from web3.datastructures import AttributeDict
+
+logger = logging.getLogger(__name__)
+
+# (lowercase address, 0x-prefixed lowercase topic0) identifying one contract event stream
+LogStream = Tuple[str, str]
+
+
+def _to_0x_hex(value) -> str:
+    """Normalize bytes or a hex string to a lowercase 0x-prefixed string"""
+    return HexBytes(value).to_0x_hex().lower()
+
+
+def merge_intervals(intervals: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Merge overlapping and adjacent inclusive block intervals"""
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def subtract_intervals(start: int, end: int, covered: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Return the parts of [start, end] not covered by the merged intervals"""
+    gaps = []
+    cursor = start
+    for covered_start, covered_end in covered:
+        if covered_end < cursor:
+            continue
+        if covered_start > end:
+            break
+        if covered_start > cursor:
+            gaps.append((cursor, covered_start - 1))
+        cursor = max(cursor, covered_end + 1)
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+class SQLiteLogCache:
+    """Stores raw logs per contract and topic, plus the block ranges already fetched"""
+    
+    def __init__(self, path: str):
+        """
+        Initialize log cache
+        
+        Only logs below the finality depth should be stored; they can no longer be
+        reorganized, so a covered range never has to be fetched again.
+        
+        Args:
+            path: SQLite database file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript('''
+            CREATE TABLE IF NOT EXISTS logs (
+                address TEXT NOT NULL,
+                topic0 TEXT NOT NULL,
+                block_number INTEGER NOT NULL,
+                transaction_index INTEGER NOT NULL,
+                log_index INTEGER NOT NULL,
+                block_hash TEXT NOT NULL,
+                transaction_hash TEXT NOT NULL,
+                topics TEXT NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (block_number, log_index)
+            );
+            CREATE INDEX IF NOT EXISTS logs_by_stream ON logs (address, topic0, block_number);
+            CREATE TABLE IF NOT EXISTS coverage (
+                address TEXT NOT NULL,
+                topic0 TEXT NOT NULL,
+                from_block INTEGER NOT NULL,
+                to_block INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS coverage_by_stream ON coverage (address, topic0, from_block);
+        ''')
+        self._conn.commit()
+        self.hits = 0
+        self.logs_served = 0
+        self.logs_stored = 0
+        logger.info(f"Log cache opened at {path}")
+    
+    def _covered(self, stream: LogStream) -> List[Tuple[int, int]]:
+        """Merged covered intervals of one stream"""
+        rows = self._conn.execute(
+            'SELECT from_block, to_block FROM coverage WHERE address = ? AND topic0 = ? ORDER BY from_block',
+            stream
+        ).fetchall()
+        return merge_intervals(rows)
+    
+    def find_gaps(self, streams: List[LogStream], from_block: int, to_block: int) -> List[Tuple[int, int]]:
+        """
+        Block ranges within [from_block, to_block] not yet covered for every stream
+        
+        Args:
+            streams: (address, topic0) pairs being queried
+            from_block: First block of the query
+            to_block: Last block of the query
+        
+        Returns:
+            Merged list of inclusive (start, end) gaps
+        """
+        with self._lock:
+            gaps = []
+            for stream in streams:
+                gaps.extend(subtract_intervals(from_block, to_block, self._covered(stream)))
+            return merge_intervals(gaps)
+    
+    def get_logs(self, streams: List[LogStream], from_block: int, to_block: int) -> List[AttributeDict]:
+        """
+        Read cached logs in the same shape eth_getLogs returns them
+        
+        Args:
+            streams: (address, topic0) pairs being queried
+            from_block: First block
+            to_block: Last block
+        
+        Returns:
+            Logs ordered by block number and log index
+        """
+        wanted = set(streams)
+        addresses = sorted({address for address, _ in streams})
+        placeholders = ','.join('?' for _ in addresses)
+        
+        with self._lock:
+            rows = self._conn.execute(
+                f'SELECT address, topic0, block_number, transaction_index, log_index, block_hash, '
+                f'transaction_hash, topics, data FROM logs '
+                f'WHERE block_number BETWEEN ? AND ? AND address IN ({placeholders}) '
+                f'ORDER BY block_number, log_index',
+                [from_block, to_block, *addresses]
+            ).fetchall()
+        
+        logs = []
+        for address, topic0, block_number, transaction_index, log_index, block_hash, transaction_hash, topics, data in rows:
+            if (address, topic0) not in wanted:
+                continue
+            logs.append(AttributeDict({
+                'address': to_checksum_address(address),
+                'topics': [HexBytes(topic) for topic in json.loads(topics)],
+                'data': HexBytes(data),
+                'blockNumber': block_number,
+                'transactionIndex': transaction_index,
+                'logIndex': log_index,
+                'blockHash': HexBytes(block_hash),
+                'transactionHash': HexBytes(transaction_hash),
+                'removed': False
+            }))
+        
+        self.hits += 1
+        self.logs_served += len(logs)
+        return logs
+    
+    def store(self, streams: List[LogStream], from_block: int, to_block: int, logs: List[Dict[str, Any]]):
+        """
+        Store the complete result of a finalized range and mark it covered
+        
+        Args:
+            streams: (address, topic0) pairs the logs were fetched for
+            from_block: First block of the fetched range
+            to_block: Last block of the fetched range
+            logs: Every log eth_getLogs returned for the range
+        """
+        rows = []
+        for log in logs:
+            topics = [_to_0x_hex(topic) for topic in log['topics']]
+            if not topics:
+                continue
+            rows.append((
+                log['address'].lower(),
+                topics[0],
+                log['blockNumber'],
+                log['transactionIndex'],
+                log['logIndex'],
+                _to_0x_hex(log['blockHash']),
+                _to_0x_hex(log['transactionHash']),
+                json.dumps(topics),
+                _to_0x_hex(log['data'])
+            ))
+        
+        with self._lock:
+            with self._conn:
+                self._conn.executemany('INSERT OR IGNORE INTO logs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+                for stream in streams:
+                    merged = merge_intervals(self._covered(stream) + [(from_block, to_block)])
+                    self._conn.execute('DELETE FROM coverage WHERE address = ? AND topic0 = ?', stream)
+                    self._conn.executemany(
+                        'INSERT INTO coverage VALUES (?, ?, ?, ?)',
+                        [(*stream, start, end) for start, end in merged]
+                    )
+        
+        self.logs_stored += len(rows)
+        logger.debug(f"Cached {len(rows)} logs for blocks {from_block}-{to_block}")
+    
+    def close(self):
+        """Close the database"""
+        with self._lock:
+            self._conn.close()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        with self._lock:
+            total_logs = self._conn.execute('SELECT COUNT(*) FROM logs').fetchone()[0]
+        return {
+            'path': self.path,
+            'cached_logs': total_logs,
+            'range_hits': self.hits,
+            'logs_served': self.logs_served,
+            'logs_stored': self.logs_stored
+        }
@@ -2,10 +2,11 @@
 
 import json
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Optional
 import redis
 from redis.exceptions import ConnectionError, TimeoutError
 
+from ..core.monitored_event import MonitoredEvent
 from .event_store import EventStoreInterface
 
 logger = logging.getLogger(__name__)
@@ -58,6 +59,66 @@ class RedisValidatorStore:
             self._client.close()
             logger.info("Redis connection closed")
     
+    @staticmethod
+    def _parse_validators(data: Optional[str], operator_address: str) -> List[str]:
+        """Decode a stored JSON list of validator keys, treating invalid data as empty"""
+        if not data:
+            return []
+        
+        try:
+            validators = json.loads(data)
+        except json.JSONDecodeError:
+            logger.warning(f"Invalid JSON data for operator {operator_address}, resetting")
+            return []
+        if not isinstance(validators, list):
+            logger.warning(f"Invalid data format for operator {operator_address}, resetting")
+            return []
+        return validators
+    
+    def add_operator_validators(self, operator_address: str, validator_pubkeys: List[str]) -> Optional[List[str]]:
+        """
+        Atomically merge validator public keys into an operator's list
+        
+        The read and write run in a WATCH transaction that is retried when another
+        writer changes the list in between, so the returned keys are exactly the ones
+        this call added.
+        
+        Args:
+            operator_address: Ethereum address of the operator (with 0x prefix)
+            validator_pubkeys: List of validator public key hex strings
+            
+        Returns:
+            Keys that were not stored for the operator before, or None on failure
+        """
+        if not self._client:
+            logger.error("Redis client not connected. Call connect() first.")
+            return None
+        
+        try:
+            # Normalize operator address to lowercase
+            operator_key = f"{self.key_prefix}:{operator_address.lower()}"
+            added: List[str] = []
+            total = 0
+            
+            def merge(pipe):
+                nonlocal added, total
+                existing = self._parse_validators(pipe.get(operator_key), operator_address)
+                known = set(existing)
+                added = [pubkey for pubkey in dict.fromkeys(validator_pubkeys) if pubkey not in known]
+                total = len(existing) + len(added)
+                pipe.multi()
+                pipe.set(operator_key, json.dumps(existing + added))
+            
+            self._client.transaction(merge, operator_key)
+            
+            logger.info(f"Stored {len(validator_pubkeys)} validators for operator {operator_address} "
+                       f"(new: {len(added)}, total: {total})")
+            return added
+            
+        except Exception as e:
+            logger.error(f"Error storing validators for operator {operator_address}: {e}")
+            return None
+    
     def store_operator_validators(self, operator_address: str, validator_pubkeys: List[str]) -> bool:
         """
         Store validator public keys for an operator
@@ -69,39 +130,46 @@ class RedisValidatorStore:
         Returns:
             True if stored successfully, False otherwise
         """
+        return self.add_operator_validators(operator_address, validator_pubkeys) is not None
+    
+    def remove_operator_validators(self, operator_address: str, validator_pubkeys: List[str]) -> bool:
+        """
+        Remove specific validator public keys from an operator, e.g. to revert an orphaned registration
+        
+        Args:
+            operator_address: Ethereum address of the operator (with 0x prefix)
+            validator_pubkeys: List of validator public key hex strings to remove
+            
+        Returns:
+            True if updated successfully, False otherwise
+        """
         if not self._client:
             logger.error("Redis client not connected. Call connect() first.")
             return False
         
         try:
-            # Normalize operator address to lowercase
             operator_key = f"{self.key_prefix}:{operator_address.lower()}"
+            removed = set(validator_pubkeys)
+            remaining: List[str] = []
             
-            # Get existing validator keys for this operator
-            existing_data = self._client.get(operator_key)
-            existing_validators = []
-            
-            if existing_data:
-                try:
-                    existing_validators = json.loads(existing_data)
-                    if not isinstance(existing_validators, list):
-                        existing_validators = []
-                except json.JSONDecodeError:
-                    logger.warning(f"Invalid JSON data for operator {operator_address}, resetting")
-                    existing_validators = []
-            
-            # Merge with new validators (avoid duplicates)
-            updated_validators = list(set(existing_validators + validator_pubkeys))
+            def prune(pipe):
+                nonlocal remaining
+                existing = self._parse_validators(pipe.get(operator_key), operator_address)
+                remaining = [v for v in existing if v not in removed]
+                pipe.multi()
+                if remaining:
+                    pipe.set(operator_key, json.dumps(remaining))
+                else:
+                    pipe.delete(operator_key)
             
-            # Store updated list
-            self._client.set(operator_key, json.dumps(updated_validators))
+            self._client.transaction(prune, operator_key)
             
-            logger.info(f"Stored {len(validator_pubkeys)} validators for operator {operator_address} "
-                       f"(total: {len(updated_validators)})")
+            logger.info(f"Removed {len(removed)} validators from operator {operator_address} "
+                       f"(remaining: {len(remaining)})")
             return True
             
         except Exception as e:
-            logger.error(f"Error storing validators for operator {operator_address}: {e}")
+            logger.error(f"Error removing validators for operator {operator_address}: {e}")
             return False
     
     def get_operator_validators(self, operator_address: str) -> List[str]:
@@ -226,17 +294,17 @@ class RedisEventStore(EventStoreInterface):
         """Disconnect from Redis"""
         self.validator_store.disconnect()
     
-    def store_event(self, event: Dict[str, Any]) -> bool:
+    def store_event(self, event: MonitoredEvent) -> bool:
         """Store a single event (basic implementation)"""
         # For now, we focus on validator mapping, but could extend to store events
         return True
     
-    def store_events(self, events: List[Dict[str, Any]]) -> int:
+    def store_events(self, events: List[MonitoredEvent]) -> int:
         """Store multiple events (basic implementation)"""
         return len(events)
     
     def get_events(self, from_block: int = 0, to_block: Optional[int] = None, 
-                  event_type: Optional[str] = None) -> List[Dict[str, Any]]:
+                  event_type: Optional[str] = None) -> List[MonitoredEvent]:
         """Retrieve stored events (basic implementation)"""
         return []
     
@@ -244,10 +312,22 @@ class RedisEventStore(EventStoreInterface):
         """Get latest block number (basic implementation)"""
         return None
     
+    def remove_block_events(self, block_hash) -> int:
+        """Remove events of an orphaned block (basic implementation)"""
+        return 0
+    
     def store_operator_validators(self, operator_address: str, validator_pubkeys: List[str]) -> bool:
         """Store validator public keys for an operator"""
         return self.validator_store.store_operator_validators(operator_address, validator_pubkeys)
     
+    def add_operator_validators(self, operator_address: str, validator_pubkeys: List[str]) -> Optional[List[str]]:
+        """Atomically add validator public keys to an operator, returns the newly added keys"""
+        return self.validator_store.add_operator_validators(operator_address, validator_pubkeys)
+    
+    def remove_operator_validators(self, operator_address: str, validator_pubkeys: List[str]) -> bool:
+        """Remove specific validator public keys from an operator"""
+        return self.validator_store.remove_operator_validators(operator_address, validator_pubkeys)
+    
     def get_operator_validators(self, operator_address: str) -> List[str]:
         """Get validator public keys for an operator"""
         return self.validator_store.get_operator_validators(operator_address)
@@ -2,5 +2,11 @@
 
 from .event_monitor import EventMonitor
 from .reconnection_handler import ReconnectionHandler
+from .log_tail_poller import LogTailPoller, BlockCursor
+from .websocket_subscriber import WebSocketLogSubscriber
+from .confirmation_buffer import ConfirmationBuffer, PendingBlock
+from .event_pipeline import EventPipeline, PipelineStage, PriorityClassifier
 
-__all__ = ['EventMonitor', 'ReconnectionHandler'] 
\ No newline at end of file
+__all__ = ['EventMonitor', 'ReconnectionHandler', 'LogTailPoller', 'BlockCursor', 'WebSocketLogSubscriber',
+           'ConfirmationBuffer', 'PendingBlock', 'EventPipeline', 'PipelineStage',
+           'PriorityClassifier'] 
\ No newline at end of file
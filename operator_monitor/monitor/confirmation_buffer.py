@@ -0,0 +1,184 @@
+"""Reorg-aware confirmation of monitored events"""
+
+import logging
+from typing import Dict, Any, List, Optional, Callable, Awaitable
+
+from hexbytes import HexBytes
+
+logger = logging.getLogger(__name__)
+
+
+def _hash_bytes(value) -> bytes:
+    """Normalize a block hash given as hex string (with or without 0x) or bytes"""
+    return bytes(HexBytes(value))
+
+
+class PendingBlock:
+    """Events of one block that has not reached the confirmation depth yet"""
+    
+    def __init__(self, block_hash: bytes, number: int):
+        self.block_hash = block_hash
+        self.number = number
+        self.events: List[Dict[str, Any]] = []
+        # Callables reverting derived state written while the block was tentative
+        self.undo: List[Callable[[], Any]] = []
+
+
+class ConfirmationBuffer:
+    """Holds events per block hash until they are confirmed or orphaned by a reorg"""
+    
+    def __init__(self, get_header: Callable[[int], Awaitable[Optional[Dict[str, Any]]]],
+                 on_confirmed: Callable[[PendingBlock], Awaitable[None]],
+                 on_orphaned: Callable[[PendingBlock], Awaitable[None]],
+                 confirmation_depth: int = 12, max_depth: int = 256):
+        """
+        Initialize confirmation buffer
+        
+        Every new head is linked to the known chain through its parent hash. When the
+        link breaks, headers are fetched backwards until the chains meet again and the
+        replaced blocks are orphaned.
+        
+        Args:
+            get_header: Coroutine returning the canonical header (number, hash, parentHash) of a block
+            on_confirmed: Coroutine called with a block once it is confirmation_depth blocks deep
+            on_orphaned: Coroutine called with a block that left the canonical chain
+            confirmation_depth: Blocks on top of a block before its events are confirmed
+            max_depth: Maximum number of canonical block hashes remembered and walked back on a reorg
+        """
+        self.get_header = get_header
+        self.on_confirmed = on_confirmed
+        self.on_orphaned = on_orphaned
+        self.confirmation_depth = confirmation_depth
+        self.max_depth = max_depth
+        self._chain: Dict[int, bytes] = {}
+        self._blocks: Dict[bytes, PendingBlock] = {}
+        self.head: Optional[int] = None
+        self.reorgs = 0
+        self.confirmed_blocks = 0
+        self.orphaned_blocks = 0
+        self.stale_events = 0
+    
+    def add_event(self, event: Dict[str, Any]) -> bool:
+        """
+        Buffer an event under its block hash
+        
+        Returns:
+            False if the block is already known to be off the canonical chain
+        """
+        block_hash = _hash_bytes(event['blockHash'])
+        number = event['blockNumber']
+        
+        canonical = self._chain.get(number)
+        if canonical is not None and canonical != block_hash:
+            self.stale_events += 1
+            return False
+        
+        block = self._blocks.get(block_hash)
+        if block is None:
+            block = self._blocks[block_hash] = PendingBlock(block_hash, number)
+        block.events.append(event)
+        return True
+    
+    def add_undo(self, event: Dict[str, Any], action: Callable[[], Any]):
+        """Register an action reverting state derived from a buffered event"""
+        block = self._blocks.get(_hash_bytes(event['blockHash']))
+        if block is not None:
+            block.undo.append(action)
+    
+    def lowest_pending(self) -> Optional[int]:
+        """Number of the lowest block whose events are neither confirmed nor orphaned yet"""
+        return min((block.number for block in self._blocks.values()), default=None)
+    
+    async def on_head(self, header: Dict[str, Any]) -> Optional[int]:
+        """
+        Process a new head
+        
+        Args:
+            header: Block header with number, hash and parentHash
+        
+        Returns:
+            Lowest block number replaced by a reorg, or None if the chain only grew
+        """
+        number = header['number']
+        new_chain = {number: _hash_bytes(header['hash'])}
+        parent = _hash_bytes(header['parentHash'])
+        
+        # Walk back until the new head links into the known chain
+        floor = max(min(self._chain, default=number), number - self.max_depth)
+        block_number = number - 1
+        while block_number >= floor and self._chain.get(block_number) != parent:
+            new_chain[block_number] = parent
+            parent_header = await self.get_header(block_number)
+            if parent_header is None:
+                break
+            parent = _hash_bytes(parent_header['parentHash'])
+            block_number -= 1
+        
+        replaced = [n for n, h in new_chain.items() if n in self._chain and self._chain[n] != h]
+        replaced += [n for n in self._chain if n > number]
+        for n in [n for n in self._chain if n > number]:
+            del self._chain[n]
+        self._chain.update(new_chain)
+        self.head = number
+        
+        orphaned = [b for b in self._blocks.values()
+                    if b.number in self._chain and self._chain[b.number] != b.block_hash]
+        confirmed = []
+        for block in sorted(self._blocks.values(), key=lambda b: b.number):
+            if number - block.number < self.confirmation_depth:
+                break
+            if block in orphaned:
+                continue
+            canonical = self._chain.get(block.number)
+            if canonical is None:
+                canonical_header = await self.get_header(block.number)
+                if canonical_header is None:
+                    continue
+                canonical = _hash_bytes(canonical_header['hash'])
+            (confirmed if canonical == block.block_hash else orphaned).append(block)
+        
+        fork_block = min(replaced + [b.number for b in orphaned], default=None)
+        if fork_block is not None:
+            self.reorgs += 1
+            logger.warning(f"Reorg detected at block {fork_block} (head {number}), "
+                           f"orphaning {len(orphaned)} buffered blocks")
+        
+        for block in sorted(orphaned, key=lambda b: b.number):
+            del self._blocks[block.block_hash]
+            self.orphaned_blocks += 1
+            await self.on_orphaned(block)
+        
+        for block in confirmed:
+            del self._blocks[block.block_hash]
+            self.confirmed_blocks += 1
+            await self.on_confirmed(block)
+        
+        for n in [n for n in self._chain if n <= number - self.max_depth]:
+            del self._chain[n]
+        
+        return fork_block
+    
+    async def orphan_block(self, block_hash) -> bool:
+        """Orphan a buffered block reported as removed, e.g. by a removed log"""
+        block = self._blocks.pop(_hash_bytes(block_hash), None)
+        if block is None:
+            return False
+        
+        if self._chain.get(block.number) == block.block_hash:
+            del self._chain[block.number]
+        self.orphaned_blocks += 1
+        await self.on_orphaned(block)
+        return True
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get confirmation statistics"""
+        return {
+            'confirmation_depth': self.confirmation_depth,
+            'head': self.head,
+            'pending_blocks': len(self._blocks),
+            'pending_events': sum(len(b.events) for b in self._blocks.values()),
+            'confirmed_blocks': self.confirmed_blocks,
+            'orphaned_blocks': self.orphaned_blocks,
+            'reorgs': self.reorgs,
+            'stale_events': self.stale_events
+        }
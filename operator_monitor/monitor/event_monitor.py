@@ -2,13 +2,21 @@
 
 import asyncio
 import logging
-from typing import Dict, Any, List, Union
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Union, Callable, Awaitable
 from ..core.web3_client import Web3Client
+from ..core.async_web3_client import AsyncWeb3Client
 from ..core.contract_interface import ContractInterface
 from ..core.event_processor import EventProcessor
+from ..core.event_router import EventRouter
+from ..core.monitored_event import MonitoredEvent
 from ..notifications.notification_manager import NotificationManager
 from ..data.event_store import EventStoreInterface
 from ..data.redis_event_store import RedisEventStore
+from .log_tail_poller import LogTailPoller, BlockCursor
+from .websocket_subscriber import WebSocketLogSubscriber
+from .confirmation_buffer import ConfirmationBuffer, PendingBlock
+from .event_pipeline import EventPipeline, PriorityClassifier, DEFAULT_EVENT_PRIORITIES
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +26,13 @@ class EventMonitor:
     
     def __init__(self, web3_client: Web3Client, contracts: Union[ContractInterface, List[ContractInterface]],
                  event_processor: EventProcessor, notification_manager: NotificationManager,
-                 event_store: EventStoreInterface = None, redis_store: RedisEventStore = None):
+                 event_store: EventStoreInterface = None, redis_store: RedisEventStore = None,
+                 async_web3_client: AsyncWeb3Client = None, use_log_tail: bool = True,
+                 cursor_path: str = None, ws_url: str = None, dedupe_window: int = 10000,
+                 confirmation_depth: int = 12, pipeline_workers: int = 4, notify_workers: int = 2,
+                 queue_size: int = 1000, backpressure: str = 'block', low_priority_events: List[str] = None,
+                 event_priorities: Dict[str, str] = None, confirmed_only: bool = False,
+                 on_confirmed: Optional[Callable[[MonitoredEvent], Awaitable[None]]] = None):
         """
         Initialize event monitor
         
@@ -29,19 +43,93 @@ class EventMonitor:
             notification_manager: NotificationManager instance
             event_store: Optional event store for persistence
             redis_store: Optional Redis store for validator-operator mapping
+            async_web3_client: Optional AsyncWeb3Client for non-blocking RPC calls
+            use_log_tail: Tail new blocks with one eth_getLogs per poll instead of one
+                eth_newFilter per event type
+            cursor_path: Optional file persisting the last processed block of the log tail
+            ws_url: Optional WebSocket RPC URL; events are then pushed via eth_subscribe
+                and the log tail only fills gaps after a dropped connection
+            dedupe_window: Number of recent (blockHash, transactionHash, logIndex) keys
+                remembered to drop events delivered by both the subscription and the gap fill
+            confirmation_depth: Blocks on top of an event's block before it is confirmed;
+                events are handled as tentative right away and their store writes are
+                reverted if the block is orphaned. 0 disables reorg tracking
+            pipeline_workers: Handler workers behind the bounded ingestion queue; 0 handles
+                events inline in the ingestion loop
+            notify_workers: Workers sending notifications off the handler workers
+            queue_size: Capacity of each pipeline stage
+            backpressure: 'block' ingestion when a stage is full, or 'drop_low_priority'
+            low_priority_events: 'Contract.Event' or 'Contract' specs in the low priority class,
+                which may be dropped
+            event_priorities: 'Contract.Event' or 'Contract' specs mapped to a priority class
+                (critical, high, normal, low); defaults to critical slashing and deregistration
+            confirmed_only: Hold events until their block is confirmed and only then handle
+                and alert them, trading confirmation_depth blocks of latency for no retractions
+            on_confirmed: Optional coroutine called with each event once its block is confirmed
         """
         self.web3_client = web3_client
+        self.async_web3_client = async_web3_client
         # Ensure contracts is always a list
         self.contracts = contracts if isinstance(contracts, list) else [contracts]
         self.event_processor = event_processor
         self.notification_manager = notification_manager
         self.event_store = event_store
         self.redis_store = redis_store
+        self.use_log_tail = use_log_tail
+        self.dedupe_window = dedupe_window
+        self._delivered: OrderedDict = OrderedDict()
+        self.duplicates_dropped = 0
+        priorities = dict(DEFAULT_EVENT_PRIORITIES if event_priorities is None else event_priorities)
+        for spec in low_priority_events or []:
+            priorities.setdefault(spec, 'low')
+        self.classifier = PriorityClassifier(priorities)
+        if notification_manager.is_critical is None:
+            notification_manager.is_critical = self.classifier.is_critical
+        # Compiled once: (address, topic0) and (address, event) lookups replace per-log contract scans
+        self.router = EventRouter(self.contracts, event_processor.handlers)
+        # Created once so the cursor survives reconnections even when it is not persisted
+        self.log_tail = LogTailPoller(
+            web3_client, self.contracts, self._deliver_event,
+            async_web3_client=async_web3_client,
+            cursor=BlockCursor(cursor_path),
+            priority_of=self.classifier.priority_of,
+            router=self.router
+        ) if use_log_tail or ws_url else None
+        # Heads are only seen by the log tail and the subscriber, so legacy filters stay unbuffered
+        self.confirmed_only = confirmed_only
+        self.on_confirmed = on_confirmed
+        self.confirmation_buffer = ConfirmationBuffer(
+            self.log_tail.get_header, self._on_block_confirmed, self._on_block_orphaned,
+            confirmation_depth=confirmation_depth
+        ) if self.log_tail and confirmation_depth > 0 else None
+        if self.confirmation_buffer:
+            self.log_tail.on_head = self.confirmation_buffer.on_head
+        self.pipeline = EventPipeline(
+            self.process_event, self.send_event_notification,
+            workers=pipeline_workers, notify_workers=notify_workers, queue_size=queue_size,
+            backpressure=backpressure, classifier=self.classifier
+        ) if pipeline_workers > 0 else None
+        if self.log_tail:
+            # Buffered and queued events are lost on restart unless their blocks are fetched again
+            self.log_tail.cursor.hold = self._lowest_unfinished_block
+        self.subscriber = WebSocketLogSubscriber(
+            ws_url, self.log_tail, self._deliver_event,
+            on_head=self.confirmation_buffer.on_head if self.confirmation_buffer else None,
+            on_removed=self._on_log_removed if self.confirmation_buffer else None
+        ) if ws_url else None
         
         contract_names = [c.contract_name for c in self.contracts]
         redis_status = "enabled" if redis_store else "disabled"
         logger.info(f"Event monitor initialized with contracts: {', '.join(contract_names)}, Redis: {redis_status}")
     
+    def _lowest_unfinished_block(self) -> Optional[int]:
+        """Lowest block with events awaiting confirmation or still in the pipeline"""
+        blocks = [
+            self.confirmation_buffer.lowest_pending() if self.confirmation_buffer else None,
+            self.pipeline.lowest_in_flight() if self.pipeline else None
+        ]
+        return min((block for block in blocks if block is not None), default=None)
+    
     async def listen_for_events(self, from_block='latest', poll_interval: int = 2):
         """
         Listen for all contract events using improved async pattern
@@ -51,6 +139,18 @@ class EventMonitor:
             poll_interval: Seconds between polls
         """
         logger.info(f"Starting event listener from block: {from_block}")
+        if self.pipeline:
+            self.pipeline.start()
+        
+        if self.subscriber:
+            self._print_banner()
+            await self.subscriber.run(from_block)
+            return
+        
+        if self.log_tail:
+            self._print_banner()
+            await self.log_tail.run(from_block, poll_interval)
+            return
         
         # Create event filters for all contracts
         try:
@@ -61,11 +161,7 @@ class EventMonitor:
             
             logger.info(f"Created {len(all_event_filters)} event filters across {len(self.contracts)} contracts")
             
-            print("\n🚀 Multi-Contract Event Monitor is now running...")
-            print(f"📡 Monitoring {len(self.contracts)} contracts... (Press Ctrl+C to stop)")
-            for contract in self.contracts:
-                print(f"   📄 {contract.contract_name}: {contract.contract_address}")
-            print("="*80)
+            self._print_banner()
             
         except Exception as e:
             logger.error(f"Error creating event filters: {e}")
@@ -95,45 +191,135 @@ class EventMonitor:
                 logger.error(f"Error polling events: {e}")
                 await asyncio.sleep(poll_interval * 2)  # Wait longer on error
     
+    def _print_banner(self):
+        """Print the monitored contracts once listening starts"""
+        print("\n🚀 Multi-Contract Event Monitor is now running...")
+        print(f"📡 Monitoring {len(self.contracts)} contracts... (Press Ctrl+C to stop)")
+        for contract in self.contracts:
+            print(f"   📄 {contract.contract_name}: {contract.contract_address}")
+        print("="*80)
+    
     async def _process_filter(self, event_filter):
         """Process a single event filter"""
         try:
-            for event in event_filter.get_new_entries():
-                # Convert AttributeDict to regular dict to allow modifications
-                event_dict = dict(event)
-                
-                # Try to identify which contract this event came from
-                event_contract = self._identify_contract_for_event(event_dict)
-                if event_contract:
-                    event_dict['contract_name'] = event_contract.contract_name
-                    event_dict['contract_address'] = event_contract.contract_address
+            # Poll in a worker thread so one slow filter does not stall the others
+            new_entries = await asyncio.to_thread(event_filter.get_new_entries)
+            
+            for event in new_entries:
+                # Identify which contract this event came from
+                route = self.router.route_event(event)
+                if route:
+                    record = MonitoredEvent.from_event(event, route.contract.contract_name, route.contract.contract_address)
+                else:
+                    record = MonitoredEvent.from_event(event)
                 
-                await self.handle_event(event_dict)
+                await self._dispatch(record)
         except Exception as e:
             logger.error(f"Error processing filter: {e}")
     
-    def _identify_contract_for_event(self, event: Dict[str, Any]) -> ContractInterface:
-        """Identify which contract an event belongs to"""
-        event_address = event.get('address', '').lower()
+    async def _deliver_event(self, event: MonitoredEvent):
+        """Hand an event to handle_event unless it was recently delivered already"""
+        # The block hash is part of the key so a transaction re-included after a reorg is delivered again
+        key = event.key
+        if key in self._delivered:
+            self.duplicates_dropped += 1
+            return
         
-        for contract in self.contracts:
-            if contract.contract_address.lower() == event_address:
-                return contract
+        self._delivered[key] = None
+        if len(self._delivered) > self.dedupe_window:
+            self._delivered.popitem(last=False)
+        
+        if self.confirmation_buffer:
+            if not self.confirmation_buffer.add_event(event):
+                logger.info(f"Skipping {event['event']} from orphaned block {event['blockNumber']}")
+                return
+            event.confirmation_status = 'tentative'
+            if self.confirmed_only:
+                return
+        
+        await self._dispatch(event)
+    
+    async def _dispatch(self, event: MonitoredEvent):
+        """Queue an event on the pipeline, or handle it inline when the pipeline is disabled"""
+        if self.pipeline:
+            await self.pipeline.submit(event)
+        else:
+            await self.handle_event(event)
+    
+    async def _on_block_confirmed(self, block: PendingBlock):
+        """Emit the events of a block that reached the confirmation depth"""
+        for event in block.events:
+            event.confirmation_status = 'confirmed'
+            # Lets the transaction cache persist the transaction across restarts
+            if 'transactionHash' in event:
+                self.event_processor.transaction_cache.mark_confirmed(event['transactionHash'])
+            # Held back until now in confirmed-only mode, handled as tentative otherwise
+            if self.confirmed_only:
+                await self._dispatch(event)
+            if self.on_confirmed:
+                try:
+                    await self.on_confirmed(event)
+                except Exception as e:
+                    logger.error(f"Error in confirmation callback for {event.event}: {e}")
+        logger.info(f"Confirmed {len(block.events)} events in block {block.number}")
+    
+    async def _on_block_orphaned(self, block: PendingBlock):
+        """Revert state derived from an orphaned block and retract its alerts"""
+        for event in block.events:
+            event.confirmation_status = 'orphaned'
+        
+        for action in reversed(block.undo):
+            try:
+                action()
+            except Exception as e:
+                logger.error(f"Error reverting state of orphaned block {block.number}: {e}")
+        
+        if self.event_store:
+            self.event_store.remove_block_events(block.block_hash)
         
-        return None
+        # Nothing was handled or alerted for the block, so there is nothing to retract
+        if self.confirmed_only:
+            logger.info(f"Dropped {len(block.events)} unconfirmed events of orphaned block {block.number}")
+            return
+        
+        event_names = ', '.join(sorted({event.event for event in block.events}))
+        message = (f"⚠️ REORG: block {block.number} (0x{block.block_hash.hex()}) was orphaned; "
+                   f"{len(block.events)} tentative events reverted: {event_names}")
+        logger.warning(message)
+        await self.notification_manager.send_notification_async(message)
+    
+    async def _on_log_removed(self, log: Dict[str, Any]):
+        """Orphan the block of a log the node reported as removed"""
+        await self.confirmation_buffer.orphan_block(log['blockHash'])
     
-    async def handle_event(self, event: Dict[str, Any]):
+    async def handle_event(self, event: MonitoredEvent):
         """Handle and process an event"""
+        console_message = await self.process_event(event)
+        if console_message is not None:
+            await self.send_event_notification(console_message, event)
+    
+    async def process_event(self, event: MonitoredEvent) -> Optional[str]:
+        """
+        Validate, store and format an event
+        
+        Returns:
+            Console message to notify with, or None if the event was skipped
+        """
         try:
+            # Skip events whose block was orphaned while they were queued
+            if event.confirmation_status == 'orphaned':
+                logger.info(f"Event {event.event} from orphaned block {event.block_number}, skipping")
+                return None
+            
             # Validate event
             if not self.event_processor.validate_event(event):
                 logger.warning("Invalid event received, skipping")
-                return
+                return None
             
             # Check if event should be processed (filters out unwanted events)
             if not self.event_processor.should_process_event(event):
                 logger.debug(f"Event {event['event']} filtered out, skipping")
-                return
+                return None
             
             # Store event if persistence is enabled
             if self.event_store:
@@ -144,10 +330,17 @@ class EventMonitor:
                 await self._handle_redis_storage(event)
             
             # Format for console display
-            console_message = self.event_processor.format_event(event)
-            
-            # Send notifications through all channels
-            success = self.notification_manager.send_notification(console_message, event)
+            return await self.event_processor.format_event(event)
+                
+        except Exception as e:
+            logger.error(f"Error processing event: {e}")
+            print(f"Raw event: {event}")
+            return None
+    
+    async def send_event_notification(self, console_message: str, event: MonitoredEvent):
+        """Send an event notification through all channels without blocking the event loop"""
+        try:
+            success = await self.notification_manager.send_notification_async(console_message, event)
             
             if success:
                 logger.info(f"Event {event['event']} from {event.get('contract_name', 'Unknown')} processed and notifications sent")
@@ -155,29 +348,48 @@ class EventMonitor:
                 logger.warning(f"Event {event['event']} from {event.get('contract_name', 'Unknown')} processed but notifications failed")
                 
         except Exception as e:
-            logger.error(f"Error processing event: {e}")
-            print(f"Raw event: {event}")
+            logger.error(f"Error sending notification for event {event['event']}: {e}")
     
-    async def _handle_redis_storage(self, event: Dict[str, Any]):
+    async def _handle_redis_storage(self, event: MonitoredEvent):
         """Handle Redis storage for validator-operator mapping"""
         try:
             # Extract operator-validator mapping from Registry OperatorRegistered events
-            mapping = self.event_processor.get_operator_validator_mapping(event)
+            mapping = await self.event_processor.get_operator_validator_mapping(event)
             
             if mapping:
                 operator_address, validator_pubkeys = mapping
                 
-                # Store in Redis
-                success = self.redis_store.store_operator_validators(operator_address, validator_pubkeys)
+                # Store in Redis; the store reports which keys are new so an orphaned
+                # registration only removes those
+                added = self.redis_store.add_operator_validators(operator_address, validator_pubkeys)
                 
-                if success:
+                if added is not None:
                     logger.info(f"Stored {len(validator_pubkeys)} validators for operator {operator_address} in Redis")
+                    if self.confirmation_buffer and added:
+                        undo = lambda: self.redis_store.remove_operator_validators(operator_address, added)
+                        # The block may have been orphaned while the mapping was fetched
+                        if event.confirmation_status == 'orphaned':
+                            undo()
+                        else:
+                            self.confirmation_buffer.add_undo(event, undo)
                 else:
                     logger.warning(f"Failed to store validators for operator {operator_address} in Redis")
             
         except Exception as e:
             logger.error(f"Error handling Redis storage: {e}")
     
+    async def close(self):
+        """Handle queued events and stop the pipeline workers"""
+        if self.pipeline:
+            await self.pipeline.stop()
+    
+    async def health_check(self) -> Dict[str, Any]:
+        """Run an RPC health check without blocking the event loop"""
+        if self.async_web3_client:
+            return await self.async_web3_client.health_check()
+        
+        return await asyncio.to_thread(self.web3_client.health_check)
+    
     def get_status(self) -> Dict[str, Any]:
         """Get monitor status information"""
         try:
@@ -200,6 +412,13 @@ class EventMonitor:
                 'active_notifiers': active_notifiers,
                 'event_store_enabled': self.event_store is not None,
                 'redis_store_enabled': self.redis_store is not None,
+                'transaction_cache': self.event_processor.transaction_cache.get_stats(),
+                'calldata_decoders': self.event_processor.calldata_decoder.get_decoder_stats() if self.event_processor.calldata_decoder else None,
+                'log_tail': self.log_tail.get_stats() if self.log_tail else None,
+                'subscriber': self.subscriber.get_stats() if self.subscriber else None,
+                'confirmations': self.confirmation_buffer.get_stats() if self.confirmation_buffer else None,
+                'pipeline': self.pipeline.get_stats() if self.pipeline else None,
+                'duplicates_dropped': self.duplicates_dropped,
                 'contracts': contract_info
             }
         except Exception as e:
@@ -0,0 +1,339 @@
+"""Staged event handling over bounded queues"""
+
+import asyncio
+import itertools
+import logging
+import time
+from collections import Counter, deque
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Tuple
+
+logger = logging.getLogger(__name__)
+
+BACKPRESSURE_POLICIES = ('block', 'drop_low_priority')
+
+# Lower values are scheduled first
+PRIORITY_CLASSES = {'critical': 0, 'high': 1, 'normal': 2, 'low': 3}
+PRIORITY_NAMES = {value: name for name, value in PRIORITY_CLASSES.items()}
+
+DEFAULT_EVENT_PRIORITIES = {
+    'Registry.OperatorSlashed': 'critical',
+    'Registry.OperatorUnregistered': 'critical',
+    'TaiyiRegistryCoordinator.OperatorDeregistered': 'critical'
+}
+
+
+class PriorityClassifier:
+    """Maps (contract_name, event) to a priority class"""
+    
+    def __init__(self, priorities: Dict[str, str], default: str = 'normal'):
+        """
+        Initialize priority classifier
+        
+        Args:
+            priorities: 'Contract.Event' or 'Contract' specs mapped to a class name in
+                PRIORITY_CLASSES; a bare contract name covers all of its events
+            default: Class of events not listed
+        """
+        self.default = self._class_value(default)
+        self._rules: Dict[Tuple[str, Optional[str]], int] = {}
+        for spec, class_name in priorities.items():
+            contract_name, _, event_name = spec.strip().partition('.')
+            self._rules[(contract_name, event_name or None)] = self._class_value(class_name)
+    
+    @staticmethod
+    def _class_value(class_name: str) -> int:
+        """Validate a priority class name and return its value"""
+        value = PRIORITY_CLASSES.get(class_name.strip().lower())
+        if value is None:
+            raise ValueError(f"Unknown priority class {class_name}, expected one of {list(PRIORITY_CLASSES)}")
+        return value
+    
+    def priority_of(self, event: Dict[str, Any]) -> int:
+        """Priority value of an event, event-level rules win over contract-level rules"""
+        contract_name = event.get('contract_name')
+        value = self._rules.get((contract_name, event.get('event')))
+        if value is None:
+            value = self._rules.get((contract_name, None), self.default)
+        return value
+    
+    def is_critical(self, event: Dict[str, Any]) -> bool:
+        """Whether an event belongs to the critical class"""
+        return self.priority_of(event) == PRIORITY_CLASSES['critical']
+    
+    def is_low_priority(self, event: Dict[str, Any]) -> bool:
+        """Whether an event belongs to the low class and may be dropped under backpressure"""
+        return self.priority_of(event) >= PRIORITY_CLASSES['low']
+
+
+class StageMetrics:
+    """Throughput and latency of one pipeline stage"""
+    
+    def __init__(self, sample_size: int = 500):
+        """
+        Initialize stage metrics
+        
+        Args:
+            sample_size: Number of recent latency samples kept for percentiles
+        """
+        self.sample_size = sample_size
+        self.wait_times = deque(maxlen=sample_size)
+        self.wait_times_by_priority: Dict[int, deque] = {}
+        self.service_times = deque(maxlen=sample_size)
+        self.processed = 0
+        self.dropped = 0
+        self.errors = 0
+        self.max_depth = 0
+    
+    def record(self, wait_time: float, service_time: float, priority: int):
+        """Record the queue wait and handling time of one item in seconds"""
+        self.processed += 1
+        self.wait_times.append(wait_time)
+        self.service_times.append(service_time)
+        if priority not in self.wait_times_by_priority:
+            self.wait_times_by_priority[priority] = deque(maxlen=self.sample_size)
+        self.wait_times_by_priority[priority].append(wait_time)
+    
+    @staticmethod
+    def _summary(samples: deque) -> Optional[Dict[str, float]]:
+        """p50, p95 and max of the samples in milliseconds"""
+        if not samples:
+            return None
+        
+        ordered = sorted(samples)
+        
+        def percentile(p: float) -> float:
+            return round(ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))] * 1000, 2)
+        
+        return {'p50': percentile(50), 'p95': percentile(95), 'max': round(ordered[-1] * 1000, 2)}
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get stage statistics"""
+        return {
+            'processed': self.processed,
+            'dropped': self.dropped,
+            'errors': self.errors,
+            'max_depth': self.max_depth,
+            'wait_ms': self._summary(self.wait_times),
+            'wait_ms_by_priority': {
+                PRIORITY_NAMES[priority]: self._summary(samples)
+                for priority, samples in sorted(self.wait_times_by_priority.items())
+            },
+            'service_ms': self._summary(self.service_times)
+        }
+
+
+class PipelineStage:
+    """Bounded priority queues drained by workers, each contract always routed to the same worker"""
+    
+    def __init__(self, name: str, handler: Callable[[Any], Awaitable[None]], workers: int = 1,
+                 queue_size: int = 1000, backpressure: str = 'block',
+                 classifier: Optional[PriorityClassifier] = None):
+        """
+        Initialize pipeline stage
+        
+        Args:
+            name: Stage name used in logs and metrics
+            handler: Coroutine called with each queued item
+            workers: Number of workers, each owning one queue
+            queue_size: Total capacity shared across the worker queues
+            backpressure: 'block' to wait for space when full, or 'drop_low_priority'
+                to drop low priority events instead of waiting
+            classifier: Priority classifier; higher classes are handled first within a
+                queue and critical events never wait for space
+        """
+        if backpressure not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"Unknown backpressure policy {backpressure}, expected one of {BACKPRESSURE_POLICIES}")
+        
+        self.name = name
+        self.handler = handler
+        self.backpressure = backpressure
+        self.classifier = classifier or PriorityClassifier({})
+        self.capacity = max(1, queue_size // workers)
+        self.queues = [asyncio.PriorityQueue() for _ in range(workers)]
+        self._space = [asyncio.Condition() for _ in range(workers)]
+        # Tie breaker keeping FIFO order within a priority class
+        self._sequence = itertools.count()
+        self.metrics = StageMetrics()
+        self._tasks: List[asyncio.Task] = []
+    
+    @property
+    def depth(self) -> int:
+        """Items currently queued"""
+        return sum(queue.qsize() for queue in self.queues)
+    
+    def _shard_for(self, event: Dict[str, Any]) -> int:
+        """Events of one contract share a queue so a single worker handles them in order"""
+        key = event.get('contract_address') or event.get('address')
+        return hash(key) % len(self.queues)
+    
+    def start(self):
+        """Start the workers"""
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._worker(shard)) for shard in range(len(self.queues))]
+    
+    async def put(self, event: Dict[str, Any], item: Any) -> bool:
+        """
+        Queue an item belonging to an event
+        
+        Returns:
+            False if the item was dropped by the backpressure policy
+        """
+        shard = self._shard_for(event)
+        queue = self.queues[shard]
+        priority = self.classifier.priority_of(event)
+        
+        if queue.qsize() >= self.capacity and priority != PRIORITY_CLASSES['critical']:
+            if self.backpressure == 'drop_low_priority' and self.classifier.is_low_priority(event):
+                self.metrics.dropped += 1
+                logger.warning(f"{self.name} stage full, dropping low priority {event['event']} "
+                               f"from {event.get('contract_name', 'Unknown')}")
+                return False
+            
+            async with self._space[shard]:
+                await self._space[shard].wait_for(lambda: queue.qsize() < self.capacity)
+        
+        queue.put_nowait((priority, next(self._sequence), time.monotonic(), item))
+        self.metrics.max_depth = max(self.metrics.max_depth, self.depth)
+        return True
+    
+    async def _worker(self, shard: int):
+        """Handle queued items one at a time, highest priority first"""
+        queue = self.queues[shard]
+        while True:
+            priority, _, enqueued_at, item = await queue.get()
+            async with self._space[shard]:
+                self._space[shard].notify()
+            
+            started_at = time.monotonic()
+            try:
+                await self.handler(item)
+            except Exception as e:
+                self.metrics.errors += 1
+                logger.error(f"Error in {self.name} stage: {e}")
+            finally:
+                self.metrics.record(started_at - enqueued_at, time.monotonic() - started_at, priority)
+                queue.task_done()
+    
+    async def join(self):
+        """Wait until every queued item was handled"""
+        await asyncio.gather(*(queue.join() for queue in self.queues))
+    
+    async def stop(self):
+        """Cancel the workers"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get stage statistics including the current queue depth"""
+        return {'depth': self.depth, 'workers': len(self.queues), **self.metrics.get_stats()}
+
+
+class EventPipeline:
+    """Ingestion -> handler workers -> notification workers, decoupled by bounded queues"""
+    
+    def __init__(self, handle: Callable[[Dict[str, Any]], Awaitable[Optional[str]]],
+                 notify: Callable[[str, Dict[str, Any]], Awaitable[None]],
+                 workers: int = 4, notify_workers: int = 2, queue_size: int = 1000,
+                 backpressure: str = 'block', classifier: Optional[PriorityClassifier] = None):
+        """
+        Initialize event pipeline
+        
+        Ingestion only waits for queue space, so a slow Redis write or Slack call
+        no longer holds up log polling. Events of the same contract and priority class
+        keep their order through both stages, while higher classes skip ahead of queued
+        lower class work at every stage.
+        
+        Args:
+            handle: Coroutine processing an event, returns the notification message or None
+            notify: Coroutine sending a notification message for an event
+            workers: Number of handler workers
+            notify_workers: Number of notification workers
+            queue_size: Capacity of each stage's queues
+            backpressure: 'block' or 'drop_low_priority' when a stage is full
+            classifier: Priority classifier for (contract_name, event)
+        """
+        self.handle = handle
+        self.notify = notify
+        self.handler_stage = PipelineStage('handler', self._handle, workers, queue_size,
+                                           backpressure, classifier)
+        self.notification_stage = PipelineStage('notification', self._notify, notify_workers, queue_size,
+                                                backpressure, classifier)
+        self.submitted = 0
+        # Events per block not yet through both stages
+        self._in_flight: Counter = Counter()
+    
+    def lowest_in_flight(self) -> Optional[int]:
+        """Lowest block with an event still queued or being handled, the pipeline's watermark"""
+        return min(self._in_flight, default=None)
+    
+    def _release(self, event: Dict[str, Any]):
+        """Mark an event as done with, whether it was handled, dropped or failed"""
+        block_number = event.get('blockNumber')
+        if block_number is None:
+            return
+        self._in_flight[block_number] -= 1
+        if self._in_flight[block_number] <= 0:
+            del self._in_flight[block_number]
+    
+    def start(self):
+        """Start the stage workers, safe to call repeatedly"""
+        self.handler_stage.start()
+        self.notification_stage.start()
+    
+    async def submit(self, event: Dict[str, Any]) -> bool:
+        """
+        Queue an event for handling
+        
+        Returns:
+            False if the event was dropped by the backpressure policy
+        """
+        self.submitted += 1
+        if event.get('blockNumber') is not None:
+            self._in_flight[event['blockNumber']] += 1
+        queued = await self.handler_stage.put(event, event)
+        if not queued:
+            self._release(event)
+        return queued
+    
+    async def _handle(self, event: Dict[str, Any]):
+        """Handler stage: process the event and pass its message on"""
+        forwarded = False
+        try:
+            message = await self.handle(event)
+            if message is not None:
+                forwarded = await self.notification_stage.put(event, (message, event))
+        finally:
+            if not forwarded:
+                self._release(event)
+    
+    async def _notify(self, item: Tuple[str, Dict[str, Any]]):
+        """Notification stage: send the message"""
+        message, event = item
+        try:
+            await self.notify(message, event)
+        finally:
+            self._release(event)
+    
+    async def stop(self, drain: bool = True):
+        """
+        Stop the workers
+        
+        Args:
+            drain: Handle everything already queued before stopping
+        """
+        if drain:
+            await self.handler_stage.join()
+            await self.notification_stage.join()
+        await self.handler_stage.stop()
+        await self.notification_stage.stop()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-stage statistics"""
+        return {
+            'submitted': self.submitted,
+            'lowest_in_flight_block': self.lowest_in_flight(),
+            'handler': self.handler_stage.get_stats(),
+            'notification': self.notification_stage.get_stats()
+        }
@@ -0,0 +1,234 @@
+"""Cursor-based live tailing of contract logs"""
+
+import asyncio
+import json
+import logging
+import os
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Union
+
+from ..core.contract_interface import ContractInterface
+from ..core.event_router import EventRouter
+from ..core.log_decoder import LogDecoder
+from ..core.web3_client import Web3Client
+from ..data.event_fetcher import event_sort_key
+
+logger = logging.getLogger(__name__)
+
+
+class BlockCursor:
+    """Last fully processed block, optionally persisted to a JSON file"""
+    
+    def __init__(self, path: Optional[str] = None, hold: Optional[Callable[[], Optional[int]]] = None):
+        """
+        Initialize block cursor
+        
+        Args:
+            path: Optional JSON file the cursor is persisted to after every advance
+            hold: Optional callable returning the lowest block whose events are still
+                only held in memory; the persisted cursor stays below it so a restart
+                fetches those events again
+        """
+        self.path = path
+        self.hold = hold
+        self.block: Optional[int] = None
+        self.load()
+    
+    def load(self) -> Optional[int]:
+        """Load the persisted cursor, returns the block or None"""
+        if not self.path or not os.path.exists(self.path):
+            return None
+        
+        try:
+            with open(self.path, 'r') as f:
+                self.block = int(json.load(f)['last_processed_block'])
+            logger.info(f"Resuming log tail after block {self.block} from {self.path}")
+        except Exception as e:
+            logger.warning(f"Could not load block cursor from {self.path}: {e}")
+        return self.block
+    
+    def advance(self, block: int):
+        """Move the cursor forward and persist it"""
+        self.block = block
+        if not self.path:
+            return
+        
+        held = self.hold() if self.hold else None
+        if held is not None:
+            block = min(block, held - 1)
+        
+        try:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({'last_processed_block': block}, f)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"Could not persist block cursor to {self.path}: {e}")
+
+
+class LogTailPoller:
+    """Polls new blocks with one eth_getLogs over cursor+1..head for every monitored contract"""
+    
+    def __init__(self, web3_client: Web3Client, contracts: Union[ContractInterface, List[ContractInterface]],
+                 on_event: Callable[[Dict[str, Any]], Awaitable[None]], async_web3_client=None,
+                 cursor: Optional[BlockCursor] = None, max_range: int = 2000,
+                 on_head: Optional[Callable[[Dict[str, Any]], Awaitable[Optional[int]]]] = None,
+                 priority_of: Optional[Callable[[Dict[str, Any]], int]] = None,
+                 router: Optional[EventRouter] = None):
+        """
+        Initialize log tail poller
+        
+        Unlike eth_newFilter based polling there is no server-side state to expire,
+        and each new head costs one eth_blockNumber and one eth_getLogs call no matter
+        how many contracts and event types are monitored.
+        
+        Args:
+            web3_client: Web3Client instance
+            contracts: Single contract or list of contracts to monitor
+            on_event: Coroutine called with each decoded event, in chain order within a priority class
+            async_web3_client: Optional AsyncWeb3Client for non-blocking RPC calls
+            cursor: Block cursor, an in-memory cursor is used if not given
+            max_range: Maximum blocks per eth_getLogs call when catching up
+            on_head: Optional coroutine called with the head header after each poll; it
+                returns the lowest block replaced by a reorg so the cursor can rewind
+            priority_of: Optional event priority, lower values are delivered first from each range
+            router: Optional router compiled for the same contracts, shared with the monitor
+        """
+        self.web3_client = web3_client
+        self.async_web3_client = async_web3_client
+        self.contracts = contracts if isinstance(contracts, list) else [contracts]
+        self.on_event = on_event
+        self.cursor = cursor or BlockCursor()
+        self.max_range = max_range
+        self.on_head = on_head
+        self.priority_of = priority_of
+        self.log_decoder = LogDecoder(self.contracts, router)
+        self.polls = 0
+        self.get_logs_calls = 0
+        self.events_processed = 0
+    
+    def start_from(self, from_block: Union[int, str], head: int):
+        """
+        Position a cursor that has not been persisted yet
+        
+        Args:
+            from_block: 'latest' to start with the next block, or the first block to process
+            head: Current head block number
+        """
+        if self.cursor.block is not None:
+            return
+        
+        if from_block == 'latest':
+            self.cursor.advance(head)
+        elif from_block == 'earliest':
+            self.cursor.advance(-1)
+        else:
+            self.cursor.advance(int(from_block) - 1)
+        logger.info(f"Log tail starting after block {self.cursor.block}")
+    
+    async def get_head(self) -> int:
+        """Current head block number"""
+        if self.async_web3_client:
+            return await self.async_web3_client.get_current_block()
+        return await asyncio.to_thread(self.web3_client.get_current_block)
+    
+    async def get_header(self, block_number: int) -> Optional[Dict[str, Any]]:
+        """Block header with number, hash and parentHash, or None if unavailable"""
+        if self.async_web3_client:
+            return await self.async_web3_client.get_block(block_number)
+        
+        try:
+            block = await asyncio.to_thread(self.web3_client.web3.eth.get_block, block_number)
+            return {'number': block.number, 'hash': block.hash, 'parentHash': block.parentHash}
+        except Exception as e:
+            logger.error(f"Error fetching block {block_number}: {e}")
+            return None
+    
+    def rewind(self, block_number: int):
+        """Move the cursor back so blocks from block_number on are fetched again"""
+        if self.cursor.block is not None and self.cursor.block >= block_number:
+            logger.info(f"Rewinding log tail from block {self.cursor.block} to {block_number - 1}")
+            self.cursor.advance(block_number - 1)
+    
+    async def _get_logs(self, filter_params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run eth_getLogs without blocking the event loop"""
+        self.get_logs_calls += 1
+        if self.async_web3_client:
+            return await self.async_web3_client.get_logs(filter_params)
+        return await asyncio.to_thread(self.web3_client.web3.eth.get_logs, filter_params)
+    
+    async def poll_once(self, head: Optional[int] = None) -> int:
+        """
+        Process every block between the cursor and the head
+        
+        The cursor only advances after every event of a range was passed to
+        on_event, so a failed call is retried from the same block on the next poll.
+        When on_event only queues the event (e.g. on the event pipeline), the
+        persisted cursor is held below blocks whose events are still in flight
+        through BlockCursor.hold, so a restart fetches them again.
+        
+        Args:
+            head: Head block number if already known
+        
+        Returns:
+            Number of events passed to on_event
+        """
+        self.polls += 1
+        if head is None:
+            head = await self.get_head()
+        
+        handled = 0
+        while self.cursor.block < head:
+            range_start = self.cursor.block + 1
+            range_end = min(head, range_start + self.max_range - 1)
+            
+            logs = await self._get_logs(self.log_decoder.build_filter_params(range_start, range_end))
+            events = self.log_decoder.decode_logs(logs)
+            if self.priority_of:
+                events.sort(key=lambda event: (self.priority_of(event), event_sort_key(event)))
+            else:
+                events.sort(key=event_sort_key)
+            
+            for event in events:
+                await self.on_event(event)
+            
+            handled += len(events)
+            self.cursor.advance(range_end)
+        
+        if self.on_head:
+            header = await self.get_header(head)
+            if header is not None:
+                fork_block = await self.on_head(header)
+                if fork_block is not None:
+                    self.rewind(fork_block)
+        
+        self.events_processed += handled
+        return handled
+    
+    async def run(self, from_block: Union[int, str] = 'latest', poll_interval: int = 2):
+        """
+        Tail new blocks until cancelled
+        
+        Args:
+            from_block: Where to start if no cursor was persisted
+            poll_interval: Seconds between head checks
+        """
+        self.start_from(from_block, await self.get_head())
+        
+        while True:
+            try:
+                await self.poll_once()
+            except Exception as e:
+                logger.error(f"Error polling logs after block {self.cursor.block}: {e}")
+            await asyncio.sleep(poll_interval)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get poller statistics"""
+        return {
+            'last_processed_block': self.cursor.block,
+            'polls': self.polls,
+            'get_logs_calls': self.get_logs_calls,
+            'events_processed': self.events_processed,
+            'addresses': len(self.log_decoder.addresses),
+            'topics': len(self.log_decoder.topics),
+            **self.log_decoder.get_stats()
+        }
@@ -41,7 +41,8 @@ class ReconnectionHandler:
         while True:
             try:
                 # Check connection health
-                if not self.event_monitor.web3_client.is_connected():
+                health = await self.event_monitor.health_check()
+                if not health['connected']:
                     logger.warning("Connection lost, attempting to reconnect...")
                     
                     if not await self._attempt_reconnection():
@@ -86,7 +87,7 @@ class ReconnectionHandler:
         
         try:
             # Test connection
-            health = self.event_monitor.web3_client.health_check()
+            health = await self.event_monitor.health_check()
             if health['connected']:
                 logger.info("Reconnection successful")
                 return True
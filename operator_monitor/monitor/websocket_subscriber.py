@@ -0,0 +1,186 @@
+"""Push-based event delivery over eth_subscribe"""
+
+import asyncio
+import json
+import logging
+from typing import Dict, Any, Optional, Callable, Awaitable, Union
+
+import websockets
+
+from ..core.log_decoder import normalize_log
+from .log_tail_poller import LogTailPoller
+
+logger = logging.getLogger(__name__)
+
+
+class WebSocketLogSubscriber:
+    """Receives logs and new heads over a WebSocket, using the log tail to fill gaps after drops"""
+    
+    def __init__(self, ws_url: str, log_tail: LogTailPoller, on_event: Callable[[Dict[str, Any]], Awaitable[None]],
+                 reconnect_delay: float = 1, max_reconnect_delay: float = 60, ping_interval: float = 20,
+                 on_head: Optional[Callable[[Dict[str, Any]], Awaitable[Optional[int]]]] = None,
+                 on_removed: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
+                 head_lag: int = 2):
+        """
+        Initialize WebSocket subscriber
+        
+        Logs are pushed to on_event as soon as the node announces them. Nodes do not
+        order log notifications against head notifications, so every new head moves
+        the log tail cursor only to head_lag blocks behind it. After a dropped socket
+        the log tail fetches everything past the cursor with eth_getLogs, so on_event
+        must tolerate the events of those trailing blocks being delivered twice.
+        
+        Args:
+            ws_url: WebSocket RPC URL
+            log_tail: Log tail poller sharing the cursor and decoding table
+            on_event: Coroutine called with each decoded event
+            reconnect_delay: Initial delay in seconds before reconnecting
+            max_reconnect_delay: Upper bound of the exponential reconnect delay
+            ping_interval: Seconds between WebSocket keepalive pings
+            on_head: Optional coroutine called with each new head header; it returns the
+                lowest block replaced by a reorg, which is then fetched again
+            on_removed: Optional coroutine called with logs the node reports as removed
+            head_lag: Blocks behind each new head the cursor is advanced to
+        """
+        self.ws_url = ws_url
+        self.log_tail = log_tail
+        self.on_event = on_event
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.ping_interval = ping_interval
+        self.on_head = on_head
+        self.on_removed = on_removed
+        self.head_lag = head_lag
+        self._subscriptions: Dict[str, str] = {}
+        self.connected = False
+        self.connections = 0
+        self.disconnects = 0
+        self.heads_received = 0
+        self.logs_received = 0
+        self.gap_fill_events = 0
+    
+    async def _subscribe(self, ws):
+        """Request newHeads and logs subscriptions; confirmations arrive in the message loop"""
+        self._subscriptions = {}
+        requests = [
+            {'jsonrpc': '2.0', 'id': 1, 'method': 'eth_subscribe', 'params': ['newHeads']},
+            {'jsonrpc': '2.0', 'id': 2, 'method': 'eth_subscribe',
+             'params': ['logs', self.log_tail.log_decoder.build_subscription_params()]}
+        ]
+        for request in requests:
+            await ws.send(json.dumps(request))
+    
+    async def _handle_message(self, message: Union[str, bytes]):
+        """Dispatch one WebSocket message"""
+        payload = json.loads(message)
+        
+        if 'id' in payload:
+            if payload.get('error'):
+                raise ConnectionError(f"eth_subscribe failed: {payload['error']}")
+            kind = 'newHeads' if payload['id'] == 1 else 'logs'
+            self._subscriptions[payload['result']] = kind
+            logger.debug(f"Subscribed to {kind} ({payload['result']})")
+            return
+        
+        if payload.get('method') != 'eth_subscription':
+            return
+        
+        params = payload['params']
+        kind = self._subscriptions.get(params['subscription'])
+        result = params['result']
+        
+        if kind == 'newHeads' or (kind is None and 'parentHash' in result):
+            await self._handle_head(result)
+        elif kind == 'logs' or (kind is None and 'topics' in result):
+            await self._handle_log(result)
+    
+    async def _handle_head(self, head: Dict[str, Any]):
+        """Advance the cursor to head_lag blocks behind a new head"""
+        self.heads_received += 1
+        block_number = int(head['number'], 16)
+        # Logs of recent blocks may still be on their way, a gap fill re-fetches them
+        settled = block_number - self.head_lag
+        if self.log_tail.cursor.block is None or settled > self.log_tail.cursor.block:
+            self.log_tail.cursor.advance(settled)
+        
+        if self.on_head:
+            fork_block = await self.on_head({
+                'number': block_number,
+                'hash': head['hash'],
+                'parentHash': head['parentHash']
+            })
+            if fork_block is not None:
+                # Re-fetch the new branch rather than relying on the node to push it
+                self.log_tail.rewind(fork_block)
+                await self._fill_gap()
+    
+    async def _handle_log(self, raw_log: Dict[str, Any]):
+        """Decode a pushed log and hand it on"""
+        self.logs_received += 1
+        log = normalize_log(raw_log)
+        if log['removed']:
+            logger.warning(f"Log {log['transactionHash'].hex()}:{log['logIndex']} removed by a reorg")
+            if self.on_removed:
+                await self.on_removed(log)
+            return
+        
+        event = self.log_tail.log_decoder.decode_log(log)
+        if event is not None:
+            await self.on_event(event)
+    
+    async def _fill_gap(self):
+        """Fetch every block past the cursor with eth_getLogs"""
+        handled = await self.log_tail.poll_once()
+        self.gap_fill_events += handled
+        if handled:
+            logger.info(f"Filled gap with {handled} events up to block {self.log_tail.cursor.block}")
+    
+    async def run(self, from_block: Union[int, str] = 'latest'):
+        """
+        Stream events until cancelled, reconnecting with exponential backoff
+        
+        Args:
+            from_block: Where to start if the log tail cursor was not persisted
+        """
+        self.log_tail.start_from(from_block, await self.log_tail.get_head())
+        delay = self.reconnect_delay
+        
+        while True:
+            try:
+                async with websockets.connect(self.ws_url, ping_interval=self.ping_interval) as ws:
+                    await self._subscribe(ws)
+                    # Fill after subscribing so nothing falls between the poll and the first push
+                    await self._fill_gap()
+                    
+                    self.connected = True
+                    self.connections += 1
+                    delay = self.reconnect_delay
+                    logger.info(f"Subscribed to logs and new heads at {self.ws_url}")
+                    
+                    async for message in ws:
+                        await self._handle_message(message)
+                
+                raise ConnectionError("WebSocket closed by server")
+            
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if self.connected:
+                    self.disconnects += 1
+                self.connected = False
+                logger.warning(f"WebSocket subscription to {self.ws_url} lost: {e}; reconnecting in {delay}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get subscriber statistics"""
+        return {
+            'ws_url': self.ws_url,
+            'connected': self.connected,
+            'connections': self.connections,
+            'disconnects': self.disconnects,
+            'heads_received': self.heads_received,
+            'logs_received': self.logs_received,
+            'gap_fill_events': self.gap_fill_events,
+            'last_processed_block': self.log_tail.cursor.block
+        }
@@ -1,8 +1,12 @@
 """Notification module exports"""
 
-from .base_notifier import NotifierInterface
+from .base_notifier import NotifierInterface, AsyncNotifierInterface, RateLimitedError
 from .console_notifier import ConsoleNotifier
 from .slack_notifier import SlackNotifier
+from .notification_coalescer import NotificationCoalescer
+from .notification_spool import SQLiteNotificationSpool
+from .circuit_breaker import CircuitBreaker
 from .notification_manager import NotificationManager
 
-__all__ = ['NotifierInterface', 'ConsoleNotifier', 'SlackNotifier', 'NotificationManager'] 
\ No newline at end of file
+__all__ = ['NotifierInterface', 'AsyncNotifierInterface', 'RateLimitedError', 'ConsoleNotifier', 'SlackNotifier', 'NotificationCoalescer',
+           'SQLiteNotificationSpool', 'CircuitBreaker', 'NotificationManager'] 
\ No newline at end of file
@@ -7,6 +7,14 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+class RateLimitedError(Exception):
+    """Raised by a notifier whose service asked it to back off before sending again"""
+    
+    def __init__(self, retry_after: float):
+        super().__init__(f"rate limited, retry after {retry_after:g}s")
+        self.retry_after = retry_after
+
+
 class NotifierInterface(ABC):
     """Abstract base class for notification systems"""
     
@@ -36,4 +44,37 @@ class NotifierInterface(ABC):
     
     def get_name(self) -> str:
         """Get the name of this notifier"""
-        return self.__class__.__name__ 
\ No newline at end of file
+        return self.__class__.__name__
+    
+    def get_key(self) -> str:
+        """Stable identity of the destination, e.g. to key spooled deliveries across restarts"""
+        return self.get_name()
+
+
+class AsyncNotifierInterface(NotifierInterface):
+    """Notifier that can send without blocking the event loop"""
+    
+    @abstractmethod
+    async def send_async(self, message: str, event: Dict[str, Any] = None) -> bool:
+        """
+        Send a notification message from the event loop
+        
+        Args:
+            message: The formatted message to send
+            event: Optional event data for context
+            
+        Returns:
+            bool: True if successful, False otherwise
+            
+        Raises:
+            RateLimitedError: The service rejected the message and asked for a pause
+        """
+        pass
+    
+    async def acquire(self):
+        """Wait until a send is allowed, e.g. by a rate limit; callers do this before send_async"""
+        pass
+    
+    async def close(self):
+        """Release connections held for async sends"""
+        pass 
\ No newline at end of file
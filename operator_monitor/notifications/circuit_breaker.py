@@ -0,0 +1,144 @@
+"""Circuit breaker guarding a notifier"""
+
+import logging
+import time
+from collections import deque
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds in seconds of the latency histogram buckets; slower sends land in the last bucket
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class CircuitBreaker:
+    """
+    Closed, open and half-open states over a notifier's recent sends
+    
+    The breaker opens when the error rate or the p99 latency of the last window of
+    sends exceeds its limit. While open, calls are refused without touching the
+    network. After the cooldown one probe is let through (half-open); its outcome
+    closes the breaker or opens it for another cooldown.
+    """
+    
+    def __init__(self, name: str, window: int = 20, min_calls: int = 5, max_error_rate: float = 0.5,
+                 latency_budget: Optional[float] = None, cooldown: float = 30):
+        """
+        Initialize circuit breaker
+        
+        Args:
+            name: Name of the guarded notifier, used in logs
+            window: Number of recent sends the error rate and p99 latency are computed over
+            min_calls: Sends required in the window before the breaker can open
+            max_error_rate: Failed fraction of the window that opens the breaker
+            latency_budget: p99 latency in seconds that opens the breaker (None disables)
+            cooldown: Seconds the breaker stays open before a probe is allowed
+        """
+        self.name = name
+        self.min_calls = min_calls
+        self.max_error_rate = max_error_rate
+        self.latency_budget = latency_budget
+        self.cooldown = cooldown
+        self._outcomes = deque(maxlen=window)
+        self._latencies = deque(maxlen=window)
+        self._state = 'closed'
+        self._opened_at = 0.0
+        self._probing = False
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.rejected = 0
+        self.times_opened = 0
+    
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half-open once the cooldown has passed"""
+        if self._state == 'open' and time.monotonic() - self._opened_at >= self.cooldown:
+            self._state = 'half_open'
+            self._probing = False
+        return self._state
+    
+    def allow(self) -> bool:
+        """Whether a send may go out now; in half-open state only a single probe is allowed"""
+        state = self.state
+        if state == 'closed':
+            return True
+        if state == 'half_open' and not self._probing:
+            self._probing = True
+            return True
+        
+        self.rejected += 1
+        return False
+    
+    def release(self):
+        """Give back a half-open probe that ended without a recorded outcome, e.g. when rate limited"""
+        self._probing = False
+    
+    def record(self, success: bool, latency: float):
+        """Record the outcome of a send and its latency in seconds"""
+        self._outcomes.append(success)
+        self._latencies.append(latency)
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if latency <= bound:
+                self.histogram[index] += 1
+                break
+        else:
+            self.histogram[-1] += 1
+        
+        if self._state == 'half_open':
+            if success and not self._over_budget(latency):
+                self._close()
+            else:
+                self._open(f"probe {'was too slow' if success else 'failed'}")
+        elif self._state == 'closed' and len(self._outcomes) >= self.min_calls:
+            if self.error_rate >= self.max_error_rate:
+                self._open(f"error rate {self.error_rate:.0%}")
+            elif self._over_budget(self.latency_percentile(99)):
+                self._open(f"p99 latency {self.latency_percentile(99):.2f}s")
+    
+    def _over_budget(self, latency: Optional[float]) -> bool:
+        """Whether a latency exceeds the budget"""
+        return self.latency_budget is not None and latency is not None and latency > self.latency_budget
+    
+    def _open(self, reason: str):
+        """Refuse calls for the cooldown period"""
+        self._state = 'open'
+        self._opened_at = time.monotonic()
+        self._probing = False
+        self.times_opened += 1
+        logger.warning(f"Circuit for {self.name} opened ({reason}), failing fast for {self.cooldown:g}s")
+    
+    def _close(self):
+        """Resume normal operation with a fresh window"""
+        self._state = 'closed'
+        self._probing = False
+        self._outcomes.clear()
+        self._latencies.clear()
+        logger.info(f"Circuit for {self.name} closed")
+    
+    @property
+    def error_rate(self) -> float:
+        """Failed fraction of the sends in the window"""
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+    
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        """Return the given latency percentile over the window"""
+        if not self._latencies:
+            return None
+        
+        ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * percentile / 100))
+        return ordered[index]
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get breaker state, window statistics and the latency histogram"""
+        p99 = self.latency_percentile(99)
+        labels = [f"<={bound:g}s" for bound in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]:g}s"]
+        return {
+            'state': self.state,
+            'error_rate': round(self.error_rate, 4),
+            'p99_latency_ms': round(p99 * 1000, 2) if p99 is not None else None,
+            'times_opened': self.times_opened,
+            'rejected': self.rejected,
+            'latency_histogram': dict(zip(labels, self.histogram))
+        }
@@ -0,0 +1,98 @@
+"""Windowed grouping of event notifications into digests"""
+
+import asyncio
+import logging
+from collections import Counter
+from typing import List, Dict, Any, Optional, Callable, Awaitable, Tuple
+
+from hexbytes import HexBytes
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationCoalescer:
+    """
+    Collects notifications for a window and sends them as one message
+    
+    The window starts with the first notification after a flush. A window holding a
+    single notification is sent unchanged; larger windows become a digest with counts
+    by contract and event plus details of the first few events.
+    """
+    
+    def __init__(self, send: Callable[[str, Optional[Dict[str, Any]]], Awaitable[bool]],
+                 window: float = 2.0, top_n: int = 5):
+        """
+        Initialize notification coalescer
+        
+        Args:
+            send: Coroutine that delivers a message with its optional event
+            window: Seconds notifications are collected before a flush
+            top_n: Number of events listed in detail in a digest
+        """
+        self.send = send
+        self.window = window
+        self.top_n = top_n
+        self._pending: List[Tuple[str, Dict[str, Any]]] = []
+        self._timer: Optional[asyncio.Task] = None
+        self._flushes: set = set()
+        self.digests_sent = 0
+        self.events_coalesced = 0
+    
+    def add(self, message: str, event: Dict[str, Any]):
+        """Queue a notification for the current window, opening one if needed"""
+        self._pending.append((message, event))
+        if self._timer is None:
+            self._timer = asyncio.get_running_loop().create_task(self._flush_later())
+    
+    async def _flush_later(self):
+        """Flush once the window has elapsed"""
+        await asyncio.sleep(self.window)
+        self._timer = None
+        # Sent from its own task so close() cancelling the timer cannot interrupt a send
+        flush = asyncio.ensure_future(self.flush())
+        self._flushes.add(flush)
+        flush.add_done_callback(self._flushes.discard)
+    
+    async def flush(self) -> bool:
+        """Send everything queued so far"""
+        pending, self._pending = self._pending, []
+        if not pending:
+            return True
+        
+        if len(pending) == 1:
+            message, event = pending[0]
+            return await self.send(message, event)
+        
+        self.digests_sent += 1
+        self.events_coalesced += len(pending)
+        try:
+            return await self.send(self.format_digest([event for _, event in pending]), None)
+        except Exception as e:
+            logger.error(f"Error sending digest of {len(pending)} notifications: {e}")
+            return False
+    
+    def format_digest(self, events: List[Dict[str, Any]]) -> str:
+        """Summarize events as counts by contract and event followed by the first top_n events"""
+        counts = Counter(f"{event.get('contract_name', 'Unknown')}.{event['event']}" for event in events)
+        
+        lines = [f"📦 {len(events)} events in the last {self.window:g}s"]
+        lines.extend(f"• {name} × {count}" for name, count in counts.most_common())
+        
+        lines.append("")
+        for event in events[:self.top_n]:
+            tx_hash = bytes(HexBytes(event['transactionHash'])).hex() if 'transactionHash' in event else '?'
+            lines.append(f"{event.get('contract_name', 'Unknown')}.{event['event']} "
+                         f"block {event.get('blockNumber', '?')} tx 0x{tx_hash}")
+        if len(events) > self.top_n:
+            lines.append(f"…and {len(events) - self.top_n} more")
+        
+        return "\n".join(lines)
+    
+    async def close(self):
+        """Flush the open window immediately and wait for sends in flight"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        await self.flush()
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
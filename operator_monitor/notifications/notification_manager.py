@@ -1,8 +1,17 @@
 """Multi-channel notification orchestration"""
 
+import asyncio
+import itertools
 import logging
-from typing import List, Dict, Any
-from .base_notifier import NotifierInterface
+import time
+from typing import List, Dict, Any, Optional, Callable
+
+from hexbytes import HexBytes
+
+from .base_notifier import NotifierInterface, AsyncNotifierInterface, RateLimitedError
+from .circuit_breaker import CircuitBreaker
+from .notification_coalescer import NotificationCoalescer
+from .notification_spool import SQLiteNotificationSpool
 
 logger = logging.getLogger(__name__)
 
@@ -10,24 +19,75 @@ logger = logging.getLogger(__name__)
 class NotificationManager:
     """Manages multiple notification channels with error handling and fallbacks"""
     
-    def __init__(self):
-        """Initialize notification manager"""
+    def __init__(self, timeout: float = 10, coalesce_window: float = 0, digest_top_n: int = 5,
+                 spool: Optional[SQLiteNotificationSpool] = None, base_backoff: float = 1, max_backoff: float = 300,
+                 breaker_error_rate: float = 0.5, latency_budget: Optional[float] = None, breaker_cooldown: float = 30,
+                 max_retry_after: float = 60):
+        """
+        Initialize notification manager
+        
+        Args:
+            timeout: Default seconds an async send may take before the notifier counts as failed
+            coalesce_window: Seconds event notifications are grouped into one digest (0 disables)
+            digest_top_n: Number of events listed in detail in a digest
+            spool: Durable queue async sends are written to and delivered from by background workers
+            base_backoff: Seconds before the first retry of a failed spooled delivery
+            max_backoff: Upper bound of the doubling retry delay
+            breaker_error_rate: Recent error rate at which a primary notifier's circuit opens
+            latency_budget: p99 send latency in seconds at which a primary notifier's circuit opens
+            breaker_cooldown: Seconds an open circuit fails fast before a probe send is tried
+            max_retry_after: Longest Retry-After a rate-limited send waits out before its one resend;
+                longer pauses fail the send so the spool or the fallbacks take over
+        """
         self.notifiers: List[NotifierInterface] = []
         self.fallback_notifiers: List[NotifierInterface] = []
+        self.timeout = timeout
+        self.timeouts: Dict[int, float] = {}
+        self.coalescer = NotificationCoalescer(
+            self._dispatch_async, window=coalesce_window, top_n=digest_top_n
+        ) if coalesce_window > 0 else None
+        # Events this accepts bypass coalescing and are sent immediately
+        self.is_critical: Optional[Callable[[Dict[str, Any]], bool]] = None
+        self.spool = spool
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._workers: List[asyncio.Task] = []
+        self._wakeups: List[asyncio.Event] = []
+        self._closing = False
+        self.breaker_error_rate = breaker_error_rate
+        self.latency_budget = latency_budget
+        self.breaker_cooldown = breaker_cooldown
+        self.breakers: Dict[int, CircuitBreaker] = {}
+        self.max_retry_after = max_retry_after
+        # Unique spool key of each primary notifier
+        self.keys: Dict[int, str] = {}
     
-    def add_notifier(self, notifier: NotifierInterface, is_fallback: bool = False):
+    def add_notifier(self, notifier: NotifierInterface, is_fallback: bool = False, timeout: Optional[float] = None):
         """
         Add a notifier to the manager
         
         Args:
             notifier: The notifier instance to add
             is_fallback: Whether this is a fallback notifier
+            timeout: Seconds an async send via this notifier may take, defaults to the manager timeout
         """
+        if timeout is not None:
+            self.timeouts[id(notifier)] = timeout
+        
         if is_fallback:
             self.fallback_notifiers.append(notifier)
             logger.info(f"Added fallback notifier: {notifier.get_name()}")
         else:
             self.notifiers.append(notifier)
+            key = notifier.get_key()
+            taken = set(self.keys.values())
+            if key in taken:
+                key = next(f"{key}#{n}" for n in itertools.count(2) if f"{key}#{n}" not in taken)
+            self.keys[id(notifier)] = key
+            self.breakers[id(notifier)] = CircuitBreaker(
+                notifier.get_name(), max_error_rate=self.breaker_error_rate,
+                latency_budget=self.latency_budget, cooldown=self.breaker_cooldown
+            )
             logger.info(f"Added primary notifier: {notifier.get_name()}")
     
     def send_notification(self, message: str, event: Dict[str, Any] = None) -> bool:
@@ -43,16 +103,24 @@ class NotificationManager:
         """
         success_count = 0
         
-        # Try primary notifiers first
+        # Try primary notifiers first, skipping those whose circuit is open
         for notifier in self.notifiers:
+            breaker = self.breakers[id(notifier)]
+            if not breaker.allow():
+                continue
+            
+            success = False
+            started = time.monotonic()
             try:
                 if notifier.send(message, event):
+                    success = True
                     success_count += 1
                     logger.debug(f"Notification sent via {notifier.get_name()}")
                 else:
                     logger.warning(f"Failed to send via {notifier.get_name()}")
             except Exception as e:
                 logger.error(f"Error with notifier {notifier.get_name()}: {e}")
+            breaker.record(success, time.monotonic() - started)
         
         # If all primary notifiers failed, try fallbacks
         if success_count == 0 and self.fallback_notifiers:
@@ -74,6 +142,209 @@ class NotificationManager:
             logger.error("All notification channels failed")
             return False
     
+    async def send_notification_async(self, message: str, event: Dict[str, Any] = None) -> bool:
+        """
+        Send notification through all configured channels without blocking the event loop
+        
+        Primary notifiers run concurrently, each bounded by its timeout. Fallbacks are
+        only tried once every primary notifier has finished or failed without success.
+        With coalescing enabled, non-critical event notifications are queued for the next
+        digest instead; messages without an event and critical events are sent at once.
+        
+        Args:
+            message: The message to send
+            event: Optional event data for context
+            
+        Returns:
+            bool: True if at least one notifier succeeded or the notification was queued
+        """
+        if self.coalescer and event is not None and not (self.is_critical and self.is_critical(event)):
+            self.coalescer.add(message, event)
+            return True
+        
+        return await self._dispatch_async(message, event)
+    
+    async def _dispatch_async(self, message: str, event: Dict[str, Any] = None) -> bool:
+        """Send to all primary notifiers concurrently, then to fallbacks if none succeeded"""
+        if self.spool and self.notifiers:
+            return self._enqueue(message, event)
+        
+        results = await asyncio.gather(*(self._send_with_timeout(notifier, message, event)
+                                         for notifier in self.notifiers))
+        success_count = sum(results)
+        
+        # If all primary notifiers failed, try fallbacks
+        if success_count == 0 and self.fallback_notifiers:
+            logger.warning("All primary notifiers failed, trying fallbacks...")
+            success_count += await self._send_fallback(message, event)
+        
+        if success_count > 0:
+            logger.info(f"Notification sent successfully via {success_count} channel(s)")
+            return True
+        else:
+            logger.error("All notification channels failed")
+            return False
+    
+    async def _send_fallback(self, message: str, event: Dict[str, Any] = None) -> bool:
+        """Send via the first fallback notifier that succeeds"""
+        for notifier in self.fallback_notifiers:
+            if await self._send_with_timeout(notifier, message, event, fallback=True):
+                return True
+        return False
+    
+    def _enqueue(self, message: str, event: Dict[str, Any] = None) -> bool:
+        """Write one delivery per primary notifier to the spool and wake the workers"""
+        dedupe_key = None
+        if event is not None and 'transactionHash' in event:
+            dedupe_key = f"{bytes(HexBytes(event['transactionHash'])).hex()}:{event['logIndex']}"
+        
+        try:
+            added = self.spool.enqueue(message, [self.keys[id(n)] for n in self.notifiers], dedupe_key)
+        except Exception as e:
+            logger.error(f"Error spooling notification: {e}")
+            return False
+        
+        if added == 0:
+            logger.debug(f"Notification for {dedupe_key} already spooled, skipping")
+        self.start()
+        for wakeup in self._wakeups:
+            wakeup.set()
+        return True
+    
+    def start(self):
+        """Start one spool worker per primary notifier, resuming deliveries left by earlier runs"""
+        if not self.spool or self._workers:
+            return
+        
+        loop = asyncio.get_running_loop()
+        self._closing = False
+        for notifier in self.notifiers:
+            wakeup = asyncio.Event()
+            self._wakeups.append(wakeup)
+            self._workers.append(loop.create_task(self._drain_spool(notifier, wakeup)))
+        logger.info(f"Started {len(self._workers)} notification spool worker(s)")
+    
+    async def _drain_spool(self, notifier: NotifierInterface, wakeup: asyncio.Event):
+        """Deliver a notifier's due spool rows, retrying failures with exponential backoff"""
+        name = self.keys[id(notifier)]
+        while True:
+            # Cleared before reading so an enqueue during the sends below is not missed
+            wakeup.clear()
+            try:
+                rows = self.spool.due(name)
+                for delivery_id, message, attempts in rows:
+                    if await self._send_with_timeout(notifier, message):
+                        self.spool.mark_delivered(delivery_id)
+                        continue
+                    
+                    # The console sees a failed notification at once, the notifier keeps retrying
+                    if attempts == 0 and self.fallback_notifiers:
+                        await self._send_fallback(message)
+                    delay = min(self.max_backoff, self.base_backoff * 2 ** attempts)
+                    self.spool.reschedule(delivery_id, attempts + 1, delay)
+                    logger.warning(f"Delivery {delivery_id} via {name} failed, retry {attempts + 1} in {delay:g}s")
+                
+                if rows:
+                    continue
+                if self._closing:
+                    return
+                next_attempt = self.spool.next_attempt(name)
+            except Exception as e:
+                logger.error(f"Error draining notification spool for {name}: {e}")
+                next_attempt = time.time() + self.base_backoff
+            
+            timeout = None if next_attempt is None else max(0.0, next_attempt - time.time())
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+    
+    async def _send_with_timeout(self, notifier: NotifierInterface, message: str, event: Dict[str, Any] = None,
+                                 fallback: bool = False) -> bool:
+        """Send via one notifier, running blocking notifiers in a worker thread"""
+        kind = "fallback notifier" if fallback else "notifier"
+        timeout = self.timeouts.get(id(notifier), self.timeout)
+        breaker = self.breakers.get(id(notifier))
+        if breaker and not breaker.allow():
+            logger.debug(f"Circuit for {notifier.get_name()} is open, skipping")
+            return False
+        
+        success = False
+        try:
+            try:
+                sent = await self._send_once(notifier, message, event, timeout)
+            except RateLimitedError as e:
+                if e.retry_after > self.max_retry_after:
+                    raise
+                logger.warning(f"{notifier.get_name()} rate limited, resending after {e.retry_after:g}s")
+                sent = await self._send_once(notifier, message, event, timeout)
+            
+            if sent:
+                logger.debug(f"Notification sent via {kind} {notifier.get_name()}")
+                success = True
+            else:
+                logger.warning(f"Failed to send via {kind} {notifier.get_name()}")
+        except asyncio.TimeoutError:
+            logger.warning(f"{notifier.get_name()} did not respond within {timeout}s")
+        except Exception as e:
+            logger.error(f"Error with {kind} {notifier.get_name()}: {e}")
+        finally:
+            # Also reached on cancellation so a half-open probe is never left unresolved
+            if breaker:
+                breaker.release()
+        return success
+    
+    async def _send_once(self, notifier: NotifierInterface, message: str, event: Dict[str, Any], timeout: float) -> bool:
+        """
+        One send bounded by the timeout
+        
+        Pacing waits such as a Retry-After pause come first and are neither bounded by the
+        timeout nor timed for the circuit breaker, which only sees the call itself. A
+        rate-limited response is not held against the breaker either.
+        """
+        if isinstance(notifier, AsyncNotifierInterface):
+            await notifier.acquire()
+            send = notifier.send_async(message, event)
+        else:
+            send = asyncio.to_thread(notifier.send, message, event)
+        
+        breaker = self.breakers.get(id(notifier))
+        sent = False
+        started = time.monotonic()
+        try:
+            sent = bool(await asyncio.wait_for(send, timeout))
+            return sent
+        except RateLimitedError:
+            breaker = None
+            raise
+        finally:
+            if breaker:
+                breaker.record(sent, time.monotonic() - started)
+    
+    async def close(self):
+        """Send any pending digest and close connections held by async notifiers"""
+        if self.coalescer:
+            await self.coalescer.close()
+        
+        # Workers stop once nothing is due; rows waiting for a retry stay spooled for the next run
+        if self._workers:
+            self._closing = True
+            for wakeup in self._wakeups:
+                wakeup.set()
+            _, unfinished = await asyncio.wait(self._workers, timeout=self.timeout)
+            for worker in unfinished:
+                worker.cancel()
+            if unfinished:
+                logger.warning(f"{self.spool.pending_count()} spooled notification(s) left for the next run")
+            self._workers, self._wakeups = [], []
+        
+        for notifier in self.notifiers + self.fallback_notifiers:
+            if isinstance(notifier, AsyncNotifierInterface):
+                try:
+                    await notifier.close()
+                except Exception as e:
+                    logger.warning(f"Error closing {notifier.get_name()}: {e}")
+    
     def test_all_connections(self) -> Dict[str, bool]:
         """Test all configured notifiers"""
         results = {}
@@ -96,9 +367,10 @@ class NotificationManager:
         
         return results
     
-    def get_active_notifiers(self) -> List[str]:
-        """Get list of active notifier names"""
+    def get_active_notifiers(self) -> List[Dict[str, Any]]:
+        """Get configured notifiers with circuit breaker state and latency histograms of the primaries"""
         active = []
-        active.extend([n.get_name() for n in self.notifiers])
-        active.extend([f"{n.get_name()} (fallback)" for n in self.fallback_notifiers])
+        active.extend([{'name': n.get_name(), 'key': self.keys[id(n)], 'fallback': False, **self.breakers[id(n)].get_stats()}
+                       for n in self.notifiers])
+        active.extend([{'name': n.get_name(), 'fallback': True} for n in self.fallback_notifiers])
         return active 
\ No newline at end of file
@@ -0,0 +1,142 @@
+"""SQLite write-ahead spool of pending notification deliveries"""
+
+import logging
+import sqlite3
+import threading
+import time
+from typing import List, Dict, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteNotificationSpool:
+    """Stores one delivery row per message and notifier until it is sent"""
+    
+    def __init__(self, path: str, retention: float = 86400):
+        """
+        Initialize notification spool
+        
+        Delivered rows are kept for the retention period so a replayed event with the
+        same dedupe key is not delivered to the same notifier twice.
+        
+        Args:
+            path: SQLite database file
+            retention: Seconds delivered rows are kept for deduplication
+        """
+        self.path = path
+        self.retention = retention
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        # WAL commits survive a process crash without an fsync per enqueue
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript('''
+            CREATE TABLE IF NOT EXISTS deliveries (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                notifier TEXT NOT NULL,
+                dedupe_key TEXT,
+                message TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt REAL NOT NULL,
+                delivered REAL,
+                UNIQUE (dedupe_key, notifier)
+            );
+            CREATE INDEX IF NOT EXISTS pending_by_notifier ON deliveries (notifier, delivered, next_attempt);
+        ''')
+        self._conn.commit()
+        self.enqueued = 0
+        self.duplicates = 0
+        self.delivered = 0
+        self.retries = 0
+        self.prune()
+        logger.info(f"Notification spool opened at {path}, {self.pending_count()} deliveries pending")
+    
+    def enqueue(self, message: str, notifiers: List[str], dedupe_key: Optional[str] = None) -> int:
+        """
+        Add a delivery of the message for each notifier
+        
+        Args:
+            message: The formatted message to send
+            notifiers: Unique keys of the notifiers to deliver to
+            dedupe_key: Identity of the event, e.g. 'txhash:logindex'; None never deduplicates
+        
+        Returns:
+            Number of deliveries added, excluding duplicates
+        """
+        now = time.time()
+        with self._lock:
+            with self._conn:
+                added = 0
+                for notifier in notifiers:
+                    cursor = self._conn.execute(
+                        'INSERT OR IGNORE INTO deliveries (notifier, dedupe_key, message, next_attempt) '
+                        'VALUES (?, ?, ?, ?)',
+                        (notifier, dedupe_key, message, now)
+                    )
+                    added += cursor.rowcount
+        
+        self.enqueued += added
+        self.duplicates += len(notifiers) - added
+        return added
+    
+    def due(self, notifier: str, limit: int = 50) -> List[Tuple[int, str, int]]:
+        """Undelivered (id, message, attempts) rows of a notifier whose next attempt has come, oldest first"""
+        with self._lock:
+            return self._conn.execute(
+                'SELECT id, message, attempts FROM deliveries '
+                'WHERE notifier = ? AND delivered IS NULL AND next_attempt <= ? ORDER BY id LIMIT ?',
+                (notifier, time.time(), limit)
+            ).fetchall()
+    
+    def next_attempt(self, notifier: str) -> Optional[float]:
+        """Earliest scheduled attempt among a notifier's undelivered rows"""
+        with self._lock:
+            return self._conn.execute(
+                'SELECT MIN(next_attempt) FROM deliveries WHERE notifier = ? AND delivered IS NULL',
+                (notifier,)
+            ).fetchone()[0]
+    
+    def mark_delivered(self, delivery_id: int):
+        """Record a successful delivery"""
+        with self._lock:
+            with self._conn:
+                self._conn.execute('UPDATE deliveries SET delivered = ? WHERE id = ?', (time.time(), delivery_id))
+        self.delivered += 1
+    
+    def reschedule(self, delivery_id: int, attempts: int, delay: float):
+        """Record a failed attempt and schedule the next one after delay seconds"""
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    'UPDATE deliveries SET attempts = ?, next_attempt = ? WHERE id = ?',
+                    (attempts, time.time() + delay, delivery_id)
+                )
+        self.retries += 1
+    
+    def pending_count(self) -> int:
+        """Number of deliveries not yet sent"""
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM deliveries WHERE delivered IS NULL').fetchone()[0]
+    
+    def prune(self):
+        """Drop delivered rows older than the retention period"""
+        with self._lock:
+            with self._conn:
+                self._conn.execute('DELETE FROM deliveries WHERE delivered < ?', (time.time() - self.retention,))
+    
+    def close(self):
+        """Prune and close the database"""
+        self.prune()
+        with self._lock:
+            self._conn.close()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get spool statistics"""
+        return {
+            'path': self.path,
+            'pending': self.pending_count(),
+            'enqueued': self.enqueued,
+            'duplicates': self.duplicates,
+            'delivered': self.delivered,
+            'retries': self.retries
+        }
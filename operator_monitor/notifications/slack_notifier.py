@@ -1,34 +1,44 @@
 """Slack integration notifier"""
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+import aiohttp
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.web.async_client import AsyncWebClient
 
-from .base_notifier import NotifierInterface
+from ..core.rate_limiter import AsyncRateLimiter
+from .base_notifier import AsyncNotifierInterface, RateLimitedError
 
 logger = logging.getLogger(__name__)
 
 
-class SlackNotifier(NotifierInterface):
+class SlackNotifier(AsyncNotifierInterface):
     """Sends notifications to Slack channels"""
     
-    def __init__(self, token: str, channel: str):
+    def __init__(self, token: str, channel: str, rate_limit: float = 1.0):
         """
         Initialize Slack notifier
         
         Args:
             token: Slack bot token
             channel: Slack channel ID or name
+            rate_limit: Async messages per second posted to the channel (0 disables limiting)
         """
         self.token = token
         self.channel = channel
         self.client = WebClient(token=token)
+        # Slack allows about one message per second per channel and answers bursts with 429
+        self.rate_limiter = AsyncRateLimiter(rate_limit)
+        self.rate_limited = 0
+        # Created on first async send so the HTTP session belongs to the running event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.async_client: Optional[AsyncWebClient] = None
         
         logger.info(f"Slack notifier initialized for channel: {channel}")
     
     def send(self, message: str, event: Dict[str, Any] = None) -> bool:
-        """Send message to Slack channel"""
+        """Send message to Slack channel (blocking)"""
         try:
             response = self.client.chat_postMessage(
                 channel=self.channel,
@@ -36,13 +46,7 @@ class SlackNotifier(NotifierInterface):
                 unfurl_links=False,
                 unfurl_media=False
             )
-            
-            if response['ok']:
-                logger.info("Slack message sent successfully")
-                return True
-            else:
-                logger.error(f"Failed to send Slack message: {response.get('error')}")
-                return False
+            return self._check_response(response)
                 
         except SlackApiError as e:
             logger.error(f"Slack API error: {e.response['error']}")
@@ -51,6 +55,66 @@ class SlackNotifier(NotifierInterface):
             logger.error(f"Error sending Slack message: {e}")
             return False
     
+    def get_key(self) -> str:
+        """One key per channel so deliveries to different channels are tracked separately"""
+        return f"{self.get_name()}:{self.channel}"
+    
+    async def acquire(self):
+        """Wait for the channel rate limiter, including any Retry-After pause"""
+        await self.rate_limiter.acquire()
+    
+    async def send_async(self, message: str, event: Dict[str, Any] = None) -> bool:
+        """
+        Send message to Slack channel over a reused aiohttp session
+        
+        Callers pace sends with acquire() first. A 429 pauses the limiter for the
+        Retry-After period and raises, so the caller decides whether to wait and resend.
+        
+        Raises:
+            RateLimitedError: Slack answered 429
+        """
+        try:
+            if self.async_client is None:
+                self._session = aiohttp.ClientSession()
+                self.async_client = AsyncWebClient(token=self.token, session=self._session)
+            
+            response = await self.async_client.chat_postMessage(
+                channel=self.channel,
+                text=message,
+                unfurl_links=False,
+                unfurl_media=False
+            )
+            return self._check_response(response)
+            
+        except SlackApiError as e:
+            if e.response.status_code == 429:
+                retry_after = float(e.response.headers.get('Retry-After', 1))
+                self.rate_limited += 1
+                self.rate_limiter.defer(retry_after)
+                raise RateLimitedError(retry_after) from e
+            
+            logger.error(f"Slack API error: {e.response['error']}")
+            return False
+        except Exception as e:
+            logger.error(f"Error sending Slack message: {e}")
+            return False
+    
+    @staticmethod
+    def _check_response(response) -> bool:
+        """Log and return the outcome of a chat.postMessage response"""
+        if response['ok']:
+            logger.info("Slack message sent successfully")
+            return True
+        logger.error(f"Failed to send Slack message: {response.get('error')}")
+        return False
+    
+    async def close(self):
+        """Close the HTTP session used for async sends"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            self.async_client = None
+    
     def test_connection(self) -> bool:
         """Test Slack connection"""
         try:
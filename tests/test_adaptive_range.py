@@ -0,0 +1,101 @@
+"""Adaptive eth_getLogs range sizing"""
+
+import asyncio
+
+import pytest
+
+from operator_monitor.data.adaptive_range import AdaptiveRangeController, is_range_error
+
+KEY = ('Registry',)
+
+
+@pytest.mark.parametrize('message', [
+    "{'code': -32005, 'message': 'query returned more than 10000 results'}",
+    'Log response size exceeded. You can make eth_getLogs requests with up to a 2K block range',
+    'Log ranges over 10000 blocks are not supported',
+    'block range is too wide',
+    'exceed maximum block range: 5000',
+    'query timeout exceeded'
+])
+def test_provider_range_errors_split(message):
+    assert is_range_error(ValueError(message))
+
+
+@pytest.mark.parametrize('message', [
+    'execution reverted: amount exceeds balance',
+    'invalid block range params',
+    'Connection timeout',
+    'nonce too low',
+    "{'code': -32602, 'message': 'invalid argument 0: hex string without 0x prefix'}"
+])
+def test_unrelated_errors_do_not_split(message):
+    assert not is_range_error(ValueError(message))
+
+
+def test_timeouts_split():
+    assert is_range_error(asyncio.TimeoutError())
+    assert is_range_error(TimeoutError())
+
+
+def test_range_errors_halve_down_to_min_size():
+    controller = AdaptiveRangeController(1000, min_size=100)
+    
+    for _ in range(5):
+        size = controller.size_for(KEY, 0)
+        controller.record_range_error(KEY, 0, size - 1)
+    
+    assert controller.size_for(KEY, 0) == 100
+    assert controller.splits == 5
+
+
+def test_sparse_responses_grow_up_to_max_size():
+    controller = AdaptiveRangeController(1000, max_size=5000, target_logs=2000)
+    
+    for _ in range(5):
+        size = controller.size_for(KEY, 0)
+        controller.record_success(KEY, 0, size - 1, log_count=0)
+    
+    assert controller.size_for(KEY, 0) == 5000
+
+
+def test_dense_responses_shrink():
+    controller = AdaptiveRangeController(1000, target_logs=2000)
+    
+    controller.record_success(KEY, 0, 999, log_count=3000)
+    
+    assert controller.size_for(KEY, 0) == 500
+
+
+def test_truncated_tail_does_not_grow():
+    controller = AdaptiveRangeController(1000)
+    
+    controller.record_success(KEY, 0, 99, log_count=0)
+    
+    assert controller.size_for(KEY, 0) == 1000
+    assert controller.grows == 0
+
+
+def test_growth_converges_below_rejected_size():
+    controller = AdaptiveRangeController(1000, max_size=100_000)
+    controller.record_range_error(KEY, 0, 3999)
+    
+    for _ in range(20):
+        size = controller.size_for(KEY, 0)
+        if size >= 4000:
+            controller.record_range_error(KEY, 0, size - 1)
+        else:
+            controller.record_success(KEY, 0, size - 1, log_count=0)
+    
+    size = controller.size_for(KEY, 0)
+    assert 3000 <= size < 4000
+    assert controller.splits == 1
+
+
+def test_eras_are_sized_independently():
+    controller = AdaptiveRangeController(1000, era_size=1_000_000)
+    
+    controller.record_range_error(KEY, 0, 999)
+    
+    assert controller.size_for(KEY, 0) == 500
+    assert controller.size_for(KEY, 1_000_000) == 1000
+    assert controller.size_for(('Other',), 0) == 1000
@@ -0,0 +1,51 @@
+"""Persisted log tail cursor"""
+
+import asyncio
+
+from operator_monitor.monitor.confirmation_buffer import ConfirmationBuffer
+from operator_monitor.monitor.log_tail_poller import BlockCursor
+
+
+def _header(number: int) -> dict:
+    return {'number': number, 'hash': f"{number:064x}", 'parentHash': f"{number - 1:064x}"}
+
+
+def test_cursor_reloads_from_file(tmp_path):
+    path = str(tmp_path / 'cursor.json')
+    BlockCursor(path).advance(120)
+    
+    assert BlockCursor(path).block == 120
+
+
+def test_persisted_cursor_stays_below_buffered_blocks(tmp_path):
+    path = str(tmp_path / 'cursor.json')
+    confirmed = []
+    
+    async def get_header(number):
+        return _header(number)
+    
+    async def on_confirmed(block):
+        confirmed.append(block.number)
+    
+    async def on_orphaned(block):
+        pass
+    
+    buffer = ConfirmationBuffer(get_header, on_confirmed, on_orphaned, confirmation_depth=3)
+    cursor = BlockCursor(path, hold=buffer.lowest_pending)
+    
+    async def run():
+        await buffer.on_head(_header(100))
+        buffer.add_event({'blockNumber': 101, 'blockHash': f"{101:064x}"})
+        cursor.advance(102)
+        await buffer.on_head(_header(102))
+        # The event of block 101 only lives in memory, a restart must fetch it again
+        assert cursor.block == 102
+        assert BlockCursor(path).block == 100
+        
+        await buffer.on_head(_header(104))
+        cursor.advance(104)
+    
+    asyncio.run(run())
+    
+    assert confirmed == [101]
+    assert BlockCursor(path).block == 104
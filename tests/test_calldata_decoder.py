@@ -0,0 +1,109 @@
+"""registerValidators calldata decoding"""
+
+import pytest
+from eth_abi import encode
+from py_ecc.bls import G2ProofOfPossession
+from py_ecc.bls.g2_primitives import pubkey_to_G1, signature_to_G2
+from py_ecc.optimized_bls12_381 import G1, normalize
+from web3 import Web3
+
+from operator_monitor.core.calldata_decoder import BLSUtils, CalldataDecoder, RegistrationList
+
+MODULUS = BLSUtils.BASE_FIELD_MODULUS[0] << 256 | BLSUtils.BASE_FIELD_MODULUS[1]
+HALF_MODULUS = (MODULUS - 1) // 2
+REGISTRATION_TYPE = '((uint256,uint256),(uint256,uint256)),(((uint256,uint256),(uint256,uint256)),((uint256,uint256),(uint256,uint256)))'
+SECRET_KEYS = (0x2a, 0x1f3d5c7e9, 0x6e0c4a3b2d1f)
+GENERATOR_X = normalize(G1)[0].n
+
+
+def _limbs(value: int) -> tuple:
+    """Split a field element into the (a, b) uint256 limbs used by the contract"""
+    return value >> 256, value & ((1 << 256) - 1)
+
+
+def _registration(secret_key: int) -> tuple:
+    """A real pubkey and registration signature in the contract's tuple layout"""
+    pubkey = G2ProofOfPossession.SkToPk(secret_key)
+    x, y = normalize(pubkey_to_G1(pubkey))[:2]
+    sig_x, sig_y = normalize(signature_to_G2(G2ProofOfPossession.Sign(secret_key, b'registration')))[:2]
+    return (
+        (_limbs(x.n), _limbs(y.n)),
+        ((_limbs(sig_x.coeffs[0]), _limbs(sig_x.coeffs[1])), (_limbs(sig_y.coeffs[0]), _limbs(sig_y.coeffs[1])))
+    )
+
+
+def _with_y(registration: tuple, y: int) -> tuple:
+    (x, _), signature = registration
+    return (x, _limbs(y)), signature
+
+
+@pytest.fixture(scope='module')
+def decoder():
+    return CalldataDecoder(Web3())
+
+
+@pytest.fixture(scope='module')
+def registrations():
+    return [_registration(secret_key) for secret_key in SECRET_KEYS]
+
+
+def _calldata(decoder: CalldataDecoder, registrations: list) -> bytes:
+    return decoder.register_validators_decoder.selector + encode([f'({REGISTRATION_TYPE})[]'], [registrations])
+
+
+def _fields(registration) -> tuple:
+    return (registration['index'], registration['pubkey'], registration['signature'],
+            registration['pubkey_hex'], registration['signature_hex'])
+
+
+def test_fast_path_matches_abi_decoding(decoder, registrations):
+    calldata = _calldata(decoder, registrations)
+    
+    decoded = decoder.decode_register_validators_calldata(calldata)
+    abi_decoded = list(decoder._iter_register_validators_abi(calldata))
+    
+    assert isinstance(decoded['registrations'], RegistrationList)
+    assert decoded['validator_count'] == len(SECRET_KEYS)
+    assert [_fields(r) for r in decoded['registrations']] == [_fields(r) for r in abi_decoded]
+    assert [_fields(r) for r in decoder.iter_register_validators('0x' + calldata.hex())] == [_fields(r) for r in abi_decoded]
+
+
+def test_pubkeys_match_bls_compression(decoder, registrations):
+    decoded = decoder.decode_register_validators_calldata(_calldata(decoder, registrations))
+    
+    expected = ['0x' + G2ProofOfPossession.SkToPk(secret_key).hex() for secret_key in SECRET_KEYS]
+    assert decoded['registrations'].pubkey_hexes() == expected
+
+
+@pytest.mark.parametrize('y', [0, 1, HALF_MODULUS - 1, HALF_MODULUS, HALF_MODULUS + 1, MODULUS - 1, MODULUS, MODULUS + 5])
+def test_batch_compression_matches_reference_at_sign_boundary(y):
+    point = (*_limbs(GENERATOR_X), *_limbs(y))
+    
+    assert BLSUtils.compress_g1_points([point]) == [BLSUtils.compress_g1_point(*point)]
+
+
+def test_half_modulus_boundary_through_both_paths(decoder, registrations):
+    boundary = [_with_y(registrations[0], y) for y in (HALF_MODULUS - 1, HALF_MODULUS, HALF_MODULUS + 1)]
+    calldata = _calldata(decoder, boundary)
+    
+    fast = [r['pubkey_hex'] for r in decoder.decode_register_validators_calldata(calldata)['registrations']]
+    abi = [r['pubkey_hex'] for r in decoder._iter_register_validators_abi(calldata)]
+    
+    assert fast == abi
+    sign_bits = [int(pubkey[2:4], 16) & 0x20 for pubkey in fast]
+    # y is only "greater" than its negation above (p - 1) / 2
+    assert sign_bits == [0, 0, 0x20]
+
+
+def test_non_canonical_layout_falls_back_to_abi(decoder, registrations):
+    canonical = _calldata(decoder, registrations)
+    body = canonical[4:]
+    # Same array behind a larger head offset with a padding word in between
+    non_canonical = canonical[:4] + (64).to_bytes(32, 'big') + bytes(32) + body[32:]
+    
+    decoded = decoder.decode_register_validators_calldata(non_canonical)
+    
+    assert CalldataDecoder._registration_count(non_canonical) is None
+    assert isinstance(decoded['registrations'], list)
+    expected = decoder.decode_register_validators_calldata(canonical)['registrations']
+    assert [_fields(r) for r in decoded['registrations']] == [_fields(r) for r in expected]
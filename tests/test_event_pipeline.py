@@ -0,0 +1,44 @@
+"""Event pipeline watermark"""
+
+import asyncio
+
+from operator_monitor.monitor.event_pipeline import EventPipeline
+
+
+def _event(block_number: int, name: str = 'OperatorRegistered'):
+    return {'event': name, 'contract_name': 'Registry', 'contract_address': '0x' + '11' * 20,
+            'blockNumber': block_number}
+
+
+def test_watermark_follows_events_through_both_stages():
+    watermarks = []
+    in_flight = []
+    
+    async def run():
+        sent = asyncio.Event()
+        
+        async def handle(event):
+            if event['event'] == 'Broken':
+                raise ValueError('handler failed')
+            return None if event['event'] == 'Quiet' else f"block {event['blockNumber']}"
+        
+        async def notify(message, event):
+            await sent.wait()
+        
+        pipeline = EventPipeline(handle, notify, workers=1, notify_workers=1)
+        pipeline.start()
+        for event in (_event(5), _event(6, 'Quiet'), _event(7, 'Broken'), _event(8)):
+            await pipeline.submit(event)
+        await pipeline.handler_stage.join()
+        watermarks.append(pipeline.lowest_in_flight())
+        in_flight.extend(sorted(pipeline._in_flight))
+        
+        sent.set()
+        await pipeline.stop()
+        watermarks.append(pipeline.lowest_in_flight())
+    
+    asyncio.run(run())
+    
+    # Blocks 6 and 7 finished in the handler stage, 5 and 8 wait for their notifications
+    assert in_flight == [5, 8]
+    assert watermarks == [5, None]
@@ -0,0 +1,91 @@
+"""Log cache block range coverage"""
+
+import pytest
+
+from operator_monitor.data.log_cache import SQLiteLogCache, merge_intervals, subtract_intervals
+
+REGISTERED = ('0x' + '11' * 20, '0x' + 'aa' * 32)
+SLASHED = ('0x' + '11' * 20, '0x' + 'bb' * 32)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = SQLiteLogCache(str(tmp_path / 'logs.db'))
+    yield cache
+    cache.close()
+
+
+def _log(block_number: int, log_index: int, stream=REGISTERED):
+    address, topic0 = stream
+    return {'address': address, 'topics': [topic0], 'data': '0x', 'blockNumber': block_number,
+            'transactionIndex': 0, 'logIndex': log_index, 'blockHash': '0x' + '01' * 32,
+            'transactionHash': '0x' + '02' * 32}
+
+
+def test_merge_intervals_joins_adjacent_and_overlapping():
+    assert merge_intervals([(20, 29), (10, 19), (25, 40), (50, 60)]) == [(10, 40), (50, 60)]
+    assert merge_intervals([(10, 19), (21, 30)]) == [(10, 19), (21, 30)]
+    assert merge_intervals([(10, 100), (20, 30)]) == [(10, 100)]
+
+
+def test_subtract_intervals_reports_gaps_at_both_edges():
+    covered = [(110, 189)]
+    
+    assert subtract_intervals(100, 200, covered) == [(100, 109), (190, 200)]
+    assert subtract_intervals(100, 200, [(50, 150)]) == [(151, 200)]
+    assert subtract_intervals(100, 200, [(150, 250)]) == [(100, 149)]
+    assert subtract_intervals(100, 200, [(50, 250)]) == []
+    assert subtract_intervals(100, 200, []) == [(100, 200)]
+
+
+def test_adjacent_stores_merge_into_one_range(cache):
+    cache.store([REGISTERED], 100, 199, [])
+    cache.store([REGISTERED], 200, 299, [])
+    
+    assert cache.find_gaps([REGISTERED], 100, 299) == []
+    assert cache._covered(REGISTERED) == [(100, 299)]
+
+
+def test_overlapping_stores_merge(cache):
+    cache.store([REGISTERED], 100, 250, [])
+    cache.store([REGISTERED], 200, 300, [])
+    cache.store([REGISTERED], 120, 130, [])
+    
+    assert cache._covered(REGISTERED) == [(100, 300)]
+    assert cache.find_gaps([REGISTERED], 50, 350) == [(50, 99), (301, 350)]
+
+
+def test_gap_at_start_of_range(cache):
+    cache.store([REGISTERED], 150, 300, [])
+    
+    assert cache.find_gaps([REGISTERED], 100, 300) == [(100, 149)]
+
+
+def test_gap_at_end_of_range(cache):
+    cache.store([REGISTERED], 100, 249, [])
+    
+    assert cache.find_gaps([REGISTERED], 100, 300) == [(250, 300)]
+
+
+def test_gap_between_stored_ranges(cache):
+    cache.store([REGISTERED], 100, 149, [])
+    cache.store([REGISTERED], 160, 200, [])
+    
+    assert cache.find_gaps([REGISTERED], 100, 200) == [(150, 159)]
+
+
+def test_gaps_are_the_union_over_streams(cache):
+    cache.store([REGISTERED, SLASHED], 100, 199, [])
+    cache.store([REGISTERED], 200, 299, [])
+    
+    assert cache.find_gaps([REGISTERED], 100, 299) == []
+    assert cache.find_gaps([REGISTERED, SLASHED], 100, 299) == [(200, 299)]
+
+
+def test_stored_logs_are_served_per_stream(cache):
+    cache.store([REGISTERED, SLASHED], 100, 199, [_log(120, 1), _log(110, 0, SLASHED), _log(150, 0)])
+    
+    logs = cache.get_logs([REGISTERED], 100, 199)
+    
+    assert [(log['blockNumber'], log['logIndex']) for log in logs] == [(120, 1), (150, 0)]
+    assert len(cache.get_logs([REGISTERED, SLASHED], 100, 199)) == 3
@@ -0,0 +1,60 @@
+"""Spooled notification delivery"""
+
+import asyncio
+
+from operator_monitor.notifications import NotificationManager, NotifierInterface, SQLiteNotificationSpool
+
+
+class ChannelNotifier(NotifierInterface):
+    """Records messages posted to one channel and fails the first `failures` sends"""
+    
+    def __init__(self, channel: str, failures: int = 0):
+        self.channel = channel
+        self.failures = failures
+        self.messages = []
+    
+    def send(self, message, event=None):
+        if self.failures:
+            self.failures -= 1
+            return False
+        self.messages.append(message)
+        return True
+    
+    def test_connection(self):
+        return True
+
+
+def _event(log_index: int):
+    return {'event': 'OperatorRegistered', 'contract_name': 'Registry', 'blockNumber': 1,
+            'transactionHash': b'\x01' * 32, 'logIndex': log_index}
+
+
+def test_failing_channel_is_retried_independently(tmp_path):
+    spool = SQLiteNotificationSpool(str(tmp_path / 'spool.db'))
+    healthy = ChannelNotifier('alerts')
+    failing = ChannelNotifier('ops', failures=2)
+    console = ChannelNotifier('console')
+    manager = NotificationManager(spool=spool, base_backoff=0.01, max_backoff=0.01)
+    manager.add_notifier(healthy)
+    manager.add_notifier(failing)
+    manager.add_notifier(console, is_fallback=True)
+    
+    async def run():
+        for log_index in range(3):
+            assert await manager.send_notification_async(f"event {log_index}", _event(log_index))
+        # Replays of the same log are deduplicated per channel
+        await manager.send_notification_async("event 0", _event(0))
+        await asyncio.sleep(0.3)
+        await manager.close()
+    
+    asyncio.run(run())
+    
+    assert len(set(manager.keys.values())) == 2
+    assert healthy.messages == ['event 0', 'event 1', 'event 2']
+    assert sorted(failing.messages) == ['event 0', 'event 1', 'event 2']
+    assert console.messages == ['event 0', 'event 1']
+    stats = spool.get_stats()
+    assert stats['pending'] == 0
+    assert stats['enqueued'] == 6
+    assert stats['duplicates'] == 2
+    spool.close()
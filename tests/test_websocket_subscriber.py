@@ -0,0 +1,220 @@
+"""Push delivery over a local eth_subscribe JSON-RPC fake"""
+
+import asyncio
+import json
+
+import websockets
+
+from operator_monitor.core.log_decoder import normalize_log
+from operator_monitor.monitor.log_tail_poller import LogTailPoller
+from operator_monitor.monitor.websocket_subscriber import WebSocketLogSubscriber
+
+HEADS = '0xheads'
+LOGS = '0xlogs'
+
+
+class FakeNode:
+    """Answers eth_subscribe, pushes notifications on demand and serves its logs to eth_getLogs"""
+    
+    def __init__(self, head: int):
+        self.head = head
+        self.logs = []
+        self.ws = None
+        self.subscribed = asyncio.Event()
+        self.server = None
+    
+    async def __aenter__(self):
+        self.server = await websockets.serve(self._handle, '127.0.0.1', 0)
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        self.server.close()
+        await self.server.wait_closed()
+    
+    @property
+    def url(self) -> str:
+        return f"ws://127.0.0.1:{self.server.sockets[0].getsockname()[1]}"
+    
+    async def _handle(self, ws):
+        self.ws = ws
+        async for message in ws:
+            request = json.loads(message)
+            subscription = HEADS if request['params'][0] == 'newHeads' else LOGS
+            await ws.send(json.dumps({'jsonrpc': '2.0', 'id': request['id'], 'result': subscription}))
+            if subscription == LOGS:
+                self.subscribed.set()
+    
+    async def _notify(self, subscription: str, result):
+        await self.ws.send(json.dumps({'jsonrpc': '2.0', 'method': 'eth_subscription',
+                                       'params': {'subscription': subscription, 'result': result}}))
+    
+    def mine(self, block_number: int, log_index: int = 0) -> dict:
+        """Add a log to the chain without pushing it"""
+        log = {'address': '0x' + '11' * 20, 'topics': ['0x' + 'aa' * 32], 'data': '0x',
+               'blockNumber': hex(block_number), 'transactionIndex': '0x0', 'logIndex': hex(log_index),
+               'blockHash': '0x' + f"{block_number:064x}", 'transactionHash': '0x' + f"{block_number:064x}"}
+        self.logs.append(log)
+        self.head = max(self.head, block_number)
+        return log
+    
+    async def push_log(self, log: dict):
+        await self._notify(LOGS, log)
+    
+    async def push_head(self, block_number: int):
+        self.head = max(self.head, block_number)
+        await self._notify(HEADS, {'number': hex(block_number), 'hash': '0x' + f"{block_number:064x}",
+                                   'parentHash': '0x' + f"{block_number - 1:064x}"})
+    
+    async def drop(self):
+        self.subscribed.clear()
+        await self.ws.close()
+    
+    def get_logs(self, filter_params: dict) -> list:
+        return [normalize_log(log) for log in self.logs
+                if filter_params['fromBlock'] <= int(log['blockNumber'], 16) <= filter_params['toBlock']]
+
+
+class PassthroughDecoder:
+    """Treats every log as a monitored event"""
+    
+    def build_subscription_params(self):
+        return {}
+    
+    def build_filter_params(self, from_block: int, to_block: int):
+        return {'fromBlock': from_block, 'toBlock': to_block}
+    
+    def decode_log(self, log):
+        return {'event': 'OperatorRegistered', 'blockNumber': log['blockNumber'],
+                'transactionIndex': log['transactionIndex'], 'logIndex': log['logIndex']}
+    
+    def decode_logs(self, logs):
+        return [self.decode_log(log) for log in logs]
+
+
+class Recorder:
+    """Collects delivered events, dropping replays the way the monitor's dedupe does"""
+    
+    def __init__(self):
+        self.events = []
+        self.removed = []
+        self._seen = set()
+    
+    async def on_event(self, event):
+        key = (event['blockNumber'], event['logIndex'])
+        if key not in self._seen:
+            self._seen.add(key)
+            self.events.append(key)
+    
+    async def on_removed(self, log):
+        self.removed.append((log['blockNumber'], log['logIndex']))
+
+
+async def _until(condition, timeout: float = 2):
+    async def wait():
+        while not condition():
+            await asyncio.sleep(0.01)
+    await asyncio.wait_for(wait(), timeout)
+
+
+async def _run(node: FakeNode, scenario):
+    """Run a subscriber against the node, starting after its head, while the scenario drives it"""
+    recorder = Recorder()
+    poller = LogTailPoller(None, [], recorder.on_event)
+    poller.log_decoder = PassthroughDecoder()
+    
+    async def get_head():
+        return node.head
+    
+    async def get_logs(filter_params):
+        return node.get_logs(filter_params)
+    
+    poller.get_head = get_head
+    poller._get_logs = get_logs
+    subscriber = WebSocketLogSubscriber(node.url, poller, recorder.on_event, reconnect_delay=0.01,
+                                        on_removed=recorder.on_removed)
+    task = asyncio.ensure_future(subscriber.run('latest'))
+    try:
+        await asyncio.wait_for(node.subscribed.wait(), 2)
+        await scenario(node, subscriber, recorder)
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+    return subscriber, recorder
+
+
+def _simulate(scenario):
+    async def main():
+        async with FakeNode(100) as node:
+            return await _run(node, scenario)
+    return asyncio.run(main())
+
+
+def test_log_pushed_before_its_head_is_delivered_once():
+    async def scenario(node, subscriber, recorder):
+        await node.push_log(node.mine(101))
+        await node.push_head(101)
+        await node.push_head(102)
+        await _until(lambda: subscriber.heads_received == 2)
+    
+    subscriber, recorder = _simulate(scenario)
+    
+    assert recorder.events == [(101, 0)]
+    assert subscriber.log_tail.cursor.block == 100
+
+
+def test_log_pushed_after_its_head_survives_a_drop():
+    async def scenario(node, subscriber, recorder):
+        # The node announces blocks 101 and 102, then the socket drops before the log of 101 is pushed
+        late = node.mine(101)
+        await node.push_head(101)
+        await node.push_head(102)
+        await _until(lambda: subscriber.heads_received == 2)
+        assert subscriber.log_tail.cursor.block < 101
+        
+        await node.drop()
+        await _until(lambda: node.subscribed.is_set())
+        await _until(lambda: recorder.events == [(101, 0)])
+        
+        await node.push_log(late)
+        await _until(lambda: subscriber.logs_received == 1)
+    
+    subscriber, recorder = _simulate(scenario)
+    
+    assert recorder.events == [(101, 0)]
+    assert subscriber.disconnects == 1
+
+
+def test_drop_is_filled_by_the_poller():
+    async def scenario(node, subscriber, recorder):
+        await node.push_log(node.mine(101))
+        await node.push_head(101)
+        await _until(lambda: recorder.events == [(101, 0)])
+        
+        await node.drop()
+        # Mined while disconnected, never pushed
+        for block_number in range(102, 106):
+            node.mine(block_number)
+        await _until(lambda: len(recorder.events) == 5)
+        
+        await node.push_log(node.mine(106))
+        await _until(lambda: len(recorder.events) == 6)
+    
+    subscriber, recorder = _simulate(scenario)
+    
+    assert recorder.events == [(block_number, 0) for block_number in range(101, 107)]
+    assert subscriber.connections == 2
+    assert subscriber.gap_fill_events >= 4
+    assert subscriber.log_tail.cursor.block == 105
+
+
+def test_removed_log_is_not_delivered():
+    async def scenario(node, subscriber, recorder):
+        log = node.mine(101, log_index=3)
+        await node.push_log(log)
+        await node.push_log({**log, 'removed': True})
+        await _until(lambda: subscriber.logs_received == 2)
+    
+    subscriber, recorder = _simulate(scenario)
+    
+    assert recorder.events == [(101, 3)]
+    assert recorder.removed == [(101, 3)]